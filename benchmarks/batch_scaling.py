@@ -0,0 +1,48 @@
+"""Scaling benchmark of the process-pool batch executor.
+
+Computes the same batch of charts with 1, 2, 4, ... worker processes up to the CPU count and
+reports the throughput and the speed-up over a single worker.
+
+Run it from the repository root:
+
+    python benchmarks/batch_scaling.py --charts 2000 --chunk-size 64
+"""
+
+import argparse
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+from ndastro_engine.batch import get_planets_positions_batch
+
+
+def main() -> None:
+    """Run the benchmark and print one line per worker count."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--charts", type=int, default=2000, help="number of charts in the batch")
+    parser.add_argument("--chunk-size", type=int, default=64, help="charts sent to a worker at a time")
+    parser.add_argument("--max-processes", type=int, default=os.cpu_count() or 1, help="largest number of workers")
+    arguments = parser.parse_args()
+
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    rows = [(12.97 + (index % 100) / 100, 77.59, start + timedelta(hours=index)) for index in range(arguments.charts)]
+
+    counts = [1]
+    while counts[-1] * 2 <= arguments.max_processes:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != arguments.max_processes:
+        counts.append(arguments.max_processes)
+
+    baseline = 0.0
+    print(f"{'processes':>9} {'seconds':>9} {'charts/s':>9} {'speed-up':>9}")  # noqa: T201
+    for processes in counts:
+        began = time.perf_counter()
+        for _ in get_planets_positions_batch(rows, processes=processes, chunk_size=arguments.chunk_size):
+            pass
+        elapsed = time.perf_counter() - began
+        baseline = baseline or elapsed
+        print(f"{processes:>9} {elapsed:>9.2f} {len(rows) / elapsed:>9.0f} {baseline / elapsed:>9.2f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
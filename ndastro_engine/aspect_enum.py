@@ -0,0 +1,52 @@
+"""Module to hold aspect enums."""
+
+from enum import IntEnum
+
+
+class Aspects(IntEnum):
+    """Enum to hold the aspects searched between planets, valued by the house aspected.
+
+    The conjunction is the 1st house and the opposition the 7th, which every planet aspects;
+    the others are the special (Vedic) drishti of Mars, Jupiter and Saturn.
+    """
+
+    CONJUNCTION = 1
+    THIRD_HOUSE = 3
+    FOURTH_HOUSE = 4
+    FIFTH_HOUSE = 5
+    OPPOSITION = 7
+    EIGHTH_HOUSE = 8
+    NINTH_HOUSE = 9
+    TENTH_HOUSE = 10
+
+    def __str__(self) -> str:
+        """Return name of the aspect.
+
+        Returns:
+            str: name of the aspect
+
+        """
+        return self.name
+
+    @property
+    def angle(self) -> float:
+        """Return the exact angle of the aspect, counted forward from the aspecting planet.
+
+        Returns:
+            float: 30° for every house after the first, e.g. 90° for the 4th house.
+
+        """
+        return (self.value - 1) * 30.0
+
+    @staticmethod
+    def to_list() -> list[str]:
+        """Convert enum to list of enum item name.
+
+        Returns:
+            list[str]: list of enum item name
+
+        """
+        return [el.name for el in Aspects]
+
+
+__all__ = ["Aspects"]
@@ -0,0 +1,180 @@
+"""Aspect and conjunction search between pairs of planets.
+
+This module finds the moments at which the longitude difference of two planets equals the
+angle of an aspect:
+- Conjunction and opposition between every pair of planets
+- The special Vedic drishti of Mars (4th, 8th), Jupiter (5th, 9th) and Saturn (3rd, 10th)
+
+All planets are evaluated once on a shared vectorized time grid. Every aspect of every pair
+is bracketed by a sign change of the wrapped difference (Δλ - angle), and all brackets are
+then refined together by bisection, each step evaluating every planet once over the
+midpoints of its brackets. Every crossing is reported, so the three passes of an aspect
+around a retrograde station give three events.
+"""
+
+from datetime import datetime
+from itertools import combinations
+from typing import TYPE_CHECKING, cast
+
+import numpy as np
+
+from ndastro_engine.constants import DEGREE_MAX
+from ndastro_engine.core import get_planet_position_series, ts
+from ndastro_engine.enums import Aspects, Planets
+from ndastro_engine.models import AspectEvent
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    from skyfield.timelib import Time
+
+# Grid step of the coarse scan. Two passes of the same aspect closer together than this (the
+# Moon never, slow planets only at a station) may be missed.
+ASPECT_STEP_DAYS = 0.5
+
+# Bisection steps refining each bracket: 0.5 day / 2**22 is below 0.02 second.
+ASPECT_REFINE_STEPS = 22
+
+# Houses aspected by every planet besides the 7th (opposition).
+SPECIAL_DRISHTI = {
+    Planets.MARS: (Aspects.FOURTH_HOUSE, Aspects.EIGHTH_HOUSE),
+    Planets.JUPITER: (Aspects.FIFTH_HOUSE, Aspects.NINTH_HOUSE),
+    Planets.SATURN: (Aspects.THIRD_HOUSE, Aspects.TENTH_HOUSE),
+}
+
+# Planets searched when no planet is given; the ascendant moves too fast for a shared grid.
+ASPECT_PLANETS = (
+    Planets.SUN,
+    Planets.MOON,
+    Planets.MARS,
+    Planets.MERCURY,
+    Planets.JUPITER,
+    Planets.VENUS,
+    Planets.SATURN,
+    Planets.RAHU,
+    Planets.KETHU,
+)
+
+
+def get_pair_aspects(planet_a: Planets, planet_b: Planets) -> list[tuple[Planets, Planets, Aspects]]:
+    """Return the aspects to search between two planets, in either direction.
+
+    Args:
+        planet_a (Planets): The first planet.
+        planet_b (Planets): The second planet.
+
+    Returns:
+        list[tuple[Planets, Planets, Aspects]]: The (aspecting planet, aspected planet, aspect) triples; the
+            conjunction and opposition are symmetric and listed once from `planet_a`.
+
+    """
+    if {planet_a, planet_b} == {Planets.RAHU, Planets.KETHU}:
+        # The nodes are always exactly opposite each other.
+        return []
+
+    aspects = [(planet_a, planet_b, Aspects.CONJUNCTION), (planet_a, planet_b, Aspects.OPPOSITION)]
+    aspects.extend((planet_a, planet_b, aspect) for aspect in SPECIAL_DRISHTI.get(planet_a, ()))
+    aspects.extend((planet_b, planet_a, aspect) for aspect in SPECIAL_DRISHTI.get(planet_b, ()))
+
+    return aspects
+
+
+def find_aspects(  # noqa: PLR0913
+    start_date: datetime,
+    end_date: datetime,
+    latitude: float,
+    longitude: float,
+    planets: list[Planets] | None = None,
+    *,
+    aspects: list[Aspects] | None = None,
+    step_days: float = ASPECT_STEP_DAYS,
+) -> list[AspectEvent]:
+    """Find the moments at which aspects between planets are exact within a date range.
+
+    Args:
+        start_date (datetime): The start of the search range.
+        end_date (datetime): The end of the search range.
+        latitude (float): The latitude of the observation location.
+        longitude (float): The longitude of the observation location.
+        planets (list[Planets] | None, optional): The planets whose pairs are searched. Defaults to ASPECT_PLANETS.
+        aspects (list[Aspects] | None, optional): The aspects to report. Defaults to every aspect.
+        step_days (float, optional): The coarse scan step. Defaults to ASPECT_STEP_DAYS.
+
+    Returns:
+        list[AspectEvent]: The exact aspects in chronological order.
+
+    Raises:
+        ValueError: If the ascendant or an empty planet is requested.
+
+    """
+    bodies = list(planets) if planets else list(ASPECT_PLANETS)
+    if Planets.ASCENDANT in bodies or Planets.EMPTY in bodies:
+        msg = "Aspects are only searched between planets, not the ascendant or an empty slot"
+        raise ValueError(msg)
+
+    targets = [
+        (bodies.index(aspecting), bodies.index(aspected), aspect)
+        for planet_a, planet_b in combinations(bodies, 2)
+        for aspecting, aspected, aspect in get_pair_aspects(planet_a, planet_b)
+        if aspects is None or aspect in aspects
+    ]
+    t0 = ts.utc(start_date)
+    t1 = ts.utc(end_date)
+    if not targets or t1.tt <= t0.tt:
+        return []
+
+    grid = np.linspace(t0.tt, t1.tt, max(2, int(np.ceil((t1.tt - t0.tt) / step_days)) + 1))
+    longitudes = np.array([_get_longitudes(planet, latitude, longitude, ts.tt_jd(grid)) for planet in bodies])
+
+    # Brackets of every target: the grid interval in which the wrapped difference changes sign.
+    bracket_targets: list[NDArray[np.int64]] = []
+    bracket_starts: list[NDArray[np.int64]] = []
+    for target, (aspecting, aspected, aspect) in enumerate(targets):
+        offset = _wrap(longitudes[aspected] - longitudes[aspecting] - aspect.angle)
+        # A jump of about 360° between two samples is the wrap at ±180°, not a root.
+        crossings = np.flatnonzero(((offset[:-1] >= 0) != (offset[1:] >= 0)) & (np.abs(np.diff(offset)) < DEGREE_MAX / 2))
+        bracket_targets.append(np.full(len(crossings), target, dtype=np.int64))
+        bracket_starts.append(crossings)
+
+    target_index = np.concatenate(bracket_targets)
+    start_index = np.concatenate(bracket_starts)
+    if len(target_index) == 0:
+        return []
+
+    aspecting_index = np.array([targets[target][0] for target in target_index.tolist()], dtype=np.int64)
+    aspected_index = np.array([targets[target][1] for target in target_index.tolist()], dtype=np.int64)
+    angles = np.array([targets[target][2].angle for target in target_index.tolist()])
+    low = grid[start_index]
+    high = grid[start_index + 1]
+    low_positive = _wrap(longitudes[aspected_index, start_index] - longitudes[aspecting_index, start_index] - angles) >= 0
+
+    for _ in range(ASPECT_REFINE_STEPS):
+        middle = (low + high) / 2
+        middle_longitudes = np.zeros((2, len(middle)))
+        for body, planet in enumerate(bodies):
+            sides = np.array([aspecting_index == body, aspected_index == body])
+            rows = np.flatnonzero(sides.any(axis=0))
+            if len(rows) > 0:
+                values = _get_longitudes(planet, latitude, longitude, ts.tt_jd(middle[rows]))
+                for side in range(2):
+                    middle_longitudes[side, rows[sides[side, rows]]] = values[sides[side, rows]]
+        same_side = (_wrap(middle_longitudes[1] - middle_longitudes[0] - angles) >= 0) == low_positive
+        low = np.where(same_side, middle, low)
+        high = np.where(same_side, high, middle)
+
+    times = cast("list[datetime]", ts.tt_jd((low + high) / 2).utc_datetime())
+    events = [
+        AspectEvent(time, bodies[int(aspecting)], bodies[int(aspected)], targets[int(target)][2])
+        for time, aspecting, aspected, target in zip(times, aspecting_index, aspected_index, target_index, strict=True)
+    ]
+
+    return sorted(events, key=lambda event: event.time)
+
+
+def _get_longitudes(planet: Planets, latitude: float, longitude: float, t: "Time") -> "NDArray[np.float64]":
+    """Return the tropical longitudes of a planet at every instant of `t`."""
+    return cast("NDArray[np.float64]", get_planet_position_series(planet, latitude, longitude, t)[:, 1])
+
+
+def _wrap(degrees: "NDArray[np.float64]") -> "NDArray[np.float64]":
+    """Wrap angles to the range [-180°, 180°)."""
+    return cast("NDArray[np.float64]", (degrees + DEGREE_MAX / 2) % DEGREE_MAX - DEGREE_MAX / 2)
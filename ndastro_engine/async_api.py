@@ -0,0 +1,295 @@
+"""Asyncio front end for chart computations.
+
+Chart calculations take from milliseconds (a chart) to seconds (a retrograde scan) of CPU time,
+so calling them from a coroutine blocks the event loop. `AsyncChartService` runs them in an
+executor (a thread pool by default, or any `concurrent.futures` executor such as a process pool):
+- identical requests in flight at the same time are computed once and share the result
+- at most `max_pending` computations are submitted to the executor; further requests wait for
+  a slot, so a burst of requests queues in the service instead of piling up in the executor
+- cancelling a request cancels its computation once no other request shares it; retrograde
+  scans run as one executor job per chunk of the range and stop at the next chunk
+"""
+
+import asyncio
+import os
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import NamedTuple, TypeVar, cast
+
+from skyfield.almanac import find_discrete
+
+from ndastro_engine.core import RetrogradeFunction, get_planet_position, get_planets_position, get_sunrise_sunset, ts
+from ndastro_engine.enums import Planets
+from ndastro_engine.models import PlanetPosition
+
+R = TypeVar("R")
+
+# Computations submitted to the executor at a time.
+DEFAULT_MAX_PENDING = 64
+
+# Length of the range searched by one executor job of a retrograde scan.
+DEFAULT_SEARCH_CHUNK = timedelta(days=366)
+
+
+class AsyncChartStats(NamedTuple):
+    """The counters of an async chart service.
+
+    Attributes:
+        pending (int): The number of computations submitted to the executor and not finished.
+        in_flight (int): The number of distinct requests being computed or waiting for a slot.
+        coalesced (int): The number of requests answered by sharing a computation already in flight.
+
+    """
+
+    pending: int
+    in_flight: int
+    coalesced: int
+
+
+class AsyncChartService:
+    """Run chart computations in an executor without blocking the event loop.
+
+    Use it as an async context manager, or call `close`, so an executor created by the service is shut down.
+
+    Attributes:
+        executor (Executor): The executor running the computations.
+        max_pending (int): The number of computations submitted to the executor at a time.
+        search_chunk (timedelta): The length of the range searched by one job of a retrograde scan.
+
+    """
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        search_chunk: timedelta = DEFAULT_SEARCH_CHUNK,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            executor (Executor | None, optional): The executor. Defaults to a thread pool with one thread per CPU,
+                owned and shut down by the service.
+            max_pending (int, optional): The computations submitted at a time. Defaults to DEFAULT_MAX_PENDING.
+            search_chunk (timedelta, optional): The range searched per job. Defaults to DEFAULT_SEARCH_CHUNK.
+
+        Raises:
+            ValueError: If max_pending or search_chunk is not positive.
+
+        """
+        if max_pending <= 0 or search_chunk <= timedelta(0):
+            msg = f"Expected a positive max_pending and search_chunk, got {max_pending} and {search_chunk}"
+            raise ValueError(msg)
+
+        self._owns_executor = executor is None
+        self.executor = executor if executor is not None else ThreadPoolExecutor(os.cpu_count() or 1)
+        self.max_pending = max_pending
+        self.search_chunk = search_chunk
+        self._slots = asyncio.Semaphore(max_pending)
+        self._in_flight: dict[Hashable, asyncio.Future[object]] = {}
+        self._waiters: dict[Hashable, int] = {}
+        self._pending = 0
+        self._coalesced = 0
+
+    async def __aenter__(self) -> "AsyncChartService":  # noqa: PYI034
+        """Return the service.
+
+        Returns:
+            AsyncChartService: The service.
+
+        """
+        return self
+
+    async def __aexit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: object) -> None:
+        """Shut down the executor if the service created it."""
+        self.close()
+
+    @property
+    def stats(self) -> AsyncChartStats:
+        """Return the pending, in-flight and coalesced counters.
+
+        Returns:
+            AsyncChartStats: The counters of the service.
+
+        """
+        return AsyncChartStats(self._pending, len(self._in_flight), self._coalesced)
+
+    def close(self) -> None:
+        """Shut down the executor if the service created it, without waiting for running computations."""
+        if self._owns_executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, function: Callable[..., R], *args: Hashable) -> R:
+        """Run a function in the executor, sharing the computation with identical calls in flight.
+
+        Args:
+            function (Callable[..., R]): The function; it must be picklable for a process pool.
+            *args (Hashable): The arguments, which with the function identify identical calls.
+
+        Returns:
+            R: The result of the function.
+
+        """
+        return await self._coalesce((function, args), lambda: self._execute(function, *args))
+
+    async def get_planet_position(self, planet: Planets, lat: float, lon: float, given_time: datetime) -> PlanetPosition:
+        """Return the tropical position of the planet, computed in the executor.
+
+        Args:
+            planet (Planets): The planet to calculate the position for.
+            lat (float): The latitude of the observer in decimal degrees.
+            lon (float): The longitude of the observer in decimal degrees.
+            given_time (datetime): The datetime of the observation in UTC.
+
+        Returns:
+            PlanetPosition: The position, as returned by `get_planet_position`.
+
+        """
+        return await self.run(get_planet_position, planet, lat, lon, given_time)
+
+    async def get_planets_position(self, planets: list[Planets], lat: float, lon: float, given_time: datetime) -> dict[Planets, PlanetPosition]:
+        """Return the tropical positions of the planets, computed in the executor.
+
+        Args:
+            planets (list[Planets]): The planets to calculate the positions for; an empty list means every planet.
+            lat (float): The latitude of the observer in decimal degrees.
+            lon (float): The longitude of the observer in decimal degrees.
+            given_time (datetime): The datetime of the observation in UTC.
+
+        Returns:
+            dict[Planets, PlanetPosition]: The positions, as returned by `get_planets_position`. Coalesced callers get a copy each.
+
+        """
+        positions = await self.run(_get_planets_position, tuple(planets), lat, lon, given_time)
+
+        return dict(positions)
+
+    async def get_sunrise_sunset(self, lat: float, lon: float, given_time: datetime) -> tuple[datetime, datetime]:
+        """Return the sunrise and sunset of the day, computed in the executor.
+
+        Args:
+            lat (float): The latitude of the location in decimal degrees.
+            lon (float): The longitude of the location in decimal degrees.
+            given_time (datetime): The date and time for which to calculate the sunrise and sunset times.
+
+        Returns:
+            tuple[datetime, datetime]: The sunrise and sunset, as returned by `get_sunrise_sunset`.
+
+        """
+        return await self.run(get_sunrise_sunset, lat, lon, given_time)
+
+    async def find_retrograde_periods(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        planet_name: str,
+        latitude: float,
+        longitude: float,
+    ) -> list[tuple[datetime, datetime]]:
+        """Return the retrograde periods of a planet, searched in the executor one chunk of the range at a time.
+
+        Cancelling the request stops the scan before its next chunk.
+
+        Args:
+            start_date (datetime): The start date of the period to check for retrograde motion.
+            end_date (datetime): The end date of the period to check for retrograde motion.
+            planet_name (str): The name of the planet to check for retrograde motion.
+            latitude (float): The latitude of the observation location.
+            longitude (float): The longitude of the observation location.
+
+        Returns:
+            list[tuple[datetime, datetime]]: The start and end of every retrograde period, as found by `find_retrograde_periods`.
+
+        """
+        key = ("find_retrograde_periods", start_date, end_date, planet_name, latitude, longitude)
+        periods = await self._coalesce(key, lambda: self._scan_retrograde(start_date, end_date, planet_name, latitude, longitude))
+
+        return list(periods)
+
+    async def _coalesce(self, key: Hashable, factory: Callable[[], Awaitable[R]]) -> R:
+        """Await the computation of a key, starting it unless an identical one is in flight."""
+        running = self._in_flight.get(key)
+        future: asyncio.Future[object]
+        if running is None:
+            future = cast("asyncio.Future[object]", asyncio.ensure_future(factory()))
+            self._in_flight[key] = future
+            self._waiters[key] = 0
+            future.add_done_callback(lambda _: self._forget(key, future))
+        else:
+            future = running
+            self._coalesced += 1
+
+        self._waiters[key] += 1
+        try:
+            return cast("R", await asyncio.shield(future))
+        except asyncio.CancelledError:
+            # The computation is cancelled with its last waiter; shared computations keep running. It is
+            # forgotten at once so a request arriving before its task finishes starts a new one.
+            if self._waiters.get(key) == 1 and self._in_flight.get(key) is future:
+                self._forget(key, future)
+                future.cancel()
+            raise
+        finally:
+            if key in self._waiters and self._in_flight.get(key) is future:
+                self._waiters[key] -= 1
+
+    def _forget(self, key: Hashable, future: "asyncio.Future[object]") -> None:
+        """Drop a finished computation so later calls compute afresh."""
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+            del self._waiters[key]
+
+    async def _execute(self, function: Callable[..., R], *args: object) -> R:
+        """Run a function in the executor once a slot is free."""
+        async with self._slots:
+            self._pending += 1
+            try:
+                return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+            finally:
+                self._pending -= 1
+
+    async def _scan_retrograde(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        planet_name: str,
+        latitude: float,
+        longitude: float,
+    ) -> list[tuple[datetime, datetime]]:
+        """Search the retrograde periods one chunk at a time, joining periods that cross chunk boundaries."""
+        periods: list[tuple[datetime, datetime]] = []
+        retro_start: datetime | None = None
+
+        chunk_start = start_date
+        while chunk_start < end_date:
+            chunk_end = min(chunk_start + self.search_chunk, end_date)
+            for changed_at, retro in await self._execute(_find_retrograde_changes, chunk_start, chunk_end, planet_name, latitude, longitude):
+                if retro and retro_start is None:
+                    retro_start = changed_at
+                elif not retro and retro_start is not None:
+                    periods.append((retro_start, changed_at))
+                    retro_start = None
+            chunk_start = chunk_end
+
+        if retro_start is not None:
+            periods.append((retro_start, cast("datetime", ts.utc(end_date).utc_datetime())))
+
+        return periods
+
+
+def _get_planets_position(planets: tuple[Planets, ...], lat: float, lon: float, given_time: datetime) -> dict[Planets, PlanetPosition]:
+    """Call `get_planets_position` with the planets passed as a hashable tuple."""
+    return get_planets_position(list(planets), lat, lon, given_time)
+
+
+def _find_retrograde_changes(
+    start_date: datetime,
+    end_date: datetime,
+    planet_name: str,
+    latitude: float,
+    longitude: float,
+) -> list[tuple[datetime, bool]]:
+    """Return the times at which a planet turns retrograde (True) or direct (False) within a range."""
+    times, values = find_discrete(ts.utc(start_date), ts.utc(end_date), RetrogradeFunction(planet_name, latitude, longitude))
+
+    return [(cast("datetime", t.utc_datetime()), bool(retro)) for t, retro in zip(times, values, strict=False)]
@@ -12,6 +12,9 @@ based on Julian centuries from the J2000.0 epoch.
 """
 
 import datetime
+from typing import TYPE_CHECKING, cast
+
+import numpy as np
 
 from ndastro_engine.constants import (
     AYANAMSA_AT_J2000,
@@ -21,7 +24,14 @@ from ndastro_engine.constants import (
     DEG_PER_JCENTURY,
     DEG_PER_SQUARE_JCENTURY,
 )
-from ndastro_engine.core import ts
+from ndastro_engine.core import get_planet_position_series, ts
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    from skyfield.timelib import Time
+
+    from ndastro_engine.engine import Engine
+    from ndastro_engine.enums import Planets
 
 
 def get_lahiri_ayanamsa(date: datetime.datetime) -> float:
@@ -37,6 +47,39 @@ def get_lahiri_ayanamsa(date: datetime.datetime) -> float:
     return c0 + c1 * b6 + c2 * (b6**2)
 
 
+def get_lahiri_ayanamsa_series(times: "Time") -> "NDArray[np.float64]":
+    """Calculate the Lahiri Ayanamsa for every instant of a vector time.
+
+    Unlike `get_lahiri_ayanamsa`, the Julian century term is taken from the exact instant
+    rather than from the start of the day, so the value is continuous in time.
+    """
+    b6 = (np.atleast_1d(times.tt) - _get_days_since_julian(CENTURY_19)) / _get_days_in_julian_century(CENTURY_20, CENTURY_21)
+
+    return cast("NDArray[np.float64]", AYANAMSA_AT_J2000 + DEG_PER_JCENTURY * b6 + DEG_PER_SQUARE_JCENTURY * (b6**2))
+
+
+def get_sidereal_longitude_series(planet: "Planets", lat: float, lon: float, times: "Time", engine: "Engine | None" = None) -> "NDArray[np.float64]":
+    """Calculate the Lahiri sidereal longitudes of a planet for every instant of a vector time.
+
+    Args:
+        planet (Planets): The planet to calculate the longitudes for.
+        lat (float): The latitude of the observer in decimal degrees.
+        lon (float): The longitude of the observer in decimal degrees.
+        times (Time): The skyfield time (scalar or array) of the observations.
+        engine (Engine | None, optional): The engine computing the tropical longitudes. Defaults to the default engine.
+
+    Returns:
+        NDArray[np.float64]: The sidereal longitudes in degrees, within 0-360.
+
+    """
+    if engine is not None:
+        tropical = engine.get_planet_position_series(planet, lat, lon, times)[:, 1]
+    else:
+        tropical = get_planet_position_series(planet, lat, lon, times)[:, 1]
+
+    return cast("NDArray[np.float64]", (tropical - get_lahiri_ayanamsa_series(times)) % 360)
+
+
 def get_raman_ayanamsa(date: datetime.datetime) -> float:
     """Calculate the Raman Ayanamsa for a given date."""
     # Constants in the Raman Ayanamsa formula
@@ -262,6 +305,28 @@ def get_true_pusya_ayanamsa(date: datetime.datetime) -> float:
     return c0 + c1 * b6 + c2 * (b6**2)
 
 
+# The ayanamsa functions by system name, e.g. for storing the system of a computed chart.
+AYANAMSA_FUNCTIONS = {
+    "lahiri": get_lahiri_ayanamsa,
+    "raman": get_raman_ayanamsa,
+    "kali": get_kali_ayanamsa,
+    "krishnamurti_new": get_krishnamurti_new_ayanamsa,
+    "krishnamurti_old": get_krishnamurti_old_ayanamsa,
+    "fagan_bradley": get_fagan_bradley_ayanamsa,
+    "janma": get_janma_ayanamsa,
+    "true": get_true_ayanamsa,
+    "madhava": get_madhava_ayanamsa,
+    "vishnu": get_vishnu_ayanamsa,
+    "yukteshwar": get_yukteshwar_ayanamsa,
+    "suryasiddhanta": get_suryasiddhanta_ayanamsa,
+    "aryabhatta": get_aryabhatta_ayanamsa,
+    "ushashasi": get_ushashasi_ayanamsa,
+    "true_citra": get_true_citra_ayanamsa,
+    "true_revati": get_true_revati_ayanamsa,
+    "true_pusya": get_true_pusya_ayanamsa,
+}
+
+
 def _calculate_b6(date: tuple[int, int, int]) -> float:
     """Calculate B6 parameter for Julian Date."""
     # Calculate Julian Date using Skyfield
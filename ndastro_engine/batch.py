@@ -0,0 +1,308 @@
+"""Process-pool execution of chart batches.
+
+Chart calculations are CPU-bound, so large batches are spread over worker processes. Every
+worker needs the ephemeris kernel. It is loaded in the parent as a side effect of importing
+`ndastro_engine.config`, which this module imports through the engine, and the workers are
+forked so they share the loaded kernel copy-on-write instead of reopening it:
+- BatchExecutor: a pool running a function over chunks of input rows, streaming the results
+  back in input order
+- get_planets_positions_batch: `get_planets_position` over many (lat, lon, time) rows
+- find_discrete_parallel: Skyfield's `find_discrete` with the search range split into chunks
+  searched by the workers
+- find_retrograde_periods_parallel: `find_retrograde_periods` over a long range
+
+A forked worker inherits the locks of the parent in the state they were in, so a lock held by
+another thread at that moment (the refresh thread of `LiveChartProvider`, the thread pool of
+`AsyncChartService`, the caches of an `Engine`) stays held in the worker and can deadlock it.
+Start the executor before starting any threads, or pass `start_method="forkserver"` or
+`"spawn"`. Where fork is unavailable (Windows), the pool falls back to spawned workers. Workers
+that are not forked import the engine, which loads the kernel, and need a picklable function.
+"""
+
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import datetime
+from itertools import islice, pairwise
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
+
+import numpy as np
+from skyfield.almanac import find_discrete
+
+from ndastro_engine.core import RetrogradeFunction, get_planets_position, ts
+from ndastro_engine.engine import RETROGRADE_SEARCH_STEP_DAYS, get_retrograde_periods
+from ndastro_engine.enums import Planets
+from ndastro_engine.models import PlanetPosition
+
+if TYPE_CHECKING:
+    from multiprocessing.pool import Pool
+
+    from numpy.typing import NDArray
+    from skyfield.timelib import Time
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Rows sent to a worker at a time; large enough that the per-task overhead is negligible.
+DEFAULT_CHUNK_SIZE = 64
+
+# Search steps (`step_days`) handed to a worker at a time; a year of the weekly retrograde search.
+DEFAULT_SEARCH_CHUNK_SAMPLES = 52
+
+# The function run by a worker process, set once per worker by the pool initializer.
+_worker_function: Callable[..., object] | None = None
+
+
+class BatchExecutor(Generic[T, R]):
+    """Run a function over many rows in a pool of worker processes.
+
+    Use it as a context manager so the workers are stopped once the batch is done. With fork,
+    enter it before the process starts any threads.
+
+    Attributes:
+        function (Callable[[T], R]): The function applied to every row; it must be picklable unless the workers are forked.
+        processes (int): The number of worker processes.
+        chunk_size (int): The number of rows sent to a worker at a time.
+        start_method (str | None): The multiprocessing start method, or None for fork where available.
+
+    """
+
+    def __init__(
+        self,
+        function: Callable[[T], R],
+        processes: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        start_method: str | None = None,
+    ) -> None:
+        """Initialize the executor; the workers are started on entering the context.
+
+        Args:
+            function (Callable[[T], R]): The function applied to every row.
+            processes (int | None, optional): The number of workers. Defaults to the number of CPUs.
+            chunk_size (int, optional): The rows per task. Defaults to DEFAULT_CHUNK_SIZE.
+            start_method (str | None, optional): The multiprocessing start method, e.g. "forkserver" when the process
+                already runs threads. Defaults to fork where available, else the platform default.
+
+        Raises:
+            ValueError: If the number of processes or the chunk size is not positive.
+
+        """
+        self.function = function
+        self.processes = processes if processes is not None else os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.start_method = start_method
+        if self.processes <= 0 or self.chunk_size <= 0:
+            msg = f"Expected a positive number of processes and chunk size, got {self.processes} and {self.chunk_size}"
+            raise ValueError(msg)
+        self._pool: Pool | None = None
+
+    def __enter__(self) -> "BatchExecutor[T, R]":
+        """Start the worker processes.
+
+        Returns:
+            BatchExecutor[T, R]: The executor.
+
+        """
+        method = self.start_method
+        if method is None and "fork" in multiprocessing.get_all_start_methods():
+            method = "fork"
+        self._pool = multiprocessing.get_context(method).Pool(self.processes, initializer=_set_worker_function, initargs=(self.function,))
+
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: object) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def map(self, rows: Iterable[T]) -> Iterator[R]:
+        """Apply the function to every row, yielding the results in row order as they become available.
+
+        Rows are read lazily, a chunk at a time, so the input may be a generator larger than memory.
+
+        Args:
+            rows (Iterable[T]): The input rows.
+
+        Yields:
+            R: The result of every row, in input order.
+
+        Raises:
+            RuntimeError: If the executor is used outside its context.
+
+        """
+        if self._pool is None:
+            msg = "BatchExecutor.map must be called inside a `with BatchExecutor(...)` block"
+            raise RuntimeError(msg)
+
+        for results in self._pool.imap(_run_chunk, _chunk(rows, self.chunk_size)):
+            yield from results
+
+
+def get_planets_positions_batch(
+    rows: Iterable[tuple[float, float, datetime]],
+    planets: Sequence[Planets] = (),
+    processes: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[dict[Planets, PlanetPosition]]:
+    """Compute the positions of the planets for many charts in worker processes.
+
+    Args:
+        rows (Iterable[tuple[float, float, datetime]]): The latitude, longitude and UTC time of every chart.
+        planets (Sequence[Planets], optional): The planets to compute. Defaults to every planet.
+        processes (int | None, optional): The number of workers. Defaults to the number of CPUs.
+        chunk_size (int, optional): The charts per task. Defaults to DEFAULT_CHUNK_SIZE.
+
+    Yields:
+        dict[Planets, PlanetPosition]: The positions of every chart, as returned by `get_planets_position`, in input order.
+
+    """
+    with BatchExecutor(_ChartRow(tuple(planets)), processes, chunk_size) as executor:
+        yield from executor.map(rows)
+
+
+def find_discrete_parallel(
+    start_time: "Time",
+    end_time: "Time",
+    function: Callable[["Time"], "NDArray[np.generic]"],
+    processes: int | None = None,
+    chunk_samples: int = DEFAULT_SEARCH_CHUNK_SAMPLES,
+) -> tuple["Time", "NDArray[np.generic]"]:
+    """Find the times at which a discrete function changes value, searching chunks of the range in worker processes.
+
+    The range is split into chunks of `chunk_samples` steps of the function's `step_days`, each
+    searched with Skyfield's `find_discrete`. Consecutive chunks share their boundary, so a change
+    falls in exactly one chunk, and the result holds the changes of `find_discrete(start_time, end_time, function)`
+    refined to the same precision.
+
+    Args:
+        start_time (Time): The start of the search.
+        end_time (Time): The end of the search.
+        function (Callable[[Time], NDArray[np.generic]]): The discrete function, with a `step_days` attribute; it must be
+            picklable when fork is unavailable.
+        processes (int | None, optional): The number of workers. Defaults to the number of CPUs.
+        chunk_samples (int, optional): The steps searched per task. Defaults to DEFAULT_SEARCH_CHUNK_SAMPLES.
+
+    Returns:
+        tuple[Time, NDArray[np.generic]]: The times of the changes and the values the function changed to.
+
+    Raises:
+        ValueError: If the start is not before the end or chunk_samples is not positive.
+
+    """
+    jd0 = cast("float", start_time.tt)
+    jd1 = cast("float", end_time.tt)
+    if jd0 >= jd1 or chunk_samples <= 0:
+        msg = f"Expected a start before the end and a positive chunk_samples, got {start_time}, {end_time} and {chunk_samples}"
+        raise ValueError(msg)
+
+    bounds = [*np.arange(jd0, jd1, chunk_samples * function.step_days).tolist(), jd1]  # type: ignore[attr-defined]
+    chunks = pairwise(bounds)
+
+    with BatchExecutor(_DiscreteSearch(function), processes, chunk_size=1) as executor:
+        results = list(executor.map(chunks))
+
+    return ts.tt_jd(np.concatenate([ends for ends, _ in results])), np.concatenate([values for _, values in results])
+
+
+def find_retrograde_periods_parallel(  # noqa: PLR0913
+    start_date: datetime,
+    end_date: datetime,
+    planet_name: str,
+    latitude: float,
+    longitude: float,
+    *,
+    processes: int | None = None,
+    chunk_samples: int = DEFAULT_SEARCH_CHUNK_SAMPLES,
+) -> list[tuple[datetime, datetime]]:
+    """Calculate the retrograde periods of a planet like `find_retrograde_periods`, searching in worker processes.
+
+    Periods crossing a chunk boundary are joined, so the periods are those of the serial search.
+
+    Args:
+        start_date (datetime): The start date of the period to check for retrograde motion.
+        end_date (datetime): The end date of the period to check for retrograde motion.
+        planet_name (str): The name of the planet to check for retrograde motion.
+        latitude (float): The latitude of the observation location.
+        longitude (float): The longitude of the observation location.
+        processes (int | None, optional): The number of workers. Defaults to the number of CPUs.
+        chunk_samples (int, optional): The weekly search steps per task. Defaults to DEFAULT_SEARCH_CHUNK_SAMPLES.
+
+    Returns:
+        list[tuple[datetime, datetime]]: A list of tuples, each containing the start and end datetime of a retrograde period.
+
+    """
+    t1 = ts.utc(end_date)
+    times, values = find_discrete_parallel(
+        ts.utc(start_date), t1, _RetrogradeSearch(planet_name, latitude, longitude), processes=processes, chunk_samples=chunk_samples
+    )
+
+    return get_retrograde_periods(times, cast("NDArray[np.bool_]", values), t1)
+
+
+class _ChartRow:
+    """The picklable function computing the positions of one (lat, lon, time) row."""
+
+    def __init__(self, planets: tuple[Planets, ...]) -> None:
+        """Keep the planets to compute."""
+        self.planets = planets
+
+    def __call__(self, row: tuple[float, float, datetime]) -> dict[Planets, PlanetPosition]:
+        """Compute the positions of one chart."""
+        lat, lon, given_time = row
+
+        return get_planets_position(list(self.planets), lat, lon, given_time)
+
+
+class _DiscreteSearch:
+    """The picklable function searching one chunk of a find_discrete_parallel range."""
+
+    def __init__(self, function: Callable[["Time"], "NDArray[np.generic]"]) -> None:
+        """Keep the discrete function."""
+        self.function = function
+
+    def __call__(self, bounds: tuple[float, float]) -> tuple["NDArray[np.float64]", "NDArray[np.generic]"]:
+        """Return the TT Julian dates of the changes between the TT bounds of the chunk and the values changed to."""
+        times, values = find_discrete(ts.tt_jd(bounds[0]), ts.tt_jd(bounds[1]), self.function)
+
+        return cast("NDArray[np.float64]", times.tt), values
+
+
+class _RetrogradeSearch:
+    """A picklable `RetrogradeFunction`, built in the worker on the default engine of the worker."""
+
+    step_days = RETROGRADE_SEARCH_STEP_DAYS
+
+    def __init__(self, planet_name: str, latitude: float, longitude: float) -> None:
+        """Keep the planet and location."""
+        self.planet_name = planet_name
+        self.latitude = latitude
+        self.longitude = longitude
+
+    def __call__(self, t: "Time") -> "NDArray[np.bool_]":
+        """Return whether the planet is retrograde at every instant of `t`."""
+        return cast("NDArray[np.bool_]", RetrogradeFunction(self.planet_name, self.latitude, self.longitude)(t))
+
+
+def _set_worker_function(function: Callable[..., object]) -> None:
+    """Keep the function of the batch in the worker process."""
+    global _worker_function  # noqa: PLW0603
+    _worker_function = function
+
+
+def _run_chunk(rows: list[Any]) -> list[Any]:
+    """Apply the worker function to a chunk of rows."""
+    function = _worker_function
+    if function is None:
+        msg = "Worker function is not set"
+        raise RuntimeError(msg)
+
+    return [function(row) for row in rows]
+
+
+def _chunk(rows: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Split rows into lists of at most `size` rows."""
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
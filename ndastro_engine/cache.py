@@ -0,0 +1,326 @@
+"""Opt-in memoisation of chart calculations.
+
+Many requests repeat the same chart (shared birth records, retries, page reloads). This module
+provides a bounded, thread-safe LRU cache that the core position functions consult once it is
+enabled:
+- ChartCache: the LRU store, bounded by entry count and/or estimated bytes
+- enable_chart_cache, disable_chart_cache, get_chart_cache_stats: the switch and the counters; the
+  switch sets the `chart_cache` of the default engine behind `ndastro_engine.core`, which caches
+  `get_planet_position` (and so `get_planets_position` planet by planet), `get_ascendent_position`
+  and `get_lunar_node_positions`
+- chart_cached: a decorator memoising any other chart function in the same cache
+
+The cache is disabled by default. When enabled, the time of a call is rounded to
+`time_quantum` and its latitude and longitude to `precision` decimals, and the result is
+computed at those rounded values, so every call in the same bucket returns exactly the same
+value whichever came first. Calls with an array time (a Skyfield `Time` vector converted with
+`utc_datetime()`) are not cached.
+"""
+
+import functools
+import inspect
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from datetime import datetime, timedelta, timezone
+from typing import Any, NamedTuple, ParamSpec, TypeVar, cast
+
+from ndastro_engine.engine import get_default_engine
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Default bucket width of the time of a call; a second moves the Moon by about 0.5".
+DEFAULT_TIME_QUANTUM = timedelta(seconds=1)
+
+# Default decimals kept of the latitude and longitude; 4 decimals are about 11 m.
+DEFAULT_PRECISION = 4
+
+DEFAULT_MAX_ENTRIES = 100_000
+
+# Parameter names holding the time and the location in the cached functions.
+_TIME_PARAMETERS = ("given_time",)
+_LOCATION_PARAMETERS = ("lat", "lon")
+
+
+class ChartCacheStats(NamedTuple):
+    """The counters of a chart cache.
+
+    Attributes:
+        hits (int): The number of calls answered from the cache.
+        misses (int): The number of calls computed and stored.
+        evictions (int): The number of entries dropped to stay within the bounds.
+        entries (int): The number of entries held.
+        size_bytes (int): The estimated size of the entries held.
+
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of calls answered from the cache.
+
+        Returns:
+            float: hits / (hits + misses), or 0.0 before the first call.
+
+        """
+        calls = self.hits + self.misses
+
+        return self.hits / calls if calls else 0.0
+
+
+class ChartCache:
+    """A thread-safe LRU cache bounded by entry count and/or estimated bytes.
+
+    Attributes:
+        max_entries (int | None): The largest number of entries held, or None for no count bound.
+        max_bytes (int | None): The largest estimated size of the entries held, or None for no size bound.
+        time_quantum (timedelta): The bucket width of the time of a call.
+        precision (int): The decimals kept of the latitude and longitude of a call.
+
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = DEFAULT_MAX_ENTRIES,
+        max_bytes: int | None = None,
+        time_quantum: timedelta = DEFAULT_TIME_QUANTUM,
+        precision: int = DEFAULT_PRECISION,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries (int | None, optional): The entry count bound. Defaults to DEFAULT_MAX_ENTRIES.
+            max_bytes (int | None, optional): The size bound in bytes. Defaults to no size bound.
+            time_quantum (timedelta, optional): The bucket width of the time. Defaults to DEFAULT_TIME_QUANTUM.
+            precision (int, optional): The decimals kept of the location. Defaults to DEFAULT_PRECISION.
+
+        Raises:
+            ValueError: If neither bound is set, a bound is not positive or the time quantum is not positive.
+
+        """
+        if max_entries is None and max_bytes is None:
+            msg = "A chart cache needs max_entries, max_bytes or both"
+            raise ValueError(msg)
+        if (max_entries is not None and max_entries <= 0) or (max_bytes is not None and max_bytes <= 0) or time_quantum <= timedelta(0):
+            msg = f"Expected positive bounds and time quantum, got {max_entries}, {max_bytes} and {time_quantum}"
+            raise ValueError(msg)
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.time_quantum = time_quantum
+        self.precision = precision
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> ChartCacheStats:
+        """Return the counters of the cache.
+
+        Returns:
+            ChartCacheStats: The hits, misses and evictions since the last clear, and the current contents.
+
+        """
+        with self._lock:
+            return ChartCacheStats(self._hits, self._misses, self._evictions, len(self._entries), self._size)
+
+    def quantise_time(self, given_time: datetime) -> datetime:
+        """Round a time to the nearest multiple of the time quantum.
+
+        Args:
+            given_time (datetime): The timezone-aware time of a call.
+
+        Returns:
+            datetime: The UTC time of the bucket.
+
+        Raises:
+            ValueError: If the time is naive, as it would be read as local time.
+
+        """
+        if given_time.tzinfo is None or given_time.utcoffset() is None:
+            msg = f"Expected a timezone-aware time, got {given_time}"
+            raise ValueError(msg)
+
+        quantum = self.time_quantum.total_seconds()
+
+        return datetime.fromtimestamp(round(given_time.timestamp() / quantum) * quantum, tz=timezone.utc)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], R]) -> R:
+        """Return the value stored under a key, computing and storing it on a miss.
+
+        The value is computed outside the lock, so two threads missing the same key at once
+        may both compute it; the second store replaces the first with an equal value.
+
+        Args:
+            key (Hashable): The key.
+            compute (Callable[[], R]): The calculation of the value.
+
+        Returns:
+            R: The stored or computed value.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cast("R", entry[0])
+            self._misses += 1
+
+        value = compute()
+        self.put(key, value)
+
+        return value
+
+    def put(self, key: Hashable, value: object) -> None:
+        """Store a value, evicting the least recently used entries beyond the bounds.
+
+        Args:
+            key (Hashable): The key.
+            value (object): The value.
+
+        """
+        size = _get_size(value)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self._size > self.max_bytes)
+            ):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= evicted
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+def enable_chart_cache(
+    max_entries: int | None = DEFAULT_MAX_ENTRIES,
+    max_bytes: int | None = None,
+    time_quantum: timedelta = DEFAULT_TIME_QUANTUM,
+    precision: int = DEFAULT_PRECISION,
+) -> ChartCache:
+    """Enable memoisation of the core position functions, replacing any cache already enabled.
+
+    The cache becomes the `chart_cache` of the default engine.
+
+    Args:
+        max_entries (int | None, optional): The entry count bound. Defaults to DEFAULT_MAX_ENTRIES.
+        max_bytes (int | None, optional): The size bound in bytes. Defaults to no size bound.
+        time_quantum (timedelta, optional): The bucket width of the time. Defaults to DEFAULT_TIME_QUANTUM.
+        precision (int, optional): The decimals kept of the location. Defaults to DEFAULT_PRECISION.
+
+    Returns:
+        ChartCache: The new, empty cache.
+
+    """
+    cache = ChartCache(max_entries, max_bytes, time_quantum, precision)
+    get_default_engine().chart_cache = cache
+
+    return cache
+
+
+def disable_chart_cache() -> None:
+    """Disable memoisation and drop the cache."""
+    get_default_engine().chart_cache = None
+
+
+def get_chart_cache() -> ChartCache | None:
+    """Return the enabled cache.
+
+    Returns:
+        ChartCache | None: The cache, or None while memoisation is disabled.
+
+    """
+    return get_default_engine().chart_cache
+
+
+def get_chart_cache_stats() -> ChartCacheStats | None:
+    """Return the counters of the enabled cache.
+
+    Returns:
+        ChartCacheStats | None: The counters, or None while memoisation is disabled.
+
+    """
+    cache = get_chart_cache()
+
+    return cache.stats if cache is not None else None
+
+
+def chart_cached(function: Callable[P, R]) -> Callable[P, R]:
+    """Memoise a chart function in the enabled cache, the `chart_cache` of the default engine.
+
+    The key is the function name and its arguments, with the time quantised and the location
+    rounded; lists are keyed as tuples. While no cache is enabled, or when the time is not a
+    datetime (e.g. an array of times), the function is called directly.
+
+    Args:
+        function (Callable[P, R]): The function, taking its time as `given_time` and its location as `lat` and `lon`.
+
+    Returns:
+        Callable[P, R]: The memoised function.
+
+    Raises:
+        ValueError: If a cache is enabled and the time of a call is naive.
+
+    """
+    signature = inspect.signature(function)
+
+    @functools.wraps(function)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        cache = get_chart_cache()
+        if cache is None:
+            return function(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        times = [name for name in _TIME_PARAMETERS if name in bound.arguments]
+        if not all(isinstance(bound.arguments[name], datetime) for name in times):
+            return function(*args, **kwargs)
+
+        for name in times:
+            bound.arguments[name] = cache.quantise_time(bound.arguments[name])
+        for name in _LOCATION_PARAMETERS:
+            if name in bound.arguments:
+                bound.arguments[name] = round(float(bound.arguments[name]), cache.precision)
+
+        key = (function.__qualname__, *(tuple(value) if isinstance(value, list) else value for value in bound.arguments.values()))
+
+        value = cache.get_or_compute(key, lambda: function(*bound.args, **bound.kwargs))
+
+        # Cached dictionaries are copied so callers cannot alter the cached entry.
+        return cast("R", dict(value)) if isinstance(value, dict) else value
+
+    return wrapper
+
+
+def _get_size(value: object) -> int:
+    """Estimate the memory held by a cached value and the containers and floats inside it."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_get_size(key) + _get_size(item) for key, item in value.items())
+    elif isinstance(value, (tuple, list)):
+        size += sum(_get_size(item) for item in value)
+
+    return size
@@ -0,0 +1,249 @@
+"""Columnar container of planet positions over many instants.
+
+`get_planets_position` returns a dict of `PlanetPosition` tuples, one tuple and six float
+objects per planet and chart. ChartFrame keeps the same numbers in a single float64 array of
+shape (times, planets, fields), about 48 bytes per planet and chart:
+- time slices (`frame[10:20]`, `between`), `planet` and `field` are views, not copies
+- `to_dicts` converts back to the form returned by `get_planets_position`
+- `save` and `load` persist a frame as `.npz` (times, planets and positions arrays) or as a
+  `.npy` record array with one field per planet, which `load` can memory-map
+
+An `EphemerisChunk` of `ndastro_engine.stream` has the same layout, so `ChartFrame(*chunk)`
+wraps a streamed chunk without copying it.
+"""
+
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Literal, cast
+
+import numpy as np
+from numpy.lib import recfunctions
+from numpy.typing import NDArray
+
+from ndastro_engine.enums import Planets
+from ndastro_engine.models import PlanetPosition
+from ndastro_engine.utils import to_epoch_seconds
+
+# Version of the on-disk `.npz` layout written by ChartFrame.save.
+CHART_FRAME_VERSION = 1
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class ChartFrame:
+    """Planet positions of many instants, backed by one NumPy array.
+
+    Attributes:
+        times (NDArray[np.datetime64]): The UTC instants, as datetime64[ms], one per row.
+        planets (tuple[Planets, ...]): The planets, one per column.
+        positions (NDArray[np.float64]): The positions, of shape (len(times), len(planets), 6), whose last axis follows
+            the field order of `PlanetPosition`.
+
+    """
+
+    def __init__(self, times: NDArray[np.datetime64], planets: Sequence[Planets], positions: NDArray[np.float64]) -> None:
+        """Wrap the arrays of a frame without copying them.
+
+        Args:
+            times (NDArray[np.datetime64]): The UTC instants.
+            planets (Sequence[Planets]): The planets of the second axis of `positions`.
+            positions (NDArray[np.float64]): The positions, of shape (len(times), len(planets), 6).
+
+        Raises:
+            ValueError: If the shape of the positions does not match the times and planets.
+
+        """
+        self.times = np.asarray(times).astype("datetime64[ms]", copy=False)
+        self.planets = tuple(planets)
+        self.positions = positions
+        if positions.shape != self.shape:
+            msg = f"Expected positions of shape {self.shape}, got {positions.shape}"
+            raise ValueError(msg)
+
+        self._columns = {planet: column for column, planet in enumerate(self.planets)}
+
+    @classmethod
+    def from_positions(cls, times: Sequence[datetime], charts: Sequence[Mapping[Planets, PlanetPosition]]) -> "ChartFrame":
+        """Build a frame from charts in the form returned by `get_planets_position`.
+
+        Args:
+            times (Sequence[datetime]): The UTC instant of every chart.
+            charts (Sequence[Mapping[Planets, PlanetPosition]]): The charts, all holding the planets of the first one.
+
+        Returns:
+            ChartFrame: The frame of the charts, with the planets in the order of the first chart.
+
+        """
+        planets = tuple(charts[0]) if len(charts) > 0 else ()
+        positions = np.array([[chart[planet] for planet in planets] for chart in charts], dtype=np.float64)
+
+        return cls(_to_datetime64(times), planets, positions.reshape(len(charts), len(planets), len(PlanetPosition._fields)))
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """Return the number of instants, planets and fields.
+
+        Returns:
+            tuple[int, int, int]: The shape of `positions`.
+
+        """
+        return (len(self.times), len(self.planets), len(PlanetPosition._fields))
+
+    def __len__(self) -> int:
+        """Return the number of instants.
+
+        Returns:
+            int: The number of rows.
+
+        """
+        return len(self.times)
+
+    def __getitem__(self, rows: int | slice) -> "ChartFrame":
+        """Return the frame of a row or a slice of rows, sharing the arrays of this frame.
+
+        Args:
+            rows (int | slice): The row index or slice.
+
+        Returns:
+            ChartFrame: A frame viewing the selected rows.
+
+        """
+        if isinstance(rows, int):
+            rows = slice(rows, rows + 1 if rows != -1 else None)
+
+        return ChartFrame(self.times[rows], self.planets, self.positions[rows])
+
+    def between(self, start: datetime, end: datetime) -> "ChartFrame":
+        """Return the frame of the instants from `start` up to, but excluding, `end`, sharing the arrays of this frame.
+
+        Args:
+            start (datetime): The first instant.
+            end (datetime): The instant after the last one.
+
+        Returns:
+            ChartFrame: A frame viewing the rows within the range; the times must be in chronological order.
+
+        """
+        first, last = np.searchsorted(self.times, _to_datetime64([start, end]))
+
+        return self[int(first) : int(last)]
+
+    def planet(self, planet: Planets) -> NDArray[np.float64]:
+        """Return the positions of a planet at every instant, as a view.
+
+        Args:
+            planet (Planets): The planet.
+
+        Returns:
+            NDArray[np.float64]: The positions, of shape (len(times), 6).
+
+        Raises:
+            KeyError: If the frame does not hold the planet.
+
+        """
+        return self.positions[:, self._columns[planet], :]
+
+    def field(self, name: str) -> NDArray[np.float64]:
+        """Return one field of every planet at every instant, as a view.
+
+        Args:
+            name (str): A field of `PlanetPosition`, e.g. "longitude".
+
+        Returns:
+            NDArray[np.float64]: The values, of shape (len(times), len(planets)).
+
+        Raises:
+            ValueError: If the name is not a field of `PlanetPosition`.
+
+        """
+        return self.positions[:, :, PlanetPosition._fields.index(name)]
+
+    def to_datetimes(self) -> list[datetime]:
+        """Return the instants as timezone-aware UTC datetimes.
+
+        Returns:
+            list[datetime]: The instant of every row.
+
+        """
+        return [_EPOCH + timedelta(milliseconds=int(milliseconds)) for milliseconds in self.times.astype(np.int64)]
+
+    def to_dicts(self) -> list[dict[Planets, PlanetPosition]]:
+        """Convert the frame to the form returned by `get_planets_position`.
+
+        Returns:
+            list[dict[Planets, PlanetPosition]]: One chart per row.
+
+        """
+        return [{planet: PlanetPosition(*position) for planet, position in zip(self.planets, row, strict=True)} for row in self.positions.tolist()]
+
+    def save(self, path: str | Path) -> None:
+        """Write the frame to a `.npy` record array with one field per planet, or else to an `.npz` file.
+
+        Args:
+            path (str | Path): The destination file; its suffix selects the format.
+
+        """
+        path = Path(path)
+        if path.suffix == ".npy":
+            np.save(path, self._to_records())
+            return
+
+        with path.open("wb") as file:
+            np.savez(
+                file,
+                header=np.array([CHART_FRAME_VERSION], dtype=np.int64),
+                times=self.times,
+                planets=np.array([planet.name for planet in self.planets], dtype=np.str_),
+                positions=self.positions,
+            )
+
+    @classmethod
+    def load(cls, path: str | Path, mmap_mode: Literal["r", "r+", "c"] | None = None) -> "ChartFrame":
+        """Read a frame written by `save`.
+
+        Args:
+            path (str | Path): The source file.
+            mmap_mode (Literal["r", "r+", "c"] | None, optional): Memory-map a `.npy` file with this mode instead of
+                reading it, so the frame views the file. Defaults to reading the file.
+
+        Returns:
+            ChartFrame: The loaded frame.
+
+        Raises:
+            ValueError: If an `.npz` file was written with an unsupported layout version.
+
+        """
+        path = Path(path)
+        if path.suffix == ".npy":
+            return cls._from_records(np.load(path, mmap_mode=mmap_mode))
+
+        with np.load(path) as data:
+            version = int(data["header"][0])
+            if version != CHART_FRAME_VERSION:
+                msg = f"Unsupported chart frame version {version}, expected {CHART_FRAME_VERSION}"
+                raise ValueError(msg)
+
+            return cls(data["times"], [Planets[name] for name in data["planets"]], data["positions"])
+
+    def _to_records(self) -> NDArray[np.void]:
+        """Return the frame as a record array with a `time` field and a (6,) field per planet."""
+        records = np.empty(len(self), dtype=[("time", "datetime64[ms]")] + [(planet.name, np.float64, (6,)) for planet in self.planets])
+        records["time"] = self.times
+        for planet in self.planets:
+            records[planet.name] = self.planet(planet)
+
+        return records
+
+    @classmethod
+    def _from_records(cls, records: NDArray[np.void]) -> "ChartFrame":
+        """Build a frame viewing a record array written by `_to_records`."""
+        names = cast("tuple[str, ...]", records.dtype.names)[1:]
+        positions = recfunctions.structured_to_unstructured(records[list(names)], copy=False)
+
+        return cls(records["time"], [Planets[name] for name in names], positions.reshape(len(records), len(names), 6))
+
+
+def _to_datetime64(times: Sequence[datetime]) -> NDArray[np.datetime64]:
+    """Convert timezone-aware datetimes to UTC datetime64[ms] values."""
+    return np.round(to_epoch_seconds(times) * 1000).astype(np.int64).astype("datetime64[ms]")
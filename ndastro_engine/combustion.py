@@ -0,0 +1,189 @@
+"""Combustion (asta) intervals of the planets relative to the Sun.
+
+A planet is combust while its angular distance from the Sun is below a planet-specific orb;
+Mercury and Venus have a smaller orb while retrograde. This module finds the combustion
+intervals of all planets over a date range at once:
+- CombustionFunction: a discrete function packing the combustion state of every planet in one bitmask
+- find_combustion_intervals: the intervals of every planet, as start/end arrays
+- is_combust: a lookup of the precomputed intervals at any number of instants
+
+The Sun and the planets are evaluated together on one vectorized time grid, and every change
+of any planet is refined by a single `find_discrete` search.
+"""
+
+from datetime import datetime
+from typing import TYPE_CHECKING, NamedTuple, cast
+
+import numpy as np
+from numpy.typing import NDArray
+from skyfield.almanac import find_discrete
+
+from ndastro_engine.constants import DEGREE_MAX
+from ndastro_engine.core import get_planet_position_series, ts
+from ndastro_engine.enums import Planets
+from ndastro_engine.utils import to_epoch_seconds
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from skyfield.timelib import Time
+
+# Largest distance from the Sun, in degrees, at which a planet is combust.
+COMBUSTION_ORBS = {
+    Planets.MOON: 12.0,
+    Planets.MARS: 17.0,
+    Planets.MERCURY: 14.0,
+    Planets.JUPITER: 11.0,
+    Planets.VENUS: 10.0,
+    Planets.SATURN: 15.0,
+}
+
+# Orbs replacing COMBUSTION_ORBS while the planet is retrograde.
+RETROGRADE_COMBUSTION_ORBS = {
+    Planets.MERCURY: 12.0,
+    Planets.VENUS: 8.0,
+}
+
+# The Moon stays combust for about two days, so a quarter-day grid brackets every change.
+COMBUSTION_STEP_DAYS = 0.25
+
+
+class CombustionIntervals(NamedTuple):
+    """The combustion intervals of a planet, in chronological order.
+
+    Attributes:
+        start (NDArray[np.datetime64]): The UTC start of every interval.
+        end (NDArray[np.datetime64]): The UTC end of every interval.
+
+    """
+
+    start: NDArray[np.datetime64]
+    end: NDArray[np.datetime64]
+
+
+class CombustionFunction:
+    """A discrete function whose bit i is set while the i-th planet is combust.
+
+    Attributes:
+        planets (tuple[Planets, ...]): The planets, in bit order.
+        latitude (float): The latitude of the observer's location.
+        longitude (float): The longitude of the observer's location.
+        step_days (float): The grid step used by `find_discrete` for the coarse scan.
+
+    """
+
+    def __init__(self, planets: "Sequence[Planets]", latitude: float, longitude: float, step_days: float = COMBUSTION_STEP_DAYS) -> None:
+        """Initialize a new instance of the combustion function.
+
+        Args:
+            planets (Sequence[Planets]): The planets, in bit order.
+            latitude (float): The latitude coordinate.
+            longitude (float): The longitude coordinate.
+            step_days (float, optional): The coarse scan step. Defaults to COMBUSTION_STEP_DAYS.
+
+        """
+        self.planets = tuple(planets)
+        self.latitude = latitude
+        self.longitude = longitude
+        self.step_days = step_days
+
+    def __call__(self, t: "Time") -> "NDArray[np.int64]":
+        """Return the combustion bitmask at every instant of `t`.
+
+        Args:
+            t (Time): The (vector) time at which to evaluate the Sun and planets.
+
+        Returns:
+            NDArray[np.int64]: The sum of 2**i over the combust planets.
+
+        """
+        sun = get_planet_position_series(Planets.SUN, self.latitude, self.longitude, t)[:, 1]
+        mask = np.zeros(len(sun), dtype=np.int64)
+        for bit, planet in enumerate(self.planets):
+            position = get_planet_position_series(planet, self.latitude, self.longitude, t)
+            distance = np.abs((position[:, 1] - sun + DEGREE_MAX / 2) % DEGREE_MAX - DEGREE_MAX / 2)
+            orb = np.where(position[:, 4] < 0, RETROGRADE_COMBUSTION_ORBS.get(planet, COMBUSTION_ORBS[planet]), COMBUSTION_ORBS[planet])
+            mask |= (distance < orb).astype(np.int64) << bit
+
+        return mask
+
+
+def find_combustion_intervals(
+    start_date: datetime,
+    end_date: datetime,
+    latitude: float,
+    longitude: float,
+    planets: list[Planets] | None = None,
+) -> dict[Planets, CombustionIntervals]:
+    """Find the combustion intervals of several planets within a date range.
+
+    Args:
+        start_date (datetime): The start of the search range.
+        end_date (datetime): The end of the search range.
+        latitude (float): The latitude of the observation location.
+        longitude (float): The longitude of the observation location.
+        planets (list[Planets] | None, optional): The planets to search. Defaults to every planet of COMBUSTION_ORBS.
+
+    Returns:
+        dict[Planets, CombustionIntervals]: The intervals of every planet, clipped to the range.
+
+    Raises:
+        ValueError: If a planet without a combustion orb is requested.
+
+    """
+    bodies = list(planets) if planets else list(COMBUSTION_ORBS)
+    unknown = [planet.name for planet in bodies if planet not in COMBUSTION_ORBS]
+    if unknown:
+        msg = f"No combustion orb for {', '.join(unknown)}"
+        raise ValueError(msg)
+
+    function = CombustionFunction(bodies, latitude, longitude)
+    t0 = ts.utc(start_date)
+    t1 = ts.utc(end_date)
+
+    times, masks = find_discrete(t0, t1, function)
+
+    starts: list[list[datetime]] = [[] for _ in bodies]
+    ends: list[list[datetime]] = [[] for _ in bodies]
+    previous = int(function(t0)[0])
+    for bit in range(len(bodies)):
+        if previous >> bit & 1:
+            starts[bit].append(start_date)
+    for t, mask in zip(cast("list[Time]", times), masks, strict=True):
+        current = int(mask)
+        changed = previous ^ current
+        for bit in range(len(bodies)):
+            if changed >> bit & 1:
+                (starts if current >> bit & 1 else ends)[bit].append(cast("datetime", t.utc_datetime()))
+        previous = current
+    for bit in range(len(bodies)):
+        if previous >> bit & 1:
+            ends[bit].append(end_date)
+
+    return {planet: CombustionIntervals(_to_datetime64(starts[bit]), _to_datetime64(ends[bit])) for bit, planet in enumerate(bodies)}
+
+
+def is_combust(intervals: CombustionIntervals, times: "Sequence[datetime] | NDArray[np.datetime64]") -> "NDArray[np.bool_]":
+    """Return whether a planet is combust at many instants, from its precomputed intervals.
+
+    Args:
+        intervals (CombustionIntervals): The intervals returned by `find_combustion_intervals`.
+        times (Sequence[datetime] | NDArray[np.datetime64]): The instants to look up, within the searched range.
+
+    Returns:
+        NDArray[np.bool_]: True at the instants that fall inside an interval.
+
+    """
+    seconds = to_epoch_seconds(times)
+    starts = to_epoch_seconds(intervals.start)
+    if len(starts) == 0:
+        return np.zeros(len(seconds), dtype=np.bool_)
+
+    position = np.searchsorted(starts, seconds, side="right") - 1
+
+    return cast("NDArray[np.bool_]", (position >= 0) & (seconds < to_epoch_seconds(intervals.end)[np.maximum(position, 0)]))
+
+
+def _to_datetime64(times: list[datetime]) -> "NDArray[np.datetime64]":
+    """Convert timezone-aware datetimes to a UTC `datetime64[ms]` array."""
+    return np.array(to_epoch_seconds(times) * 1000, dtype=np.int64).astype("datetime64[ms]")
@@ -13,6 +13,8 @@ from skyfield.jpllib import SpiceKernel
 
 from ndastro_engine.utils import get_app_data_dir
 
+DEFAULT_EPHEMERIS_FILE = "de440t.bsp"
+
 
 class ConfigurationManager:
     """Manages application configuration settings.
@@ -26,8 +28,13 @@ class ConfigurationManager:
 
     """
 
-    def __init__(self) -> None:
-        """Initialize the ConfigurationManager with default settings."""
+    def __init__(self, ephemeris_file: str = DEFAULT_EPHEMERIS_FILE) -> None:
+        """Initialize the ConfigurationManager with default settings.
+
+        Args:
+            ephemeris_file (str, optional): The JPL kernel to load, downloaded on first use. Defaults to DEFAULT_EPHEMERIS_FILE.
+
+        """
         try:
             data_dir = get_app_data_dir("ndastro")
             Path(data_dir).mkdir(parents=True, exist_ok=True)
@@ -38,7 +45,6 @@ class ConfigurationManager:
             self.ts = loader.timescale()
 
             # Try to load ephemeris, delete and retry if corrupted
-            ephemeris_file = "de440t.bsp"
             try:
                 self.eph: SpiceKernel = cast("SpiceKernel", loader(ephemeris_file))
             except (struct.error, ValueError):
@@ -14,6 +14,24 @@ AYANAMSA_AT_J2000 = 22.460148  # Ayanamsa value at J2000.0 epoch
 DEG_PER_JCENTURY = 1.396042  # Linear term (degrees per Julian century)
 DEG_PER_SQUARE_JCENTURY = 0.000308  # Quadratic term (degrees per square Julian century)
 
+# Length of a dasha year in days (Julian year).
+DASHA_YEAR_DAYS = 365.25
+
 CENTURY_19 = 1900
 CENTURY_20 = 2000
 CENTURY_21 = 2100
+
+# Upper bounds of the apparent daily motion (degrees per day) of each body, keyed by planet code.
+# Used to pick a search step short enough that no division of the zodiac is skipped.
+MAX_DAILY_MOTION = {
+    "ascendant": 720.0,
+    "sun": 1.03,
+    "moon": 15.4,
+    "mars barycenter": 0.8,
+    "mercury": 2.2,
+    "jupiter barycenter": 0.25,
+    "venus": 1.27,
+    "saturn barycenter": 0.13,
+    "rahu": 1.0,
+    "kethu": 1.0,
+}
@@ -0,0 +1,264 @@
+"""Vimshottari dasha calculations over arrays of births.
+
+This module computes Vimshottari dasha periods from the sidereal longitude of the Moon at
+birth. Everything is vectorized over births, so millions of people are handled with a few
+array operations instead of per-person object trees:
+- get_dasha_table: columnar mahadasha, antardasha and pratyantardasha periods
+- get_current_dasha: the periods in force at a date for every birth
+
+Times are exchanged as NumPy `datetime64[s]` (UTC) arrays; `datetime` sequences are accepted
+as input.
+"""
+
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ndastro_engine.constants import DASHA_YEAR_DAYS, DEGREE_MAX
+from ndastro_engine.enums import Natchaththirams, Planets
+from ndastro_engine.utils import to_epoch_seconds
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import datetime
+
+# The dasha lords in sequence: the owners of the first nine natchaththirams.
+DASHA_LORDS = tuple(Natchaththirams(number).owner for number in range(1, 10))
+
+# Length of the mahadasha of every lord, in years.
+DASHA_YEARS = {
+    Planets.KETHU: 7,
+    Planets.VENUS: 20,
+    Planets.SUN: 6,
+    Planets.MOON: 10,
+    Planets.MARS: 7,
+    Planets.RAHU: 18,
+    Planets.JUPITER: 16,
+    Planets.SATURN: 19,
+    Planets.MERCURY: 17,
+}
+
+# Length of the whole Vimshottari cycle, in years.
+DASHA_CYCLE_YEARS = sum(DASHA_YEARS.values())
+
+# Highest level of sub-periods: mahadasha (1), antardasha (2), pratyantardasha (3).
+MAX_DASHA_LEVEL = 3
+
+_LORD_CODES = np.array([lord.value for lord in DASHA_LORDS], dtype=np.int8)
+_LORD_YEARS = np.array([DASHA_YEARS[lord] for lord in DASHA_LORDS], dtype=np.float64)
+_SECONDS_PER_YEAR = DASHA_YEAR_DAYS * 86400
+
+
+class DashaTable(NamedTuple):
+    """A columnar table of dasha periods, one row per period.
+
+    Attributes:
+        person (NDArray[np.int64]): The index of the birth the period belongs to.
+        level (NDArray[np.int8]): 1 for mahadasha, 2 for antardasha, 3 for pratyantardasha.
+        mahadasha (NDArray[np.int8]): The `Planets` value of the mahadasha lord.
+        antardasha (NDArray[np.int8]): The `Planets` value of the antardasha lord, or `Planets.EMPTY` at level 1.
+        pratyantardasha (NDArray[np.int8]): The `Planets` value of the pratyantardasha lord, or `Planets.EMPTY` below level 3.
+        start (NDArray[np.datetime64]): The UTC start of the period, never before the birth.
+        end (NDArray[np.datetime64]): The UTC end of the period.
+
+    """
+
+    person: NDArray[np.int64]
+    level: NDArray[np.int8]
+    mahadasha: NDArray[np.int8]
+    antardasha: NDArray[np.int8]
+    pratyantardasha: NDArray[np.int8]
+    start: NDArray[np.datetime64]
+    end: NDArray[np.datetime64]
+
+
+class CurrentDasha(NamedTuple):
+    """The dasha periods in force at a date, one element per birth.
+
+    Attributes:
+        mahadasha (NDArray[np.int8]): The `Planets` value of the mahadasha lord.
+        antardasha (NDArray[np.int8]): The `Planets` value of the antardasha lord.
+        pratyantardasha (NDArray[np.int8]): The `Planets` value of the pratyantardasha lord.
+        mahadasha_end (NDArray[np.datetime64]): The UTC end of the mahadasha.
+        antardasha_end (NDArray[np.datetime64]): The UTC end of the antardasha.
+        pratyantardasha_end (NDArray[np.datetime64]): The UTC end of the pratyantardasha.
+
+    """
+
+    mahadasha: NDArray[np.int8]
+    antardasha: NDArray[np.int8]
+    pratyantardasha: NDArray[np.int8]
+    mahadasha_end: NDArray[np.datetime64]
+    antardasha_end: NDArray[np.datetime64]
+    pratyantardasha_end: NDArray[np.datetime64]
+
+
+def get_dasha_balance(moon_longitudes: ArrayLike) -> tuple[NDArray[np.int8], NDArray[np.float64]]:
+    """Return the mahadasha lord at birth and the years of it still to run.
+
+    Args:
+        moon_longitudes (ArrayLike): The sidereal longitudes of the Moon at birth, in degrees.
+
+    Returns:
+        tuple[NDArray[np.int8], NDArray[np.float64]]: The `Planets` value of the first mahadasha lord and its balance in years.
+
+    """
+    first, elapsed = _get_cycle_position(moon_longitudes)
+
+    return _LORD_CODES[first], _LORD_YEARS[first] - elapsed
+
+
+def get_dasha_table(
+    moon_longitudes: ArrayLike,
+    birth_times: "Sequence[datetime] | NDArray[np.datetime64]",
+    levels: int = MAX_DASHA_LEVEL,
+) -> DashaTable:
+    """Build the dasha periods of a whole Vimshottari cycle for every birth.
+
+    Each birth gets 9 mahadashas, 81 antardashas and 729 pratyantardashas (up to `levels`),
+    starting from the mahadasha running at birth. Periods that ended before the birth are
+    dropped and the first period of each level starts at the birth.
+
+    Args:
+        moon_longitudes (ArrayLike): The sidereal longitudes of the Moon at birth, in degrees.
+        birth_times (Sequence[datetime] | NDArray[np.datetime64]): The UTC times of birth.
+        levels (int, optional): The deepest level of sub-periods to include, 1 to 3. Defaults to 3.
+
+    Returns:
+        DashaTable: The periods, ordered by birth, then level, then start.
+
+    Raises:
+        ValueError: If `levels` is not between 1 and 3.
+
+    """
+    if not 1 <= levels <= MAX_DASHA_LEVEL:
+        msg = f"levels must be between 1 and {MAX_DASHA_LEVEL}, got {levels}"
+        raise ValueError(msg)
+
+    first, elapsed = _get_cycle_position(moon_longitudes)
+    births = to_epoch_seconds(birth_times)
+    cycle_start = births - elapsed * _SECONDS_PER_YEAR
+
+    columns: list[tuple[NDArray[np.integer], ...]] = []
+    for level in range(1, levels + 1):
+        offsets, durations, lords = _LEVEL_TEMPLATES[level - 1]
+        starts = cycle_start[:, None] + offsets[first] * _SECONDS_PER_YEAR
+        ends = starts + durations[first] * _SECONDS_PER_YEAR
+        keep = ends > births[:, None]
+        person = np.broadcast_to(np.arange(len(births))[:, None], keep.shape)[keep]
+        level_lords = lords[first][keep]
+        columns.append(
+            (
+                person,
+                np.full(len(person), level),
+                *(level_lords[:, position] for position in range(MAX_DASHA_LEVEL)),
+                np.maximum(starts, births[:, None])[keep].astype(np.int64),
+                ends[keep].astype(np.int64),
+            )
+        )
+
+    person, levels_column, mahadasha, antardasha, pratyantardasha, start, end = (np.concatenate(column) for column in zip(*columns, strict=True))
+    order = np.lexsort((start, levels_column, person))
+
+    return DashaTable(
+        person[order].astype(np.int64),
+        levels_column[order].astype(np.int8),
+        mahadasha[order].astype(np.int8),
+        antardasha[order].astype(np.int8),
+        pratyantardasha[order].astype(np.int8),
+        start[order].astype("datetime64[s]"),
+        end[order].astype("datetime64[s]"),
+    )
+
+
+def get_current_dasha(
+    moon_longitudes: ArrayLike,
+    birth_times: "Sequence[datetime] | NDArray[np.datetime64]",
+    at: "datetime",
+) -> CurrentDasha:
+    """Return the mahadasha, antardasha and pratyantardasha in force at a date for every birth.
+
+    Args:
+        moon_longitudes (ArrayLike): The sidereal longitudes of the Moon at birth, in degrees.
+        birth_times (Sequence[datetime] | NDArray[np.datetime64]): The UTC times of birth.
+        at (datetime): The timezone-aware date to evaluate.
+
+    Returns:
+        CurrentDasha: The lords and end times of the three running periods.
+
+    """
+    first, elapsed = _get_cycle_position(moon_longitudes)
+    births = to_epoch_seconds(birth_times)
+    cycle_seconds = DASHA_CYCLE_YEARS * _SECONDS_PER_YEAR
+    cycle_start = births - elapsed * _SECONDS_PER_YEAR
+    # Move to the 120-year cycle containing the date, then count years from its first mahadasha.
+    cycle_start += np.floor((at.timestamp() - cycle_start) / cycle_seconds) * cycle_seconds
+    years = (at.timestamp() - cycle_start) / _SECONDS_PER_YEAR
+
+    lords: list[NDArray[np.int8]] = []
+    ends: list[NDArray[np.datetime64]] = []
+    lord = first
+    period_years = np.full(len(first), float(DASHA_CYCLE_YEARS))
+    period_start = np.zeros(len(first))
+    for _ in range(MAX_DASHA_LEVEL):
+        # Sub-periods of a period start with its own lord and are proportional to the lord's years.
+        sequence = (lord[:, None] + np.arange(9)) % 9
+        durations = period_years[:, None] * _LORD_YEARS[sequence] / DASHA_CYCLE_YEARS
+        bounds = period_start[:, None] + np.cumsum(durations, axis=1)
+        position = np.minimum((years[:, None] >= bounds).sum(axis=1), 8)
+        rows = np.arange(len(first))
+
+        lord = sequence[rows, position]
+        period_years = durations[rows, position]
+        period_start = bounds[rows, position] - period_years
+        lords.append(_LORD_CODES[lord])
+        ends.append((cycle_start + bounds[rows, position] * _SECONDS_PER_YEAR).astype(np.int64).astype("datetime64[s]"))
+
+    return CurrentDasha(lords[0], lords[1], lords[2], ends[0], ends[1], ends[2])
+
+
+def _get_cycle_position(moon_longitudes: ArrayLike) -> tuple[NDArray[np.int64], NDArray[np.float64]]:
+    """Return the index in `DASHA_LORDS` of the lord at birth and the years of it already elapsed."""
+    position = (np.atleast_1d(np.asarray(moon_longitudes, dtype=np.float64)) % DEGREE_MAX) / (DEGREE_MAX / 27)
+    natchaththiram = np.floor(position).astype(np.int64)
+    first = natchaththiram % 9
+
+    return first, (position - natchaththiram) * _LORD_YEARS[first]
+
+
+def _build_level_templates() -> list[tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.int8]]]:
+    """Precompute the periods of one cycle for each of the nine possible first lords.
+
+    Returns, per level, the offsets from the start of the cycle and the durations (in years),
+    both of shape (9, 9**level), and the `Planets` values of the lords at every level, of shape
+    (9, 9**level, 3) padded with `Planets.EMPTY`.
+    """
+    templates = []
+    for level in range(1, MAX_DASHA_LEVEL + 1):
+        offsets = np.zeros((9, 9**level))
+        durations = np.zeros((9, 9**level))
+        lords = np.full((9, 9**level, MAX_DASHA_LEVEL), Planets.EMPTY.value, dtype=np.int8)
+        for first in range(9):
+            periods: list[tuple[float, float, list[int]]] = [(0.0, float(DASHA_CYCLE_YEARS), [])]
+            for depth in range(level):
+                expanded: list[tuple[float, float, list[int]]] = []
+                for start, length, chain in periods:
+                    lord = first if depth == 0 else chain[-1]
+                    sub_start = start
+                    for step in range(9):
+                        sub_lord = (lord + step) % 9
+                        sub_length = length * _LORD_YEARS[sub_lord] / DASHA_CYCLE_YEARS
+                        expanded.append((sub_start, sub_length, [*chain, sub_lord]))
+                        sub_start += sub_length
+                periods = expanded
+            for index, (start, length, chain) in enumerate(periods):
+                offsets[first, index] = start
+                durations[first, index] = length
+                lords[first, index, : len(chain)] = _LORD_CODES[chain]
+        templates.append((offsets, durations, lords))
+
+    return templates
+
+
+_LEVEL_TEMPLATES = _build_level_templates()
@@ -0,0 +1,208 @@
+"""Binary and JSON encodings of chart frames for service responses.
+
+Converting `PlanetPosition` results to JSON field by field costs a Python call per number.
+This module encodes a whole `ChartFrame` at once:
+- encode_chart_frame / decode_chart_frame: a fixed-layout little-endian binary format with a
+  versioned header, whose arrays are decoded by `np.frombuffer` without per-field Python work
+- encode_chart_frame_json / decode_chart_frame_json: a columnar JSON document built from the
+  arrays with `tolist`, and ChartFrameJSONEncoder to embed frames in larger JSON payloads
+
+Binary layout (version 1, little-endian, every section starting on an 8-byte boundary):
+
+| Offset | Type                              | Content                                   |
+|--------|-----------------------------------|-------------------------------------------|
+| 0      | 4 bytes                           | magic `NDCF`                              |
+| 4      | uint16                            | format version                            |
+| 6      | uint16                            | header size in bytes                      |
+| 8      | uint32                            | number of times `n`                       |
+| 12     | uint16                            | number of planets `p`                     |
+| 14     | 2 bytes                           | reserved                                  |
+| 16     | int8[p], padded to 8 bytes        | `Planets` values                          |
+| ...    | int64[n]                          | UTC times in milliseconds since the epoch |
+| ...    | float64[n, p, 6]                  | positions in `PlanetPosition` field order |
+
+Decoders skip header bytes beyond the fields they know, so later versions can extend the header.
+"""
+
+import json
+import struct
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import cast
+
+import numpy as np
+
+from ndastro_engine.chart_frame import ChartFrame
+from ndastro_engine.enums import Planets
+from ndastro_engine.models import PlanetPosition
+
+# Version of the binary and JSON layouts written by this module.
+CHART_ENCODING_VERSION = 1
+
+CHART_MAGIC = b"NDCF"
+
+_HEADER = struct.Struct("<4sHHIH2x")
+_FIELDS = len(PlanetPosition._fields)
+
+
+class ChartFrameJSONEncoder(json.JSONEncoder):
+    """A JSON encoder writing chart frames as the columnar documents of `encode_chart_frame_json`.
+
+    Example:
+        ```python
+        json.dumps({"chart": frame}, cls=ChartFrameJSONEncoder)
+        ```
+
+    """
+
+    def default(self, o: object) -> object:
+        """Return the columnar document of a chart frame, or defer to the base encoder.
+
+        Args:
+            o (object): The object to encode.
+
+        Returns:
+            object: A JSON-serialisable object.
+
+        """
+        if isinstance(o, ChartFrame):
+            return _to_document(o)
+
+        return super().default(o)
+
+
+def encode_chart_frame(frame: ChartFrame) -> bytes:
+    """Encode a chart frame in the binary format.
+
+    Args:
+        frame (ChartFrame): The frame to encode.
+
+    Returns:
+        bytes: The header followed by the planet, time and position arrays.
+
+    """
+    times, planets, _ = frame.shape
+    planet_codes = np.array(frame.planets, dtype=np.int8).tobytes()
+
+    return b"".join(
+        (
+            _HEADER.pack(CHART_MAGIC, CHART_ENCODING_VERSION, _HEADER.size, times, planets),
+            planet_codes.ljust(_align(len(planet_codes)), b"\0"),
+            frame.times.astype("<i8").tobytes(),
+            np.ascontiguousarray(frame.positions, dtype="<f8").tobytes(),
+        ),
+    )
+
+
+def decode_chart_frame(data: bytes | bytearray | memoryview) -> ChartFrame:
+    """Decode a chart frame written by `encode_chart_frame`.
+
+    The arrays of the frame are read-only views of `data`.
+
+    Args:
+        data (bytes | bytearray | memoryview): The encoded frame.
+
+    Returns:
+        ChartFrame: The decoded frame.
+
+    Raises:
+        ValueError: If the data is not an encoded frame, is truncated, or has an unsupported version.
+
+    """
+    if len(data) < _HEADER.size:
+        msg = f"Expected at least {_HEADER.size} bytes of chart frame header, got {len(data)}"
+        raise ValueError(msg)
+
+    magic, version, header_size, times, planets = _HEADER.unpack_from(data)
+    if magic != CHART_MAGIC:
+        msg = f"Not an encoded chart frame, found magic {magic!r}"
+        raise ValueError(msg)
+    if version != CHART_ENCODING_VERSION or header_size < _HEADER.size:
+        msg = f"Unsupported chart frame version {version}, expected {CHART_ENCODING_VERSION}"
+        raise ValueError(msg)
+
+    times_offset = header_size + _align(planets)
+    positions_offset = times_offset + 8 * times
+    if len(data) != positions_offset + 8 * times * planets * _FIELDS:
+        msg = f"Expected {positions_offset + 8 * times * planets * _FIELDS} bytes for {times} times and {planets} planets, got {len(data)}"
+        raise ValueError(msg)
+
+    return ChartFrame(
+        np.frombuffer(data, dtype="<i8", count=times, offset=times_offset).view("datetime64[ms]"),
+        [Planets(code) for code in np.frombuffer(data, dtype=np.int8, count=planets, offset=header_size).tolist()],
+        np.frombuffer(data, dtype="<f8", count=times * planets * _FIELDS, offset=positions_offset).reshape(times, planets, _FIELDS),
+    )
+
+
+def encode_charts(times: Sequence[datetime], charts: Sequence[Mapping[Planets, PlanetPosition]]) -> bytes:
+    """Encode charts in the form returned by `get_planets_position` in the binary format.
+
+    Args:
+        times (Sequence[datetime]): The UTC instant of every chart.
+        charts (Sequence[Mapping[Planets, PlanetPosition]]): The charts, all holding the planets of the first one.
+
+    Returns:
+        bytes: The encoded frame of the charts.
+
+    """
+    return encode_chart_frame(ChartFrame.from_positions(times, charts))
+
+
+def encode_chart_frame_json(frame: ChartFrame, decimals: int | None = None) -> str:
+    """Encode a chart frame as a columnar JSON document.
+
+    The document holds `version`, `times` (UTC milliseconds since the epoch), `planets` (names),
+    `fields` (the `PlanetPosition` field names) and `positions` (nested as times, planets, fields).
+
+    Args:
+        frame (ChartFrame): The frame to encode.
+        decimals (int | None, optional): Round the positions to this many decimals to shorten the document.
+            Defaults to full precision.
+
+    Returns:
+        str: The JSON document.
+
+    """
+    return json.dumps(_to_document(frame, decimals), separators=(",", ":"))
+
+
+def decode_chart_frame_json(text: str | bytes) -> ChartFrame:
+    """Decode a chart frame written by `encode_chart_frame_json`.
+
+    Args:
+        text (str | bytes): The JSON document.
+
+    Returns:
+        ChartFrame: The decoded frame.
+
+    Raises:
+        ValueError: If the document has an unsupported version.
+
+    """
+    document = json.loads(text)
+    if document["version"] != CHART_ENCODING_VERSION:
+        msg = f"Unsupported chart frame version {document['version']}, expected {CHART_ENCODING_VERSION}"
+        raise ValueError(msg)
+
+    planets = [Planets[name] for name in document["planets"]]
+    positions = np.array(document["positions"], dtype=np.float64).reshape(len(document["times"]), len(planets), _FIELDS)
+
+    return ChartFrame(np.array(document["times"], dtype=np.int64).view("datetime64[ms]"), planets, positions)
+
+
+def _to_document(frame: ChartFrame, decimals: int | None = None) -> dict[str, object]:
+    """Return the columnar JSON document of a frame, converting each array with a single `tolist`."""
+    positions = frame.positions if decimals is None else np.round(frame.positions, decimals)
+
+    return {
+        "version": CHART_ENCODING_VERSION,
+        "times": frame.times.astype(np.int64).tolist(),
+        "planets": [planet.name for planet in frame.planets],
+        "fields": list(PlanetPosition._fields),
+        "positions": cast("list[object]", positions.tolist()),
+    }
+
+
+def _align(size: int) -> int:
+    """Round a byte count up to a multiple of 8."""
+    return (size + 7) // 8 * 8
@@ -0,0 +1,589 @@
+"""Calculation engine owning its timescale, ephemeris kernel, caches and settings.
+
+The functions of `ndastro_engine.core` run on one engine built from the kernel loaded by
+`ndastro_engine.config`. Creating more `Engine` instances lets one process host several
+configurations side by side (different kernels, observer elevations or cache precisions) and
+lets threads each use an instance of their own.
+
+An engine holds:
+- the Skyfield timescale and ephemeris kernel
+- an LRU cache of `Observer` objects per location
+- an optional `ChartCache` memoising the position calculations; on the default engine it is set
+  by `ndastro_engine.cache.enable_chart_cache`
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from datetime import datetime, timedelta
+from math import atan2, degrees, radians, tan
+from typing import TYPE_CHECKING, NamedTuple, TypeVar, cast
+
+import numpy as np
+from skyfield.almanac import cos, find_discrete, sin, sunrise_sunset
+from skyfield.data.spice import inertial_frames
+from skyfield.elementslib import osculating_elements_of
+from skyfield.framelib import ecliptic_frame
+from skyfield.nutationlib import mean_obliquity
+from skyfield.timelib import Time, Timescale
+from skyfield.toposlib import wgs84
+
+from ndastro_engine.config import ConfigurationManager, eph, ts
+from ndastro_engine.enums import Planets
+from ndastro_engine.models import PlanetPosition
+from ndastro_engine.utils import normalize_degree
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    from skyfield.jpllib import SpiceKernel
+    from skyfield.positionlib import Barycentric
+    from skyfield.toposlib import GeographicPosition
+    from skyfield.units import Angle, Rate
+    from skyfield.vectorlib import VectorSum
+
+    from ndastro_engine.cache import ChartCache
+
+R = TypeVar("R")
+
+# Number of observers kept by an engine; enough for the few hundred cities most requests come from.
+OBSERVER_CACHE_SIZE = 1024
+
+# Default observer elevation in meters (approximately 3000 feet).
+DEFAULT_ELEVATION = 914.0
+
+# Grid step of the retrograde searches; every retrograde period of the planets lasts more than a week.
+RETROGRADE_SEARCH_STEP_DAYS = 7
+
+
+class Observer(NamedTuple):
+    """A named tuple holding the Skyfield objects of an observer location, built once and reused.
+
+    Attributes:
+        latitude (float): The latitude of the observer in decimal degrees.
+        longitude (float): The longitude of the observer in decimal degrees.
+        elevation (float): The elevation of the observer in meters.
+        topos (GeographicPosition): The location on the WGS84 ellipsoid.
+        vector (VectorSum): The location relative to the solar system barycenter (earth + topos).
+        sunrise_function (Callable[[Time], NDArray]): The sunrise/sunset discrete function of the location.
+
+    """
+
+    latitude: float
+    longitude: float
+    elevation: float
+    topos: "GeographicPosition"
+    vector: "VectorSum"
+    sunrise_function: "Callable[[Time], NDArray[np.bool_]]"
+
+
+class Engine:
+    """A calculation engine owning a timescale, an ephemeris kernel, caches and settings.
+
+    An engine can be shared by threads: its caches are locked and the Skyfield objects are
+    only read. Threads needing fully separate kernels create an engine each with
+    `Engine(ephemeris_file=...)`.
+
+    Attributes:
+        ts (Timescale): The timescale used to convert datetimes.
+        eph (SpiceKernel): The ephemeris kernel.
+        elevation (float): The observer elevation in meters used by the position calculations.
+        chart_cache (ChartCache | None): The cache memoising positions, or None to always compute.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        timescale: Timescale | None = None,
+        kernel: "SpiceKernel | None" = None,
+        *,
+        ephemeris_file: str | None = None,
+        elevation: float = DEFAULT_ELEVATION,
+        observer_cache_size: int = OBSERVER_CACHE_SIZE,
+        chart_cache: "ChartCache | None" = None,
+    ) -> None:
+        """Initialize an engine.
+
+        Args:
+            timescale (Timescale | None, optional): The timescale. Defaults to the one of `ndastro_engine.config`.
+            kernel (SpiceKernel | None, optional): The ephemeris kernel. Defaults to the one of `ndastro_engine.config`.
+            ephemeris_file (str | None, optional): A JPL kernel file to load for this engine instead, e.g. "de421.bsp".
+            elevation (float, optional): The observer elevation in meters. Defaults to DEFAULT_ELEVATION.
+            observer_cache_size (int, optional): The number of observers kept. Defaults to OBSERVER_CACHE_SIZE.
+            chart_cache (ChartCache | None, optional): A cache memoising the position calculations. Defaults to none.
+
+        Raises:
+            ValueError: If both a kernel and an ephemeris file are given.
+
+        """
+        if kernel is not None and ephemeris_file is not None:
+            msg = "Pass either a loaded kernel or an ephemeris file to load, not both"
+            raise ValueError(msg)
+
+        if ephemeris_file is not None:
+            configuration = ConfigurationManager(ephemeris_file)
+            self.ts = timescale if timescale is not None else configuration.ts
+            self.eph = configuration.eph
+        else:
+            self.ts = timescale if timescale is not None else ts
+            self.eph = kernel if kernel is not None else eph
+
+        self.elevation = elevation
+        self.chart_cache = chart_cache
+        self._observer_cache_size = observer_cache_size
+        self._observers: OrderedDict[tuple[float, float, float], Observer] = OrderedDict()
+        self._observers_lock = threading.Lock()
+
+    def get_observer(self, lat: float, lon: float, elevation: float | None = None) -> Observer:
+        """Return the observer of a location, from a least-recently-used cache keyed by location.
+
+        Args:
+            lat (float): The latitude of the observer in decimal degrees.
+            lon (float): The longitude of the observer in decimal degrees.
+            elevation (float | None, optional): The elevation of the observer in meters. Defaults to the engine elevation.
+
+        Returns:
+            Observer: The observer, shared by every call with the same location while it stays in the cache.
+
+        """
+        key = (float(lat), float(lon), float(elevation if elevation is not None else self.elevation))
+        with self._observers_lock:
+            observer = self._observers.get(key)
+            if observer is not None:
+                self._observers.move_to_end(key)
+                return observer
+
+        topos = wgs84.latlon(latitude_degrees=key[0], longitude_degrees=key[1], elevation_m=key[2])
+        observer = Observer(*key, topos, cast("VectorSum", self.eph["earth"]) + topos, sunrise_sunset(self.eph, topos))
+        with self._observers_lock:
+            observer = self._observers.setdefault(key, observer)
+            while len(self._observers) > self._observer_cache_size:
+                self._observers.popitem(last=False)
+
+        return observer
+
+    def clear_observer_cache(self) -> None:
+        """Drop every observer kept by `get_observer`."""
+        with self._observers_lock:
+            self._observers.clear()
+
+    def get_planet_position(self, planet: Planets, lat: float, lon: float, given_time: datetime) -> PlanetPosition:
+        """Return the tropical position of the planet for the given latitude, longitude, and datetime.
+
+        Args:
+            planet (Planets): The planet to calculate the position for.
+            lat (float): The latitude of the observer in decimal degrees.
+            lon (float): The longitude of the observer in decimal degrees.
+            given_time (datetime): The datetime of the observation in UTC.
+
+        Returns:
+            PlanetPosition: The tropical latitude, longitude, distance, and their rates of change of the planet.
+
+        """
+        return self._memoise(("planet_position", planet), lat, lon, given_time, lambda la, lo, when: self._get_planet_position(planet, la, lo, when))
+
+    def get_planet_position_series(
+        self, planet: Planets, lat: float, lon: float, times: Time, observer: Observer | None = None
+    ) -> "NDArray[np.float64]":
+        """Return the tropical positions of the planet for every instant of a vector time.
+
+        This is the vectorized counterpart of `get_planet_position`: the whole time array is
+        evaluated in a single Skyfield call instead of one call per instant.
+
+        Args:
+            planet (Planets): The planet to calculate the positions for.
+            lat (float): The latitude of the observer in decimal degrees.
+            lon (float): The longitude of the observer in decimal degrees.
+            times (Time): The skyfield time (scalar or array) of the observations.
+            observer (Observer | None, optional): The observer of `lat` and `lon`, e.g. kept by a batch caller from
+                `get_observer`. Defaults to looking it up with `get_observer(lat, lon)`.
+
+        Returns:
+            NDArray[np.float64]: An array of shape (len(times), 6) whose columns follow the field order of `PlanetPosition`.
+
+        """
+        jd = np.atleast_1d(times.tt)
+        t = self.ts.tt_jd(jd)
+        positions = np.zeros((len(jd), len(PlanetPosition._fields)), dtype=np.float64)
+
+        if planet in (Planets.RAHU, Planets.KETHU):
+            rahu = self._get_rahu_longitudes(t)
+            positions[:, 1] = rahu if planet == Planets.RAHU else (rahu + 180) % 360
+            return positions
+
+        if planet == Planets.ASCENDANT:
+            positions[:, 1] = _get_ascendant_longitudes(lat, lon, t)
+            return positions
+
+        if planet == Planets.EMPTY:
+            return positions
+
+        vector = observer.vector if observer is not None else self.get_observer(lat, lon).vector
+        astrometric = cast("Barycentric", vector.at(t)).observe(self.eph[planet.code]).apparent()
+
+        latitude, longitude, distance, speed_latitude, speed_longitude, speed_distance = astrometric.frame_latlon_and_rates(ecliptic_frame)
+
+        positions[:, 0] = latitude.degrees
+        positions[:, 1] = longitude.degrees
+        positions[:, 2] = distance.au
+        positions[:, 3] = cast("Rate", speed_latitude.degrees).per_day
+        positions[:, 4] = cast("Rate", speed_longitude.degrees).per_day
+        positions[:, 5] = speed_distance.au_per_d
+
+        return positions
+
+    def get_planets_position(self, planets: list[Planets], lat: float, lon: float, given_time: datetime) -> dict[Planets, PlanetPosition]:
+        """Return the tropical positions of all planets for the given latitude, longitude, and datetime.
+
+        Args:
+            planets (list[Planets]): The list of planets to calculate the positions for; an empty list means every planet.
+            lat (float): The latitude of the observer in decimal degrees.
+            lon (float): The longitude of the observer in decimal degrees.
+            given_time (datetime): The datetime of the observation in UTC.
+
+        Returns:
+            dict[Planets, PlanetPosition]: A dictionary mapping each planet to its tropical latitude, longitude, and
+                distance & their rates of change.
+
+        """
+        return {planet: self.get_planet_position(planet, lat, lon, given_time) for planet in (planets if len(planets) > 0 else Planets)}
+
+    def get_sunrise_sunset(
+        self,
+        lat: float,
+        lon: float,
+        given_time: datetime,
+        elevation: float | None = None,
+        observer: Observer | None = None,
+    ) -> tuple[datetime, datetime]:
+        """Calculate the sunrise and sunset times for a given location and date.
+
+        Args:
+            lat (float): The latitude of the location in decimal degrees.
+            lon (float): The longitude of the location in decimal degrees.
+            given_time (datetime): The date and time for which to calculate the sunrise and sunset times.
+            elevation (float | None, optional): The elevation of the location in meters. Defaults to the engine elevation.
+            observer (Observer | None, optional): The observer of the location, e.g. kept by a batch caller from
+                `get_observer`. Defaults to looking it up with `get_observer(lat, lon, elevation)`.
+
+        Returns:
+            tuple[datetime, datetime]: A tuple containing the sunrise and sunset times as datetime objects.
+
+        """
+        location = observer if observer is not None else self.get_observer(lat, lon, elevation)
+
+        # Search the civil day of the given time.
+        t_start = self.ts.utc(given_time.date())
+        t_end = self.ts.utc(given_time.date() + timedelta(days=1))
+
+        times, events = find_discrete(t_start, t_end, location.sunrise_function)
+
+        sunrise, sunset = cast("list[Time]", [time for time, _ in zip(times, events, strict=False)])
+
+        return cast("tuple[datetime, datetime]", (sunrise.utc_datetime(), sunset.utc_datetime()))
+
+    def get_ascendent_position(self, lat: float, lon: float, given_time: datetime) -> float:
+        """Calculate the tropical ascendant.
+
+        Args:
+            lat (float): The latitude of the observer in decimal degrees.
+            lon (float): The longitude of the observer in decimal degrees.
+            given_time (datetime): The datetime of the observation.
+
+        Returns:
+            float: The longitude of the tropical ascendant.
+
+        """
+        return self._memoise(("ascendant",), lat, lon, given_time, self._get_ascendent_position)
+
+    def get_lunar_node_positions(self, given_time: datetime) -> tuple[float, float]:
+        """Calculate the positions of the lunar nodes (Rahu and Kethu) for a given datetime.
+
+        Args:
+            given_time (datetime): The datetime in UTC for which to calculate the lunar node positions.
+
+        Returns:
+            tuple[float, float]: A tuple containing the longitudes of Rahu and Kethu in decimal degrees.
+
+        """
+        return self._memoise_time(("lunar_nodes",), given_time, self._get_lunar_node_positions)
+
+    def get_ephemeris_span(self) -> tuple[datetime, datetime]:
+        """Return the time span covered by every segment of the ephemeris kernel.
+
+        Returns:
+            tuple[datetime, datetime]: The first and last UTC datetimes, one day inside the kernel, for which all bodies can be computed.
+
+        """
+        spans: dict[tuple[int, int], tuple[float, float]] = {}
+        for segment in self.eph.segments:
+            spk_segment = segment.spk_segment
+            key = (segment.center, segment.target)
+            start, end = spans.get(key, (spk_segment.start_jd, spk_segment.end_jd))
+            spans[key] = (min(start, spk_segment.start_jd), max(end, spk_segment.end_jd))
+
+        # Keep clear of the edges, since light-time correction looks back up to a few hours.
+        start_jd = max(start for start, _ in spans.values()) + 1
+        end_jd = min(end for _, end in spans.values()) - 1
+
+        return (
+            cast("datetime", self.ts.tdb_jd(start_jd).utc_datetime()),
+            cast("datetime", self.ts.tdb_jd(end_jd).utc_datetime()),
+        )
+
+    def find_retrograde_periods(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        planet_name: str,
+        latitude: float,
+        longitude: float,
+    ) -> list[tuple[datetime, datetime]]:
+        """Calculate the retrograde periods for a given planet within a specified date range and location.
+
+        Args:
+            start_date (datetime): The start date of the period to check for retrograde motion.
+            end_date (datetime): The end date of the period to check for retrograde motion.
+            planet_name (str): The name of the planet to check for retrograde motion.
+            latitude (float): The latitude of the observation location.
+            longitude (float): The longitude of the observation location.
+
+        Returns:
+            list[tuple[datetime, datetime]]: A list of tuples, each containing the start and end datetime of a retrograde period.
+
+        """
+        t0 = self.ts.utc(start_date)
+        t1 = self.ts.utc(end_date)
+
+        times, values = find_discrete(t0, t1, RetrogradeFunction(planet_name, latitude, longitude, self))
+
+        return get_retrograde_periods(times, values, t1)
+
+    def is_planet_in_retrograde(
+        self,
+        check_date: datetime,
+        planet_name: str,
+        latitude: float,
+        longitude: float,
+    ) -> tuple[bool, datetime | None, datetime | None]:
+        """Check if a planet is in retrograde motion on a specific date.
+
+        Args:
+            check_date (datetime): The date to check for retrograde motion.
+            planet_name (str): The name of the planet to check.
+            latitude (float): The latitude in decimal degrees of the observation location.
+            longitude (float): The longitude in decimal degrees of the observation location.
+
+        Returns:
+            tuple[bool, datetime | None, datetime | None]: Whether the planet is retrograde on the date, and the start
+                and end of the retrograde period (None if not in retrograde).
+
+        """
+        if planet_name not in [Planets.SUN.code, Planets.MOON.code, Planets.ASCENDANT.code, Planets.EMPTY.code]:
+            start_date = check_date - timedelta(days=365)
+            end_date = check_date + timedelta(days=365)
+            for period_start, period_end in self.find_retrograde_periods(start_date, end_date, planet_name, latitude, longitude):
+                if period_start <= check_date <= period_end:
+                    return (True, period_start, period_end)
+
+        return (False, None, None)
+
+    def _memoise(
+        self,
+        name: tuple[Hashable, ...],
+        lat: float,
+        lon: float,
+        given_time: datetime,
+        compute: "Callable[[float, float, datetime], R]",
+    ) -> R:
+        """Compute a value, or take it from the chart cache keyed by quantised time and rounded location."""
+        cache = self.chart_cache
+        if cache is None or not isinstance(given_time, datetime):
+            return compute(lat, lon, given_time)
+
+        rounded_lat = round(float(lat), cache.precision)
+        rounded_lon = round(float(lon), cache.precision)
+
+        return self._memoise_time((*name, rounded_lat, rounded_lon), given_time, lambda when: compute(rounded_lat, rounded_lon, when))
+
+    def _memoise_time(self, name: tuple[Hashable, ...], given_time: datetime, compute: "Callable[[datetime], R]") -> R:
+        """Compute a value that does not depend on the location, or take it from the chart cache keyed by quantised time."""
+        cache = self.chart_cache
+        if cache is None or not isinstance(given_time, datetime):
+            return compute(given_time)
+
+        when = cache.quantise_time(given_time)
+
+        return cache.get_or_compute((*name, when), lambda: compute(when))
+
+    def _get_planet_position(self, planet: Planets, lat: float, lon: float, given_time: datetime) -> PlanetPosition:
+        """Compute the tropical position of a planet without the chart cache."""
+        if planet in (Planets.RAHU, Planets.KETHU):
+            pos = self.get_lunar_node_positions(given_time)
+            return PlanetPosition(0.0, pos[0] if planet == Planets.RAHU else pos[1], 0.0, 0.0, 0.0, 0.0)
+
+        if planet == Planets.ASCENDANT:
+            return PlanetPosition(0.0, self.get_ascendent_position(lat, lon, given_time), 0.0, 0.0, 0.0, 0.0)
+
+        if planet == Planets.EMPTY:
+            return PlanetPosition(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+        t = self.ts.utc(given_time)
+        astrometric = cast("Barycentric", self.get_observer(lat, lon).vector.at(t)).observe(self.eph[planet.code]).apparent()
+
+        latitude, longitude, distance, speed_latitude, speed_longitude, speed_distance = astrometric.frame_latlon_and_rates(ecliptic_frame)
+
+        return PlanetPosition(
+            cast("float", latitude.degrees),
+            cast("float", longitude.degrees),
+            cast("float", distance.au),
+            cast("float", cast("Rate", speed_latitude.degrees).per_day),
+            cast("float", cast("Rate", speed_longitude.degrees).per_day),
+            cast("float", speed_distance.au_per_d),
+        )
+
+    def _get_ascendent_position(self, lat: float, lon: float, given_time: datetime) -> float:
+        """Compute the tropical ascendant without the chart cache."""
+        t = self.ts.utc(given_time)
+
+        oer = radians(mean_obliquity(t.tdb) / 3600)
+        gmst: float = cast("float", t.gmst)
+        lstr = radians(((gmst + lon / 15) % 24) * 15)
+
+        # source: https://astronomy.stackexchange.com/a/55891 by pm-2ring
+        ascr = atan2(cos(lstr), -(sin(lstr) * cos(oer) + tan(radians(lat)) * sin(oer)))
+
+        return normalize_degree(degrees(ascr))
+
+    def _get_lunar_node_positions(self, given_time: datetime) -> tuple[float, float]:
+        """Compute the lunar nodes without the chart cache."""
+        tm = self.ts.from_datetime(given_time)
+        position = cast("VectorSum", (self.eph["moon"] - self.eph["earth"])).at(tm)
+        elements = osculating_elements_of(position, inertial_frames["ECLIPJ2000"])
+
+        rahu_position = normalize_degree(cast("float", cast("Angle", elements.longitude_of_ascending_node).degrees))
+        kethu_position = normalize_degree(rahu_position + 180)
+
+        return rahu_position, kethu_position
+
+    def _get_rahu_longitudes(self, t: Time) -> "NDArray[np.float64]":
+        """Vectorized form of `get_lunar_node_positions` returning Rahu for an array time."""
+        position = cast("VectorSum", (self.eph["moon"] - self.eph["earth"])).at(t)
+        elements = osculating_elements_of(position, inertial_frames["ECLIPJ2000"])
+
+        return cast("NDArray[np.float64]", cast("Angle", elements.longitude_of_ascending_node).degrees % 360)
+
+
+class RetrogradeFunction:
+    """A class to determine if a planet is in retrograde motion from a given location on Earth.
+
+    Attributes:
+        planet_name (str): The name of the planet to observe.
+        latitude (float): The latitude of the observer's location.
+        longitude (float): The longitude of the observer's location.
+        step_days (int): The grid step of the search, RETROGRADE_SEARCH_STEP_DAYS.
+        engine (Engine): The engine computing the positions.
+
+    Methods:
+        __call__(t: Time) -> bool:
+            Determines if the planet is in retrograde motion at the given time `t`.
+            Returns True if the planet is in retrograde motion, otherwise False.
+
+    """
+
+    def __init__(self, planet_name: str, latitude: float, longitude: float, engine: Engine | None = None) -> None:
+        """Initialize a new instance of the retrograde class.
+
+        Args:
+            planet_name (str): The name of the planet.
+            latitude (float): The latitude coordinate.
+            longitude (float): The longitude coordinate.
+            engine (Engine | None, optional): The engine computing the positions. Defaults to `get_default_engine()`.
+
+        """
+        self.planet_name = planet_name
+        self.latitude = latitude
+        self.longitude = longitude
+        self.step_days = RETROGRADE_SEARCH_STEP_DAYS
+        self.engine = engine if engine is not None else get_default_engine()
+
+    def __call__(self, t: Time) -> bool:
+        """Determine if the planet is in retrograde motion at a given time.
+
+        This method calculates the ecliptic longitude of the planet at the given time `t`
+        and compares it with the ecliptic longitude of the planet at the previous time `t-1`.
+        If the longitude decreases, the planet is in retrograde motion.
+
+        Args:
+            t (Time): The time at which to check for retrograde motion.
+
+        Returns:
+            bool: True if the planet is in retrograde motion, False otherwise.
+
+        """
+        planet = Planets.from_code(self.planet_name)
+        lon_now = self.engine.get_planet_position(planet, self.latitude, self.longitude, cast("datetime", t.utc_datetime()))
+        lon_prev = self.engine.get_planet_position(planet, self.latitude, self.longitude, cast("datetime", (t - 1).utc_datetime()))
+
+        return cast("float", lon_now.longitude) < cast("float", lon_prev.longitude)  # Retrograde if longitude decreases
+
+
+_default_engine: Engine | None = None
+_default_engine_lock = threading.Lock()
+
+
+def get_default_engine() -> Engine:
+    """Return the engine behind the functions of `ndastro_engine.core`, built on first use from the configured kernel.
+
+    Returns:
+        Engine: The process-wide default engine.
+
+    """
+    global _default_engine  # noqa: PLW0603
+    with _default_engine_lock:
+        if _default_engine is None:
+            _default_engine = Engine()
+
+        return _default_engine
+
+
+def get_retrograde_periods(times: Time, values: "NDArray[np.bool_]", end_time: Time) -> list[tuple[datetime, datetime]]:
+    """Join the direction changes found by a `RetrogradeFunction` search into retrograde periods.
+
+    A period already in progress at the start of the search is skipped, as it has no start; a
+    period still in progress at the end of the search is closed at `end_time`.
+
+    Args:
+        times (Time): The times at which the planet turned retrograde or direct, in order.
+        values (NDArray[np.bool_]): True where the planet turned retrograde, False where it turned direct.
+        end_time (Time): The end of the search.
+
+    Returns:
+        list[tuple[datetime, datetime]]: The start and end of every retrograde period.
+
+    """
+    retrograde_periods: list[tuple[datetime, datetime]] = []
+    in_retrograde = False
+    retro_start: datetime | None = None
+
+    for t, retro in zip(times, values, strict=False):
+        if retro:
+            if not in_retrograde:
+                retro_start = cast("datetime", cast("Time", t).utc_datetime())
+                in_retrograde = True
+        elif in_retrograde:
+            retrograde_periods.append((cast("datetime", retro_start), cast("datetime", cast("Time", t).utc_datetime())))
+            in_retrograde = False
+
+    if in_retrograde:
+        retrograde_periods.append((cast("datetime", retro_start), cast("datetime", end_time.utc_datetime())))
+
+    return retrograde_periods
+
+
+def _get_ascendant_longitudes(lat: float, lon: float, t: Time) -> "NDArray[np.float64]":
+    """Vectorized form of `get_ascendent_position` for an array time."""
+    oer = np.radians(mean_obliquity(t.tdb) / 3600)
+    lstr = np.radians(((t.gmst + lon / 15) % 24) * 15)
+    ascr = np.arctan2(np.cos(lstr), -(np.sin(lstr) * np.cos(oer) + np.tan(np.radians(lat)) * np.sin(oer)))
+
+    return cast("NDArray[np.float64]", np.degrees(ascr) % 360)
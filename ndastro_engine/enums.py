@@ -1,14 +1,28 @@
 """Enums module for ndastro_engine.
 
 This module provides access to all enum types used in ndastro calculations:
+- Aspects: Conjunction, opposition and Vedic drishti between planets
+- Granularity: Divisions of the sidereal zodiac (rasi, nakshatra, pada, navamsa)
 - Houses: Astrological houses
+- Karanams: Karanams (half-thithis)
 - Natchaththirams: Nakshatra (lunar mansion) enumerations
 - Planets: Planetary bodies
+- Poruthams: Marriage compatibility checks
 - Rasis: Zodiac signs (rasis)
+- Thithis: Thithis (lunar days)
+- Vargas: Divisional charts (D1 to D60)
+- Yogams: Nithya yogams
 """
+from ndastro_engine.aspect_enum import Aspects
+from ndastro_engine.granularity_enum import Granularity
 from ndastro_engine.house_enum import Houses
+from ndastro_engine.karanam_enum import Karanams
 from ndastro_engine.nakshatra_enum import Natchaththirams
 from ndastro_engine.planet_enum import Planets
+from ndastro_engine.porutham_enum import Poruthams
 from ndastro_engine.rasi_enum import Rasis
+from ndastro_engine.thithi_enum import Thithis
+from ndastro_engine.varga_enum import Vargas
+from ndastro_engine.yogam_enum import Yogams
 
-__all__ = ["Houses", "Natchaththirams", "Planets", "Rasis"]
+__all__ = ["Aspects", "Granularity", "Houses", "Karanams", "Natchaththirams", "Planets", "Poruthams", "Rasis", "Thithis", "Vargas", "Yogams"]
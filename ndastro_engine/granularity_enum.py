@@ -0,0 +1,71 @@
+"""Module to hold zodiac granularity enums."""
+
+from enum import Enum
+
+from ndastro_engine.constants import DEGREE_MAX
+
+
+class Granularity(Enum):
+    """Enum to hold the ways the sidereal zodiac can be divided."""
+
+    RASI = 1
+    NAKSHATRA = 2
+    PADA = 3
+    NAVAMSA = 4
+
+    def __str__(self) -> str:
+        """Return name of the granularity.
+
+        Returns:
+            str: name of the granularity
+
+        """
+        return self.name
+
+    @property
+    def divisions(self) -> int:
+        """Return the number of equal divisions of the zodiac.
+
+        Returns:
+            int: 12 for rasi, 27 for nakshatra and 108 for pada and navamsa.
+
+        """
+        granularity_divisions = {
+            Granularity.RASI: 12,
+            Granularity.NAKSHATRA: 27,
+            Granularity.PADA: 108,
+            Granularity.NAVAMSA: 108,
+        }
+
+        return granularity_divisions[self]
+
+    @property
+    def span(self) -> float:
+        """Return the width of one division in degrees.
+
+        Returns:
+            float: 30° for rasi, 13°20' for nakshatra and 3°20' for pada and navamsa.
+
+        """
+        return DEGREE_MAX / self.divisions
+
+    def number(self, segment: int) -> int:
+        """Convert a 0-based segment of the zodiac to the number used for this granularity.
+
+        Rasi and nakshatra segments map to the `Rasis` and `Natchaththirams` values, pada
+        segments to 1-108 and navamsa segments to the `Rasis` value of the navamsa sign.
+
+        Args:
+            segment (int): The 0-based segment index, between 0 and `divisions` - 1.
+
+        Returns:
+            int: The 1-based number of the segment.
+
+        """
+        if self == Granularity.NAVAMSA:
+            return segment % 12 + 1
+
+        return segment + 1
+
+
+__all__ = ["Granularity"]
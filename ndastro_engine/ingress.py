@@ -0,0 +1,221 @@
+"""Ingress search functions for the sidereal zodiac.
+
+This module finds the times at which a planet crosses the boundaries of the sidereal
+(Lahiri) zodiac at a chosen granularity:
+- Rasi (30°), Nakshatra (13°20'), Pada (3°20') and Navamsa (3°20') boundaries
+- Forward ingresses as well as retrograde re-entries into the previous division
+
+The search samples the sidereal longitude on a vectorized time grid and refines every
+bracketed change with Skyfield's `find_discrete`.
+"""
+
+from datetime import datetime
+from typing import TYPE_CHECKING, cast
+
+import numpy as np
+from skyfield.almanac import find_discrete
+
+from ndastro_engine.ayanamsa import get_sidereal_longitude_series
+from ndastro_engine.constants import MAX_DAILY_MOTION
+from ndastro_engine.core import get_ephemeris_span, ts
+from ndastro_engine.enums import Granularity, Planets
+from ndastro_engine.ingress_index import IngressIndex
+from ndastro_engine.models import Ingress
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    from skyfield.timelib import Time
+
+# The longest grid step used by the coarse scan, so that slow planets stationing near a
+# boundary are still sampled at least once a day.
+MAX_STEP_DAYS = 1.0
+
+
+class IngressFunction:
+    """A discrete function giving the 0-based division of the sidereal zodiac a planet occupies.
+
+    Attributes:
+        planet (Planets): The planet to observe.
+        latitude (float): The latitude of the observer's location.
+        longitude (float): The longitude of the observer's location.
+        granularity (Granularity): The division of the zodiac to report.
+        step_days (float): The grid step used by `find_discrete` for the coarse scan.
+
+    """
+
+    def __init__(self, planet: Planets, latitude: float, longitude: float, granularity: Granularity, step_days: float | None = None) -> None:
+        """Initialize a new instance of the ingress function.
+
+        Args:
+            planet (Planets): The planet.
+            latitude (float): The latitude coordinate.
+            longitude (float): The longitude coordinate.
+            granularity (Granularity): The division of the zodiac.
+            step_days (float | None, optional): The coarse scan step. Defaults to half the time the
+                planet needs to cross one division at its fastest, capped at `MAX_STEP_DAYS`.
+
+        """
+        self.planet = planet
+        self.latitude = latitude
+        self.longitude = longitude
+        self.granularity = granularity
+        self.step_days = step_days if step_days is not None else get_ingress_step_days(planet, granularity)
+
+    def __call__(self, t: "Time") -> "NDArray[np.int64]":
+        """Return the 0-based division occupied by the planet at every instant of `t`.
+
+        Args:
+            t (Time): The (vector) time at which to evaluate the planet.
+
+        Returns:
+            NDArray[np.int64]: The division index, between 0 and `granularity.divisions` - 1.
+
+        """
+        sidereal = get_sidereal_longitude_series(self.planet, self.latitude, self.longitude, t)
+
+        return cast("NDArray[np.int64]", np.floor(sidereal / self.granularity.span).astype(np.int64) % self.granularity.divisions)
+
+
+def get_ingress_step_days(planet: Planets, granularity: Granularity) -> float:
+    """Return the coarse scan step for the planet and granularity.
+
+    Args:
+        planet (Planets): The planet.
+        granularity (Granularity): The division of the zodiac.
+
+    Returns:
+        float: Half the number of days the planet needs to cross one division at its fastest, at most `MAX_STEP_DAYS`.
+
+    """
+    return min(MAX_STEP_DAYS, granularity.span / (2 * MAX_DAILY_MOTION[planet.code]))
+
+
+def find_ingresses(  # noqa: PLR0913
+    start_date: datetime,
+    end_date: datetime,
+    planet: Planets,
+    latitude: float,
+    longitude: float,
+    *,
+    granularity: Granularity = Granularity.RASI,
+    step_days: float | None = None,
+) -> list[Ingress]:
+    """Find every sidereal boundary crossing of a planet within a date range.
+
+    Args:
+        start_date (datetime): The start of the search range.
+        end_date (datetime): The end of the search range.
+        planet (Planets): The planet to search the ingresses of.
+        latitude (float): The latitude of the observation location.
+        longitude (float): The longitude of the observation location.
+        granularity (Granularity, optional): The division of the zodiac. Defaults to Granularity.RASI.
+        step_days (float | None, optional): The coarse scan step. Defaults to `get_ingress_step_days`.
+
+    Returns:
+        list[Ingress]: The crossings in chronological order, including retrograde re-entries.
+
+    """
+    if planet == Planets.EMPTY:
+        return []
+
+    function = IngressFunction(planet, latitude, longitude, granularity, step_days)
+    t0 = ts.utc(start_date)
+
+    return _search_ingresses(function, t0, ts.utc(end_date), int(function(t0)[0]))
+
+
+def find_planets_ingresses(  # noqa: PLR0913
+    start_date: datetime,
+    end_date: datetime,
+    planets: list[Planets],
+    latitude: float,
+    longitude: float,
+    *,
+    granularity: Granularity = Granularity.RASI,
+) -> dict[Planets, list[Ingress]]:
+    """Find the sidereal boundary crossings of several planets within a date range.
+
+    Args:
+        start_date (datetime): The start of the search range.
+        end_date (datetime): The end of the search range.
+        planets (list[Planets]): The planets to search; an empty list searches every planet.
+        latitude (float): The latitude of the observation location.
+        longitude (float): The longitude of the observation location.
+        granularity (Granularity, optional): The division of the zodiac. Defaults to Granularity.RASI.
+
+    Returns:
+        dict[Planets, list[Ingress]]: A dictionary mapping each planet to its crossings in chronological order.
+
+    """
+    ingresses: dict[Planets, list[Ingress]] = {}
+    for planet in planets if len(planets) > 0 else Planets:
+        if planet != Planets.EMPTY:
+            ingresses[planet] = find_ingresses(start_date, end_date, planet, latitude, longitude, granularity=granularity)
+
+    return ingresses
+
+
+def build_ingress_index(  # noqa: PLR0913
+    planets: list[Planets],
+    granularities: list[Granularity],
+    latitude: float,
+    longitude: float,
+    *,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+) -> IngressIndex:
+    """Search the ingresses of several planets and granularities and collect them in an index.
+
+    Args:
+        planets (list[Planets]): The planets to index; an empty list indexes every planet.
+        granularities (list[Granularity]): The granularities to index.
+        latitude (float): The latitude of the observation location.
+        longitude (float): The longitude of the observation location.
+        start_date (datetime | None, optional): The start of the span. Defaults to the start of the ephemeris kernel.
+        end_date (datetime | None, optional): The end of the span. Defaults to the end of the ephemeris kernel.
+
+    Returns:
+        IngressIndex: The index of every crossing within the span.
+
+    """
+    kernel_start, kernel_end = get_ephemeris_span()
+    start = start_date if start_date is not None else kernel_start
+    end = end_date if end_date is not None else kernel_end
+
+    index = IngressIndex(start, end)
+    t0 = ts.utc(start)
+    t1 = ts.utc(end)
+    for planet in planets if len(planets) > 0 else Planets:
+        if planet == Planets.EMPTY:
+            continue
+        for granularity in granularities:
+            function = IngressFunction(planet, latitude, longitude, granularity)
+            initial = int(function(t0)[0])
+            index.add(planet, granularity, granularity.number(initial), _search_ingresses(function, t0, t1, initial))
+
+    return index
+
+
+def _search_ingresses(function: IngressFunction, t0: "Time", t1: "Time", initial: int) -> list[Ingress]:
+    """Return the crossings found by `find_discrete`, starting from the 0-based division occupied at `t0`."""
+    planet = function.planet
+    granularity = function.granularity
+    times, values = find_discrete(t0, t1, function)
+
+    ingresses: list[Ingress] = []
+    previous = initial
+    for t, value in zip(times, values, strict=True):
+        current = int(value)
+        ingresses.append(
+            Ingress(
+                cast("datetime", cast("Time", t).utc_datetime()),
+                planet,
+                granularity,
+                granularity.number(previous),
+                granularity.number(current),
+                (current - previous) % granularity.divisions != 1,
+            )
+        )
+        previous = current
+
+    return ingresses
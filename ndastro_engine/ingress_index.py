@@ -0,0 +1,215 @@
+"""Interval index of precomputed sidereal ingresses.
+
+This module provides the IngressIndex class, which keeps the boundary crossings found by
+`ndastro_engine.ingress` as sorted arrays per planet and granularity so that questions like
+"which rasi is Jupiter in on a date" or "when is Saturn in Pisces between two dates" are
+answered by bisection without evaluating the ephemeris.
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import numpy as np
+
+from ndastro_engine.enums import Granularity, Planets
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from ndastro_engine.models import Ingress
+
+# Version of the on-disk layout written by IngressIndex.save.
+INGRESS_INDEX_VERSION = 1
+
+
+class IngressIndex:
+    """Sorted boundary arrays of sidereal ingresses, keyed by planet and granularity.
+
+    For every (planet, granularity) pair the index holds the UTC POSIX timestamps of the
+    crossings in `times` and, in `divisions`, the division occupied before the first crossing
+    followed by the division entered at each crossing, so `divisions` is one longer than `times`.
+
+    Attributes:
+        start (datetime): The UTC start of the span covered by the index.
+        end (datetime): The UTC end of the span covered by the index.
+
+    """
+
+    def __init__(self, start: datetime, end: datetime) -> None:
+        """Initialize an empty index covering the given span.
+
+        Args:
+            start (datetime): The UTC start of the span covered by the index.
+            end (datetime): The UTC end of the span covered by the index.
+
+        """
+        self.start = start
+        self.end = end
+        self._entries: dict[tuple[Planets, Granularity], tuple[NDArray[np.float64], NDArray[np.int16]]] = {}
+
+    def __contains__(self, key: tuple[Planets, Granularity]) -> bool:
+        """Return True if the index holds the boundaries of the (planet, granularity) pair."""
+        return key in self._entries
+
+    @property
+    def keys(self) -> list[tuple[Planets, Granularity]]:
+        """Return the (planet, granularity) pairs held by the index.
+
+        Returns:
+            list[tuple[Planets, Granularity]]: The indexed pairs.
+
+        """
+        return list(self._entries)
+
+    def add(self, planet: Planets, granularity: Granularity, initial_division: int, ingresses: "list[Ingress]") -> None:
+        """Add the ingresses of a planet at a granularity, replacing any previous entry.
+
+        Args:
+            planet (Planets): The planet the ingresses belong to.
+            granularity (Granularity): The granularity of the ingresses.
+            initial_division (int): The division occupied at the start of the span.
+            ingresses (list[Ingress]): The crossings within the span, in chronological order.
+
+        """
+        times = np.array([ingress.time.timestamp() for ingress in ingresses], dtype=np.float64)
+        divisions = np.array([initial_division, *(ingress.to_division for ingress in ingresses)], dtype=np.int16)
+        self._entries[planet, granularity] = (times, divisions)
+
+    def boundaries(self, planet: Planets, granularity: Granularity) -> "tuple[NDArray[np.float64], NDArray[np.int16]]":
+        """Return the raw boundary arrays of a (planet, granularity) pair.
+
+        Args:
+            planet (Planets): The planet.
+            granularity (Granularity): The granularity.
+
+        Returns:
+            tuple[NDArray[np.float64], NDArray[np.int16]]: The crossing timestamps and the divisions between them.
+
+        """
+        return self._entries[planet, granularity]
+
+    def division_at(self, planet: Planets, granularity: Granularity, when: datetime) -> int:
+        """Return the division occupied by a planet at an instant.
+
+        Args:
+            planet (Planets): The planet.
+            granularity (Granularity): The granularity.
+            when (datetime): The timezone-aware instant, within the span of the index.
+
+        Returns:
+            int: The division number, as given by `Granularity.number`.
+
+        """
+        self._check_span(when, when)
+        times, divisions = self._entries[planet, granularity]
+
+        return int(divisions[np.searchsorted(times, when.timestamp(), side="right")])
+
+    def divisions_at(self, planet: Planets, granularity: Granularity, timestamps: "NDArray[np.float64]") -> "NDArray[np.int16]":
+        """Return the divisions occupied by a planet at many instants.
+
+        Args:
+            planet (Planets): The planet.
+            granularity (Granularity): The granularity.
+            timestamps (NDArray[np.float64]): The UTC POSIX timestamps of the instants.
+
+        Returns:
+            NDArray[np.int16]: The division number at every instant.
+
+        """
+        times, divisions = self._entries[planet, granularity]
+
+        return cast("NDArray[np.int16]", divisions[np.searchsorted(times, timestamps, side="right")])
+
+    def intervals(
+        self,
+        planet: Planets,
+        granularity: Granularity,
+        division: int,
+        start: datetime,
+        end: datetime,
+    ) -> list[tuple[datetime, datetime]]:
+        """Return the intervals during which a planet occupies a division, clipped to a range.
+
+        Args:
+            planet (Planets): The planet.
+            granularity (Granularity): The granularity.
+            division (int): The division number, as given by `Granularity.number`.
+            start (datetime): The timezone-aware start of the range.
+            end (datetime): The timezone-aware end of the range.
+
+        Returns:
+            list[tuple[datetime, datetime]]: The (start, end) UTC datetimes of every overlapping interval.
+
+        """
+        self._check_span(start, end)
+        times, divisions = self._entries[planet, granularity]
+        range_start = start.timestamp()
+        range_end = end.timestamp()
+
+        first = int(np.searchsorted(times, range_start, side="right"))
+        last = int(np.searchsorted(times, range_end, side="left"))
+        edges = np.concatenate(([range_start], times[first:last], [range_end]))
+        matches = np.flatnonzero(divisions[first : last + 1] == division)
+
+        return [(_to_datetime(edges[i]), _to_datetime(edges[i + 1])) for i in matches if edges[i] < edges[i + 1]]
+
+    def save(self, path: str | Path) -> None:
+        """Write the index to a compressed binary `.npz` file.
+
+        Args:
+            path (str | Path): The destination file.
+
+        """
+        arrays: dict[str, NDArray[np.float64] | NDArray[np.int16] | NDArray[np.int64]] = {
+            "header": np.array([INGRESS_INDEX_VERSION], dtype=np.int64),
+            "span": np.array([self.start.timestamp(), self.end.timestamp()], dtype=np.float64),
+        }
+        for (planet, granularity), (times, divisions) in self._entries.items():
+            arrays[f"{planet.name}.{granularity.name}.times"] = times
+            arrays[f"{planet.name}.{granularity.name}.divisions"] = divisions
+
+        with Path(path).open("wb") as file:
+            np.savez_compressed(file, **arrays)  # type: ignore[arg-type]
+
+    @classmethod
+    def load(cls, path: str | Path) -> "IngressIndex":
+        """Read an index written by `save`.
+
+        Args:
+            path (str | Path): The source file.
+
+        Returns:
+            IngressIndex: The loaded index.
+
+        Raises:
+            ValueError: If the file was written with an unsupported layout version.
+
+        """
+        with np.load(Path(path)) as data:
+            version = int(data["header"][0])
+            if version != INGRESS_INDEX_VERSION:
+                msg = f"Unsupported ingress index version {version}, expected {INGRESS_INDEX_VERSION}"
+                raise ValueError(msg)
+
+            span = data["span"]
+            index = cls(_to_datetime(span[0]), _to_datetime(span[1]))
+            for name in data.files:
+                if name.endswith(".times"):
+                    planet_name, granularity_name, _ = name.split(".")
+                    key = (Planets[planet_name], Granularity[granularity_name])
+                    index._entries[key] = (data[name], data[f"{planet_name}.{granularity_name}.divisions"])
+
+        return index
+
+    def _check_span(self, start: datetime, end: datetime) -> None:
+        """Raise ValueError if the range is not covered by the index."""
+        if start < self.start or end > self.end:
+            msg = f"Range {start} - {end} is outside the span of the index ({self.start} - {self.end})"
+            raise ValueError(msg)
+
+
+def _to_datetime(timestamp: float) -> datetime:
+    """Convert a POSIX timestamp to a UTC datetime."""
+    return datetime.fromtimestamp(float(timestamp), tz=timezone.utc)
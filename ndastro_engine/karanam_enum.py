@@ -0,0 +1,68 @@
+"""Module to hold karanam enums."""
+
+from enum import IntEnum
+
+# Number of half-thithis in a lunar month.
+HALF_THITHIS = 60
+# Number of karanams repeating through the month.
+MOVABLE_KARANAMS = 7
+
+
+class Karanams(IntEnum):
+    """Enum to hold the 11 karanams (half-thithis)."""
+
+    BAVAM = 1
+    BAALAVAM = 2
+    KOULAVAM = 3
+    THAITHULAM = 4
+    KARASAI = 5
+    VANASAI = 6
+    BHADHRAI = 7
+    SAKUNI = 8
+    CHATHUSHPAADHAM = 9
+    NAAGAVAM = 10
+    KIMSTHUGNAM = 11
+
+    def __str__(self) -> str:
+        """Return name of the karanam.
+
+        Returns:
+            str: name of the karanam
+
+        """
+        return self.name
+
+    @staticmethod
+    def from_half_thithi(index: int) -> "Karanams":
+        """Return the karanam of a half-thithi of the lunar month.
+
+        The first half of Sukla Prathamai is Kimsthugnam, the seven movable karanams then repeat
+        eight times, and the last three half-thithis are Sakuni, Chathushpaadham and Naagavam.
+
+        Args:
+            index (int): The 0-based half-thithi, between 0 and 59.
+
+        Returns:
+            Karanams: The karanam of the half-thithi.
+
+        """
+        if index == 0:
+            return Karanams.KIMSTHUGNAM
+
+        if index >= HALF_THITHIS - 3:
+            return Karanams(index - (HALF_THITHIS - 3) + Karanams.SAKUNI.value)
+
+        return Karanams((index - 1) % MOVABLE_KARANAMS + 1)
+
+    @staticmethod
+    def to_list() -> list[str]:
+        """Convert enum to list of enum item name.
+
+        Returns:
+            list[str]: list of enum item name
+
+        """
+        return [el.name for el in Karanams]
+
+
+__all__ = ["Karanams"]
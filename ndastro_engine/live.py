@@ -0,0 +1,210 @@
+"""Live chart provider for the current instant.
+
+Horary (prashna) charts are cast for "now" on every request. This module keeps the positions
+of a set of planets precomputed over a short rolling window ahead of the current time and
+serves any instant of that window by interpolation:
+- LiveChartProvider: the rolling window, refreshed in a background thread before it runs out
+- LiveChartStats: the number of instants served from the window (hits) or computed (misses)
+
+The window is sampled on a regular grid with one vectorized call per planet. An instant is
+served from the sample before it, moved forward by the `speed_*` rates of `PlanetPosition`;
+the ascendant and the lunar nodes have no rates, so their rates are taken from the next sample.
+"""
+
+import threading
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ndastro_engine.constants import DEGREE_MAX
+from ndastro_engine.core import get_planet_position_series, get_planets_position, ts
+from ndastro_engine.enums import Planets
+from ndastro_engine.models import PlanetPosition
+
+# Bodies whose position series carries no rates, interpolated between samples instead.
+_RATELESS_PLANETS = (Planets.ASCENDANT, Planets.RAHU, Planets.KETHU)
+
+
+class LiveChartStats(NamedTuple):
+    """The counters of a live chart provider.
+
+    Attributes:
+        hits (int): The number of instants served from the precomputed window.
+        misses (int): The number of instants outside the window, computed directly.
+        refreshes (int): The number of times the window was recomputed.
+
+    """
+
+    hits: int
+    misses: int
+    refreshes: int
+
+
+class _LiveWindow(NamedTuple):
+    """The precomputed positions of a live chart provider."""
+
+    start: float
+    end: float
+    positions: NDArray[np.float64]
+    rates: NDArray[np.float64]
+
+
+class LiveChartProvider:
+    """Serve planet positions near the current time from a precomputed rolling window.
+
+    Attributes:
+        planets (tuple[Planets, ...]): The planets served.
+        latitude (float): The latitude of the observer's location.
+        longitude (float): The longitude of the observer's location.
+        horizon (timedelta): The length of the window ahead of the current time.
+        step (timedelta): The distance between two precomputed samples.
+        refresh_margin (timedelta): The remaining length of the window below which it is recomputed.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        planets: list[Planets],
+        latitude: float,
+        longitude: float,
+        *,
+        horizon: timedelta = timedelta(hours=1),
+        step: timedelta = timedelta(minutes=1),
+        refresh_margin: timedelta = timedelta(minutes=15),
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        """Initialize a new live chart provider; the window is computed on first use.
+
+        Args:
+            planets (list[Planets]): The planets to serve; an empty list serves every planet.
+            latitude (float): The latitude coordinate.
+            longitude (float): The longitude coordinate.
+            horizon (timedelta, optional): The length of the window. Defaults to one hour.
+            step (timedelta, optional): The sample spacing. Defaults to one minute.
+            refresh_margin (timedelta, optional): The remaining length that triggers a refresh. Defaults to 15 minutes.
+            clock (Callable[[], datetime] | None, optional): The source of the current UTC time. Defaults to the system clock.
+
+        Raises:
+            ValueError: If the step is not positive or the refresh margin is not shorter than the horizon.
+
+        """
+        if step <= timedelta(0) or not timedelta(0) <= refresh_margin < horizon:
+            msg = f"Expected a positive step and a refresh margin shorter than the horizon, got {step}, {refresh_margin} and {horizon}"
+            raise ValueError(msg)
+
+        self.planets = tuple(planets) if len(planets) > 0 else tuple(Planets)
+        self.latitude = latitude
+        self.longitude = longitude
+        self.horizon = horizon
+        self.step = step
+        self.refresh_margin = refresh_margin
+        self._clock = clock if clock is not None else lambda: datetime.now(timezone.utc)
+        self._window: _LiveWindow | None = None
+        self._lock = threading.Lock()
+        self._refreshing: threading.Thread | None = None
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+
+    @property
+    def stats(self) -> LiveChartStats:
+        """Return the hit, miss and refresh counters.
+
+        Returns:
+            LiveChartStats: The counters since the provider was created.
+
+        """
+        with self._lock:
+            return LiveChartStats(self._hits, self._misses, self._refreshes)
+
+    def refresh(self, start: datetime | None = None) -> None:
+        """Recompute the window synchronously.
+
+        Args:
+            start (datetime | None, optional): The start of the new window. Defaults to the current time.
+
+        """
+        begin = start if start is not None else self._clock()
+        count = int(self.horizon / self.step) + 1
+        offsets = np.arange(count + 1, dtype=np.float64) * self.step.total_seconds()
+        t = ts.tt_jd(ts.utc(begin).tt + offsets / 86400)
+
+        samples = np.stack([get_planet_position_series(planet, self.latitude, self.longitude, t) for planet in self.planets])
+        rates = samples[:, :, 3:].copy()
+        for row, planet in enumerate(self.planets):
+            if planet in _RATELESS_PLANETS:
+                rates[row, :-1, 1] = (
+                    ((np.diff(samples[row, :, 1]) + DEGREE_MAX / 2) % DEGREE_MAX - DEGREE_MAX / 2) * 86400 / self.step.total_seconds()
+                )
+                rates[row, -1, 1] = rates[row, -2, 1]
+
+        window = _LiveWindow(begin.timestamp(), begin.timestamp() + (count - 1) * self.step.total_seconds(), samples[:, :-1], rates[:, :-1])
+        with self._lock:
+            self._window = window
+            self._refreshes += 1
+
+    def get_positions(self, given_time: datetime | None = None) -> dict[Planets, PlanetPosition]:
+        """Return the tropical positions of the planets at an instant, like `get_planets_position`.
+
+        Instants inside the window are interpolated; others are computed directly. A refresh is
+        started in the background once less than `refresh_margin` of the window is left.
+
+        Args:
+            given_time (datetime | None, optional): The UTC instant. Defaults to the current time.
+
+        Returns:
+            dict[Planets, PlanetPosition]: The position of every planet served.
+
+        """
+        now = self._clock()
+        when = given_time if given_time is not None else now
+        if self._window is None:
+            self.refresh(now)
+
+        window = self._window
+        seconds = when.timestamp()
+        if window is None or not window.start <= seconds <= window.end:
+            with self._lock:
+                self._misses += 1
+            if now.timestamp() <= seconds <= now.timestamp() + self.horizon.total_seconds():
+                self._refresh_in_background()
+            return get_planets_position(list(self.planets), self.latitude, self.longitude, when)
+
+        with self._lock:
+            self._hits += 1
+        if window.end - now.timestamp() < self.refresh_margin.total_seconds():
+            self._refresh_in_background()
+
+        return self._interpolate(window, seconds)
+
+    def wait(self) -> None:
+        """Block until a background refresh in progress has finished."""
+        refreshing = self._refreshing
+        if refreshing is not None:
+            refreshing.join()
+
+    def _refresh_in_background(self) -> None:
+        """Start a refresh thread unless one is already running."""
+        with self._lock:
+            if self._refreshing is not None and self._refreshing.is_alive():
+                return
+            self._refreshing = threading.Thread(target=self.refresh, name="live-chart-refresh", daemon=True)
+            self._refreshing.start()
+
+    def _interpolate(self, window: _LiveWindow, seconds: float) -> dict[Planets, PlanetPosition]:
+        """Move the sample before an instant forward by its rates."""
+        offset = seconds - window.start
+        sample = min(int(offset // self.step.total_seconds()), window.positions.shape[1] - 1)
+        days = (offset - sample * self.step.total_seconds()) / 86400
+
+        positions = window.positions[:, sample].copy()
+        positions[:, :3] += window.rates[:, sample] * days
+        positions[:, 1] %= DEGREE_MAX
+        for row, planet in enumerate(self.planets):
+            if planet in _RATELESS_PLANETS:
+                positions[row, 3:] = 0.0
+
+        return {planet: PlanetPosition(*(float(value) for value in positions[row])) for row, planet in enumerate(self.planets)}
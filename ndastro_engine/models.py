@@ -1,7 +1,10 @@
 """Models used in ndastro_engine module."""
 
+from datetime import datetime, timedelta
 from typing import NamedTuple
 
+from ndastro_engine.enums import Aspects, Granularity, Karanams, Natchaththirams, Planets, Rasis, Thithis, Yogams
+
 
 class PlanetPosition(NamedTuple):
     """A named tuple representing the position and speed of a planet.
@@ -22,3 +25,134 @@ class PlanetPosition(NamedTuple):
     speed_latitude: float
     speed_longitude: float
     speed_distance: float
+
+
+class Ingress(NamedTuple):
+    """A named tuple representing a planet crossing a boundary of the sidereal zodiac.
+
+    Attributes:
+        time (datetime): The UTC datetime of the crossing.
+        planet (Planets): The planet crossing the boundary.
+        granularity (Granularity): The division of the zodiac the boundary belongs to.
+        from_division (int): The number of the division being left, as given by `Granularity.number`.
+        to_division (int): The number of the division being entered, as given by `Granularity.number`.
+        retrograde (bool): True if the boundary is crossed backwards (into the previous division).
+
+    """
+
+    time: datetime
+    planet: Planets
+    granularity: Granularity
+    from_division: int
+    to_division: int
+    retrograde: bool
+
+
+class Panchang(NamedTuple):
+    """A named tuple representing the five limbs of the panchangam at an instant.
+
+    Attributes:
+        thithi (Thithis): The lunar day, from the elongation of the Moon from the Sun.
+        natchaththiram (Natchaththirams): The nakshatra of the sidereal Moon.
+        yogam (Yogams): The nithya yogam, from the sum of the sidereal Sun and Moon.
+        karanam (Karanams): The half-thithi.
+        vaaram (Planets): The lord of the weekday, which begins at sunrise.
+
+    """
+
+    thithi: Thithis
+    natchaththiram: Natchaththirams
+    yogam: Yogams
+    karanam: Karanams
+    vaaram: Planets
+
+
+class PanchangEvent(NamedTuple):
+    """A named tuple representing the end of one limb of the panchangam and the start of the next.
+
+    Attributes:
+        time (datetime): The UTC datetime of the change.
+        element (str): The name of the changing `Panchang` field.
+        ended (Thithis | Natchaththirams | Yogams | Karanams | Planets): The value that ends.
+        started (Thithis | Natchaththirams | Yogams | Karanams | Planets): The value that starts.
+
+    """
+
+    time: datetime
+    element: str
+    ended: Thithis | Natchaththirams | Yogams | Karanams | Planets
+    started: Thithis | Natchaththirams | Yogams | Karanams | Planets
+
+
+class City(NamedTuple):
+    """A named tuple representing a place calendars are generated for.
+
+    Attributes:
+        name (str): The display name of the city.
+        latitude (float): The latitude of the city in decimal degrees.
+        longitude (float): The longitude of the city in decimal degrees.
+
+    """
+
+    name: str
+    latitude: float
+    longitude: float
+
+
+class AspectEvent(NamedTuple):
+    """A named tuple representing the moment an aspect between two planets is exact.
+
+    Attributes:
+        time (datetime): The UTC datetime at which the aspect is exact.
+        planet_a (Planets): The aspecting planet.
+        planet_b (Planets): The aspected planet.
+        aspect (Aspects): The aspect, counted forward from `planet_a`.
+
+    """
+
+    time: datetime
+    planet_a: Planets
+    planet_b: Planets
+    aspect: Aspects
+
+
+class MuhurtaCriteria(NamedTuple):
+    """A named tuple representing the conditions an auspicious window must meet.
+
+    Attributes:
+        thithis (tuple[Thithis, ...] | None): The allowed thithis, or None for any.
+        natchaththirams (tuple[Natchaththirams, ...] | None): The allowed natchaththirams, or None for any.
+        vaarams (tuple[Planets, ...] | None): The lords of the allowed weekdays, or None for any.
+        lagnas (tuple[Rasis, ...] | None): The allowed rasis of the ascendant, or None for any.
+        avoid_retrograde (tuple[Planets, ...]): The planets that must not be retrograde.
+        min_duration (timedelta): The shortest window worth reporting.
+
+    """
+
+    thithis: tuple[Thithis, ...] | None = None
+    natchaththirams: tuple[Natchaththirams, ...] | None = None
+    vaarams: tuple[Planets, ...] | None = None
+    lagnas: tuple[Rasis, ...] | None = None
+    avoid_retrograde: tuple[Planets, ...] = (Planets.MARS, Planets.SATURN)
+    min_duration: timedelta = timedelta(minutes=0)
+
+
+class MuhurtaWindow(NamedTuple):
+    """A named tuple representing a window meeting every condition of a muhurta search.
+
+    Attributes:
+        start (datetime): The UTC start of the window.
+        end (datetime): The UTC end of the window.
+        thithi (Thithis): The thithi at the start of the window.
+        natchaththiram (Natchaththirams): The natchaththiram at the start of the window.
+        vaaram (Planets): The lord of the weekday at the start of the window.
+        lagna (Rasis | None): The rasi of the ascendant at the start of the window, if lagnas were searched.
+
+    """
+
+    start: datetime
+    end: datetime
+    thithi: Thithis
+    natchaththiram: Natchaththirams
+    vaaram: Planets
+    lagna: Rasis | None
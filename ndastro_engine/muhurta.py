@@ -0,0 +1,227 @@
+"""Muhurta (auspicious window) search.
+
+This module finds the windows of a date range that meet every condition of a
+`MuhurtaCriteria`, checking the conditions from the cheapest to the most expensive so that
+each stage only looks inside the windows that survived the previous one:
+- Thithi, natchaththiram and weekday: read from the panchangam event timeline, searched once
+  for the whole range or reused from a precomputed timeline
+- Retrograde planets: one coarse `find_discrete` search packing every planet in a bitmask,
+  only over the span of the surviving windows
+- Lagna: the ascendant rasi, which changes every two hours or so, searched only inside the
+  surviving windows
+
+The windows are returned ranked, longest first.
+"""
+
+from datetime import datetime
+from itertools import pairwise
+from typing import TYPE_CHECKING, cast
+
+import numpy as np
+from skyfield.almanac import find_discrete
+
+from ndastro_engine.core import get_planet_position_series, ts
+from ndastro_engine.enums import Granularity, Natchaththirams, Planets, Rasis, Thithis
+from ndastro_engine.ingress import IngressFunction, find_ingresses
+from ndastro_engine.models import MuhurtaCriteria, MuhurtaWindow, Panchang, PanchangEvent
+from ndastro_engine.panchang import find_panchang_events, get_panchang
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+    from skyfield.timelib import Time
+
+# Slow planets station for weeks, so a one day grid brackets every retrograde period.
+RETROGRADE_STEP_DAYS = 1.0
+
+# The panchangam limbs checked by the first stage, with the criteria field holding their allowed values.
+_PANCHANG_CONDITIONS = (("thithi", "thithis"), ("natchaththiram", "natchaththirams"), ("vaaram", "vaarams"))
+_PANCHANG_LIMBS = tuple(limb for limb, _ in _PANCHANG_CONDITIONS)
+
+
+class RetrogradeMaskFunction:
+    """A discrete function whose bit i is set while the i-th planet is retrograde.
+
+    Attributes:
+        planets (tuple[Planets, ...]): The planets, in bit order.
+        latitude (float): The latitude of the observer's location.
+        longitude (float): The longitude of the observer's location.
+        step_days (float): The grid step used by `find_discrete` for the coarse scan.
+
+    """
+
+    def __init__(self, planets: "Sequence[Planets]", latitude: float, longitude: float) -> None:
+        """Initialize a new instance of the retrograde mask function.
+
+        Args:
+            planets (Sequence[Planets]): The planets, in bit order.
+            latitude (float): The latitude coordinate.
+            longitude (float): The longitude coordinate.
+
+        """
+        self.planets = tuple(planets)
+        self.latitude = latitude
+        self.longitude = longitude
+        self.step_days = RETROGRADE_STEP_DAYS
+
+    def __call__(self, t: "Time") -> "NDArray[np.int64]":
+        """Return the retrograde bitmask at every instant of `t`.
+
+        Args:
+            t (Time): The (vector) time at which to evaluate the planets.
+
+        Returns:
+            NDArray[np.int64]: The sum of 2**i over the retrograde planets.
+
+        """
+        mask = np.zeros(len(np.atleast_1d(t.tt)), dtype=np.int64)
+        for bit, planet in enumerate(self.planets):
+            mask |= (get_planet_position_series(planet, self.latitude, self.longitude, t)[:, 4] < 0).astype(np.int64) << bit
+
+        return mask
+
+
+def find_muhurtas(  # noqa: PLR0913
+    start_date: datetime,
+    end_date: datetime,
+    lat: float,
+    lon: float,
+    criteria: MuhurtaCriteria,
+    *,
+    events: "list[PanchangEvent] | None" = None,
+) -> list[MuhurtaWindow]:
+    """Find the windows of a date range meeting every condition of the criteria.
+
+    Args:
+        start_date (datetime): The start of the search range.
+        end_date (datetime): The end of the search range.
+        lat (float): The latitude of the observer in decimal degrees.
+        lon (float): The longitude of the observer in decimal degrees.
+        criteria (MuhurtaCriteria): The conditions to meet.
+        events (list[PanchangEvent] | None, optional): A precomputed panchangam timeline covering the range,
+            as returned by `find_panchang_events`. Defaults to searching it.
+
+    Returns:
+        list[MuhurtaWindow]: The windows at least `criteria.min_duration` long, longest first.
+
+    """
+    timeline = events if events is not None else find_panchang_events(start_date, end_date, lat, lon)
+    initial = get_panchang(lat, lon, start_date)
+    changes = sorted(
+        (event for event in timeline if event.element in _PANCHANG_LIMBS and start_date < event.time < end_date), key=lambda event: event.time
+    )
+    windows = _get_panchang_windows(start_date, end_date, initial, criteria, changes)
+
+    if windows and criteria.avoid_retrograde:
+        windows = _remove_retrograde(windows, lat, lon, criteria.avoid_retrograde)
+
+    if windows and criteria.lagnas is not None:
+        windows = _split_by_lagna(windows, lat, lon, criteria.lagnas)
+
+    found = _label([window for window in windows if window.end - window.start >= criteria.min_duration], initial, changes)
+
+    return sorted(found, key=lambda window: (window.start - window.end, window.start))
+
+
+def _get_panchang_windows(
+    start_date: datetime,
+    end_date: datetime,
+    initial: Panchang,
+    criteria: MuhurtaCriteria,
+    changes: "list[PanchangEvent]",
+) -> list[MuhurtaWindow]:
+    """Return the maximal windows in which the thithi, natchaththiram and weekday are all allowed."""
+    state = {limb: getattr(initial, limb) for limb in _PANCHANG_LIMBS}
+
+    def allowed() -> bool:
+        return all(getattr(criteria, field) is None or state[limb] in getattr(criteria, field) for limb, field in _PANCHANG_CONDITIONS)
+
+    windows: list[MuhurtaWindow] = []
+    window_start = start_date if allowed() else None
+    for event in changes:
+        was_allowed = window_start is not None
+        state[event.element] = event.started
+        if was_allowed and not allowed():
+            windows.append(MuhurtaWindow(cast("datetime", window_start), event.time, initial.thithi, initial.natchaththiram, initial.vaaram, None))
+            window_start = None
+        elif not was_allowed and allowed():
+            window_start = event.time
+    if window_start is not None:
+        windows.append(MuhurtaWindow(window_start, end_date, initial.thithi, initial.natchaththiram, initial.vaaram, None))
+
+    return windows
+
+
+def _remove_retrograde(windows: list[MuhurtaWindow], lat: float, lon: float, planets: "Sequence[Planets]") -> list[MuhurtaWindow]:
+    """Cut the periods in which any of the planets is retrograde out of the windows."""
+    function = RetrogradeMaskFunction(planets, lat, lon)
+    t0 = ts.utc(min(window.start for window in windows))
+    t1 = ts.utc(max(window.end for window in windows))
+    times, masks = find_discrete(t0, t1, function)
+
+    changes = [cast("datetime", cast("Time", t).utc_datetime()) for t in times]
+    direct = [int(function(t0)[0]) == 0, *(int(mask) == 0 for mask in masks)]
+
+    kept: list[MuhurtaWindow] = []
+    for window in windows:
+        # The direct stretches of the timeline overlapping the window.
+        edges = [window.start, *(change for change in changes if window.start < change < window.end), window.end]
+        first = sum(change <= window.start for change in changes)
+        for index, (piece_start, piece_end) in enumerate(pairwise(edges)):
+            if direct[first + index]:
+                kept.append(window._replace(start=piece_start, end=piece_end))
+
+    return _merge(kept)
+
+
+def _split_by_lagna(windows: list[MuhurtaWindow], lat: float, lon: float, lagnas: "Sequence[Rasis]") -> list[MuhurtaWindow]:
+    """Keep the parts of the windows in which the ascendant is in one of the allowed rasis."""
+    function = IngressFunction(Planets.ASCENDANT, lat, lon, granularity=Granularity.RASI)
+    kept: list[MuhurtaWindow] = []
+    for window in windows:
+        lagna = Rasis(Granularity.RASI.number(int(function(ts.utc(window.start))[0])))
+        piece_start = window.start
+        for ingress in [*find_ingresses(window.start, window.end, Planets.ASCENDANT, lat, lon, granularity=Granularity.RASI), None]:
+            piece_end = ingress.time if ingress is not None else window.end
+            if lagna in lagnas and piece_start < piece_end:
+                kept.append(window._replace(start=piece_start, end=piece_end, lagna=lagna))
+            if ingress is not None:
+                lagna = Rasis(ingress.to_division)
+                piece_start = ingress.time
+
+    return kept
+
+
+def _merge(windows: list[MuhurtaWindow]) -> list[MuhurtaWindow]:
+    """Drop empty windows and join the ones that touch."""
+    merged: list[MuhurtaWindow] = []
+    for window in windows:
+        if window.start >= window.end:
+            continue
+        if merged and merged[-1].end >= window.start:
+            merged[-1] = merged[-1]._replace(end=max(merged[-1].end, window.end))
+        else:
+            merged.append(window)
+
+    return merged
+
+
+def _label(windows: list[MuhurtaWindow], initial: Panchang, changes: "list[PanchangEvent]") -> list[MuhurtaWindow]:
+    """Set the thithi, natchaththiram and weekday of every window to the ones in force at its start."""
+    state = {limb: getattr(initial, limb) for limb in _PANCHANG_LIMBS}
+    labelled: list[MuhurtaWindow] = []
+    position = 0
+    for window in sorted(windows, key=lambda window: window.start):
+        while position < len(changes) and changes[position].time <= window.start:
+            state[changes[position].element] = changes[position].started
+            position += 1
+        labelled.append(
+            window._replace(
+                thithi=cast("Thithis", state["thithi"]),
+                natchaththiram=cast("Natchaththirams", state["natchaththiram"]),
+                vaaram=cast("Planets", state["vaaram"]),
+            )
+        )
+
+    return labelled
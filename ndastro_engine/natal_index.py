@@ -0,0 +1,268 @@
+"""Inverted index of users keyed by the rasi and natchaththiram of their natal Moon.
+
+This module provides the NatalMoonIndex class. Most transit alerts (chandrashtama, Sade
+Sati, tara bala) depend only on the rasi or natchaththiram of the natal Moon, so a transit
+query only needs the users of a few buckets instead of a scan of the whole natal store.
+
+The bulk of the index is kept in compressed sparse row form: the user IDs sorted by bucket
+and the offset of every bucket. Inserts and deletes go to small per-bucket pending sets and
+tombstones that are merged by `compact`. Saved indexes are plain `.npy` files that are loaded memory
+mapped, so opening an index of millions of users does not read it into memory.
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, cast
+
+import numpy as np
+
+from ndastro_engine.constants import DEGREE_MAX
+from ndastro_engine.transit import get_natal_rasis_hit
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+# Version of the on-disk layout written by NatalMoonIndex.save.
+NATAL_INDEX_VERSION = 1
+
+_BUCKETS = {"rasi": 12, "natchaththiram": 27}
+
+
+class NatalMoonIndex:
+    """Users grouped by the `Rasis` and `Natchaththirams` values of their natal Moon.
+
+    Every user appears once; inserting a user that is already indexed moves it to the buckets
+    of the new longitude.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        empty = np.zeros(0, dtype=np.int64)
+        self._user_ids: NDArray[np.int64] = empty
+        self._offsets: dict[str, NDArray[np.int64]] = {name: np.zeros(count + 1, dtype=np.int64) for name, count in _BUCKETS.items()}
+        self._users: dict[str, NDArray[np.int64]] = dict.fromkeys(_BUCKETS, empty)
+        self._buckets: dict[str, NDArray[np.int8]] = dict.fromkeys(_BUCKETS, empty.astype(np.int8))
+        self._pending: dict[int, tuple[int, int]] = {}
+        # The pending users of every bucket, in insertion order, so a lookup only reads its own buckets.
+        self._pending_users: dict[str, dict[int, dict[int, None]]] = {name: {} for name in _BUCKETS}
+        self._deleted: set[int] = set()
+
+    def __len__(self) -> int:
+        """Return the number of users in the index."""
+        return len(self._user_ids) - len(self._deleted) + len(self._pending)
+
+    def __contains__(self, user_id: int) -> bool:
+        """Return True if the user is in the index."""
+        return user_id in self._pending or (self._in_base(user_id) and user_id not in self._deleted)
+
+    @classmethod
+    def build(cls, user_ids: "ArrayLike", moon_longitudes: "ArrayLike") -> "NatalMoonIndex":
+        """Build an index from the natal Moon longitudes of many users at once.
+
+        Args:
+            user_ids (ArrayLike): The unique ID of every user.
+            moon_longitudes (ArrayLike): The sidereal longitude of the natal Moon of every user, in degrees.
+
+        Returns:
+            NatalMoonIndex: The compacted index.
+
+        """
+        index = cls()
+        index._set_base(np.asarray(user_ids, dtype=np.int64), *_get_buckets(moon_longitudes))
+
+        return index
+
+    def insert(self, user_ids: "ArrayLike", moon_longitudes: "ArrayLike") -> None:
+        """Add users to the index, or move them if they are already indexed.
+
+        Args:
+            user_ids (ArrayLike): The IDs of the users.
+            moon_longitudes (ArrayLike): The sidereal longitude of the natal Moon of every user, in degrees.
+
+        """
+        ids = np.atleast_1d(np.asarray(user_ids, dtype=np.int64))
+        rasis, natchaththirams = _get_buckets(moon_longitudes)
+        for user_id, rasi, natchaththiram in zip(ids.tolist(), rasis.tolist(), natchaththirams.tolist(), strict=True):
+            if self._in_base(user_id):
+                self._deleted.add(user_id)
+            self._forget_pending(user_id)
+            self._pending[user_id] = (rasi, natchaththiram)
+            for name, bucket in zip(_BUCKETS, (rasi, natchaththiram), strict=True):
+                self._pending_users[name].setdefault(bucket, {})[user_id] = None
+
+    def delete(self, user_ids: "ArrayLike") -> None:
+        """Remove users from the index; unknown IDs are ignored.
+
+        Args:
+            user_ids (ArrayLike): The IDs of the users.
+
+        """
+        for user_id in np.atleast_1d(np.asarray(user_ids, dtype=np.int64)).tolist():
+            self._forget_pending(user_id)
+            if self._in_base(user_id):
+                self._deleted.add(user_id)
+
+    def compact(self) -> None:
+        """Merge pending inserts and deletes into the sorted bucket arrays."""
+        if not self._pending and not self._deleted:
+            return
+
+        live = np.ones(len(self._user_ids), dtype=np.bool_)
+        if self._deleted:
+            live = ~np.isin(self._user_ids, np.fromiter(self._deleted, dtype=np.int64, count=len(self._deleted)))
+        pending = np.array(list(self._pending.values()), dtype=np.int64).reshape(-1, 2)
+
+        ids = np.concatenate((self._user_ids[live], np.fromiter(self._pending, dtype=np.int64, count=len(self._pending))))
+        rasis = np.concatenate((self._buckets["rasi"][live].astype(np.int64), pending[:, 0]))
+        natchaththirams = np.concatenate((self._buckets["natchaththiram"][live].astype(np.int64), pending[:, 1]))
+
+        self._pending = {}
+        self._pending_users = {name: {} for name in _BUCKETS}
+        self._deleted = set()
+        self._set_base(ids, rasis, natchaththirams)
+
+    def users_in_rasis(self, rasis: Iterable[int]) -> "NDArray[np.int64]":
+        """Return the users whose natal Moon is in any of the given rasis.
+
+        Args:
+            rasis (Iterable[int]): The `Rasis` values to look up.
+
+        Returns:
+            NDArray[np.int64]: The user IDs, bucket by bucket.
+
+        """
+        return self._lookup("rasi", rasis)
+
+    def users_in_natchaththirams(self, natchaththirams: Iterable[int]) -> "NDArray[np.int64]":
+        """Return the users whose natal Moon is in any of the given natchaththirams.
+
+        Args:
+            natchaththirams (Iterable[int]): The `Natchaththirams` values to look up.
+
+        Returns:
+            NDArray[np.int64]: The user IDs, bucket by bucket.
+
+        """
+        return self._lookup("natchaththiram", natchaththirams)
+
+    def users_hit(self, transit_longitude: float, houses: Iterable[int]) -> "NDArray[np.int64]":
+        """Return the users for whom a transiting planet occupies the given houses from the natal Moon.
+
+        Args:
+            transit_longitude (float): The sidereal longitude of the transiting planet in degrees.
+            houses (Iterable[int]): The houses (1 to 12) counted from the natal Moon rasi.
+
+        Returns:
+            NDArray[np.int64]: The user IDs, bucket by bucket.
+
+        """
+        return self.users_in_rasis(get_natal_rasis_hit(transit_longitude, list(houses)))
+
+    def save(self, directory: str | Path) -> None:
+        """Compact the index and write it as `.npy` files in a directory.
+
+        Every file is written to a temporary file and moved into place, so an index loaded memory
+        mapped from the same directory can be saved back to it.
+
+        Args:
+            directory (str | Path): The destination directory, created if missing.
+
+        """
+        self.compact()
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        _save_array(path / "header.npy", np.array([NATAL_INDEX_VERSION], dtype=np.int64))
+        _save_array(path / "user_ids.npy", self._user_ids)
+        for name in _BUCKETS:
+            _save_array(path / f"{name}_buckets.npy", self._buckets[name])
+            _save_array(path / f"{name}_offsets.npy", self._offsets[name])
+            _save_array(path / f"{name}_users.npy", self._users[name])
+
+    @classmethod
+    def load(cls, directory: str | Path, *, mmap: bool = True) -> "NatalMoonIndex":
+        """Read an index written by `save`.
+
+        Args:
+            directory (str | Path): The source directory.
+            mmap (bool, optional): Whether to memory map the arrays instead of reading them. Defaults to True.
+
+        Returns:
+            NatalMoonIndex: The loaded index; inserts and deletes are kept in memory until the next `save`.
+
+        Raises:
+            ValueError: If the index was written with an unsupported layout version.
+
+        """
+        path = Path(directory)
+        version = int(np.load(path / "header.npy")[0])
+        if version != NATAL_INDEX_VERSION:
+            msg = f"Unsupported natal index version {version}, expected {NATAL_INDEX_VERSION}"
+            raise ValueError(msg)
+
+        mmap_mode: Literal["r"] | None = "r" if mmap else None
+        index = cls()
+        index._user_ids = np.load(path / "user_ids.npy", mmap_mode=mmap_mode)
+        for name in _BUCKETS:
+            index._buckets[name] = np.load(path / f"{name}_buckets.npy", mmap_mode=mmap_mode)
+            index._offsets[name] = np.load(path / f"{name}_offsets.npy", mmap_mode=mmap_mode)
+            index._users[name] = np.load(path / f"{name}_users.npy", mmap_mode=mmap_mode)
+
+        return index
+
+    def _set_base(self, user_ids: "NDArray[np.int64]", rasis: "NDArray[np.int64]", natchaththirams: "NDArray[np.int64]") -> None:
+        """Replace the compacted arrays with the given users and buckets."""
+        order = np.argsort(user_ids)
+        self._user_ids = user_ids[order]
+        for name, values in (("rasi", rasis[order]), ("natchaththiram", natchaththirams[order])):
+            self._buckets[name] = values.astype(np.int8)
+            # A stable sort keeps the users of each bucket in ascending ID order.
+            by_bucket = np.argsort(values, kind="stable")
+            self._users[name] = self._user_ids[by_bucket]
+            self._offsets[name] = np.concatenate(([0], np.cumsum(np.bincount(values, minlength=_BUCKETS[name] + 1)[1:])))
+
+    def _in_base(self, user_id: int) -> bool:
+        """Return True if the user is in the compacted arrays, deleted or not."""
+        position = int(np.searchsorted(self._user_ids, user_id))
+
+        return position < len(self._user_ids) and int(self._user_ids[position]) == user_id
+
+    def _forget_pending(self, user_id: int) -> None:
+        """Drop a pending insert of the user, if any, from its buckets."""
+        buckets = self._pending.pop(user_id, None)
+        if buckets is not None:
+            for name, bucket in zip(_BUCKETS, buckets, strict=True):
+                del self._pending_users[name][bucket][user_id]
+
+    def _bucket(self, name: str, bucket: int) -> "NDArray[np.int64]":
+        """Return the live users of one bucket, compacted users first."""
+        offsets = self._offsets[name]
+        users = np.asarray(self._users[name][offsets[bucket - 1] : offsets[bucket]])
+        if self._deleted:
+            users = users[~np.isin(users, np.fromiter(self._deleted, dtype=np.int64, count=len(self._deleted)))]
+        pending = self._pending_users[name].get(bucket)
+        if pending:
+            users = np.concatenate((users, np.fromiter(pending, dtype=np.int64, count=len(pending))))
+
+        return users
+
+    def _lookup(self, name: str, buckets: Iterable[int]) -> "NDArray[np.int64]":
+        """Return the live users of several buckets."""
+        parts = [self._bucket(name, int(bucket)) for bucket in buckets]
+
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+
+
+def _get_buckets(moon_longitudes: "ArrayLike") -> "tuple[NDArray[np.int64], NDArray[np.int64]]":
+    """Return the `Rasis` and `Natchaththirams` values of Moon longitudes."""
+    positions = np.atleast_1d(np.asarray(moon_longitudes, dtype=np.float64)) % DEGREE_MAX
+    rasis = np.floor(positions / (DEGREE_MAX / 12)).astype(np.int64) % 12 + 1
+    natchaththirams = np.floor(positions / (DEGREE_MAX / 27)).astype(np.int64) % 27 + 1
+
+    return cast("NDArray[np.int64]", rasis), cast("NDArray[np.int64]", natchaththirams)
+
+
+def _save_array(path: Path, array: "NDArray[np.generic]") -> None:
+    """Write an array to a `.npy` file through a temporary file, leaving any memory map of the old file valid."""
+    temporary = path.with_name(f"{path.stem}.tmp.npy")
+    np.save(temporary, array)
+    temporary.replace(path)
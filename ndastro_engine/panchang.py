@@ -0,0 +1,198 @@
+"""Panchangam calculation functions.
+
+This module computes the five limbs of the panchangam from the sidereal Sun and Moon:
+- Thithi: every 12° of elongation of the Moon from the Sun
+- Natchaththiram: every 13°20' of the sidereal Moon
+- Yogam: every 13°20' of the sum of the sidereal Sun and Moon
+- Karanam: every 6° of elongation (half a thithi)
+- Vaaram: the weekday, which begins at sunrise
+
+End times are found for all limbs at once: the Sun and Moon are evaluated together on one
+vectorized time grid, and every change of any limb is refined with Skyfield's `find_discrete`.
+"""
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, cast
+
+import numpy as np
+from skyfield.almanac import find_discrete
+
+from ndastro_engine.ayanamsa import get_sidereal_longitude_series
+from ndastro_engine.constants import DEGREE_MAX
+from ndastro_engine.core import get_observer, ts
+from ndastro_engine.enums import Karanams, Natchaththirams, Planets, Thithis, Yogams
+from ndastro_engine.karanam_enum import HALF_THITHIS
+from ndastro_engine.models import Panchang, PanchangEvent
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    from skyfield.timelib import Time
+
+KARANAM_SPAN = 6.0
+NATCHATHTHIRAM_SPAN = DEGREE_MAX / 27
+
+# Lords of the weekdays, indexed by `datetime.weekday()` (Monday is 0).
+WEEKDAY_LORDS = (Planets.MOON, Planets.MARS, Planets.MERCURY, Planets.JUPITER, Planets.VENUS, Planets.SATURN, Planets.SUN)
+
+# Thithi, natchaththiram and yogam all change at least every ~0.4 day, so a 0.2 day grid
+# brackets every change.
+PANCHANG_STEP_DAYS = 0.2
+
+
+class PanchangFunction:
+    """A discrete function encoding the karanam, natchaththiram and yogam in a single integer.
+
+    The thithi is half the karanam index, so every change of a limb changes the encoded value
+    and one `find_discrete` search refines all of them on a shared Sun/Moon evaluation grid.
+
+    Attributes:
+        latitude (float): The latitude of the observer's location.
+        longitude (float): The longitude of the observer's location.
+        step_days (float): The grid step used by `find_discrete` for the coarse scan.
+
+    """
+
+    def __init__(self, latitude: float, longitude: float) -> None:
+        """Initialize a new instance of the panchang function.
+
+        Args:
+            latitude (float): The latitude coordinate.
+            longitude (float): The longitude coordinate.
+
+        """
+        self.latitude = latitude
+        self.longitude = longitude
+        self.step_days = PANCHANG_STEP_DAYS
+
+    def __call__(self, t: "Time") -> "NDArray[np.int64]":
+        """Return the encoded limbs at every instant of `t`.
+
+        Args:
+            t (Time): The (vector) time at which to evaluate the Sun and Moon.
+
+        Returns:
+            NDArray[np.int64]: half_thithi + 60 * (natchaththiram + 27 * yogam), all 0-based.
+
+        """
+        half_thithi, natchaththiram, yogam = _get_panchang_indices(self.latitude, self.longitude, t)
+
+        return cast("NDArray[np.int64]", half_thithi + HALF_THITHIS * (natchaththiram + 27 * yogam))
+
+
+def get_panchang(lat: float, lon: float, given_time: datetime) -> Panchang:
+    """Calculate the panchangam for the given latitude, longitude, and datetime.
+
+    Args:
+        lat (float): The latitude of the observer in decimal degrees.
+        lon (float): The longitude of the observer in decimal degrees.
+        given_time (datetime): The datetime of the observation in UTC.
+
+    Returns:
+        Panchang: The thithi, natchaththiram, yogam, karanam and vaaram in force.
+
+    """
+    half_thithi, natchaththiram, yogam = _get_panchang_indices(lat, lon, ts.utc(given_time))
+    thithi, star, yoga, karanam = _to_limbs(int(half_thithi[0]), int(natchaththiram[0]), int(yogam[0]))
+
+    return Panchang(thithi, star, yoga, karanam, get_vaaram(lat, lon, given_time))
+
+
+def get_vaaram(lat: float, lon: float, given_time: datetime) -> Planets:
+    """Return the lord of the weekday in force, the weekday beginning at local sunrise.
+
+    Args:
+        lat (float): The latitude of the observer in decimal degrees.
+        lon (float): The longitude of the observer in decimal degrees.
+        given_time (datetime): The datetime of the observation in UTC.
+
+    Returns:
+        Planets: The lord of the weekday.
+
+    """
+    t0 = ts.utc(given_time - timedelta(days=1))
+    t1 = ts.utc(given_time)
+    times, events = find_discrete(t0, t1, get_observer(lat, lon).sunrise_function)
+
+    sunrises = [t for t, is_up in zip(times, events, strict=True) if is_up]
+    # Without a sunrise in the last day (polar day or night), fall back to the civil date.
+    day_start = cast("datetime", cast("Time", sunrises[-1]).utc_datetime()) if len(sunrises) > 0 else given_time
+
+    return _weekday_lord(day_start, lon)
+
+
+def find_panchang_events(start_date: datetime, end_date: datetime, lat: float, lon: float) -> list[PanchangEvent]:
+    """Find the end times of every limb of the panchangam within a date range.
+
+    Args:
+        start_date (datetime): The start of the search range.
+        end_date (datetime): The end of the search range.
+        lat (float): The latitude of the observer in decimal degrees.
+        lon (float): The longitude of the observer in decimal degrees.
+
+    Returns:
+        list[PanchangEvent]: The changes of thithi, natchaththiram, yogam, karanam and vaaram in chronological order.
+
+    """
+    function = PanchangFunction(lat, lon)
+    t0 = ts.utc(start_date)
+    t1 = ts.utc(end_date)
+
+    times, codes = find_discrete(t0, t1, function)
+
+    events: list[PanchangEvent] = []
+    previous = _decode(int(function(t0)[0]))
+    for t, code in zip(times, codes, strict=True):
+        time = cast("datetime", cast("Time", t).utc_datetime())
+        current = _decode(int(code))
+        events.extend(
+            PanchangEvent(time, element, ended, started)
+            for element, ended, started in zip(Panchang._fields, previous, current, strict=False)
+            if ended != started
+        )
+        previous = current
+
+    sunrise_times, is_up = find_discrete(t0, t1, get_observer(lat, lon).sunrise_function)
+    for t, rising in zip(sunrise_times, is_up, strict=True):
+        if rising:
+            time = cast("datetime", cast("Time", t).utc_datetime())
+            started = _weekday_lord(time, lon)
+            ended = WEEKDAY_LORDS[(WEEKDAY_LORDS.index(started) - 1) % len(WEEKDAY_LORDS)]
+            events.append(PanchangEvent(time, "vaaram", ended, started))
+
+    return sorted(events, key=lambda event: event.time)
+
+
+def _get_panchang_indices(lat: float, lon: float, t: "Time") -> "tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]":
+    """Return the 0-based half-thithi, natchaththiram and yogam at every instant of `t`."""
+    sun = get_sidereal_longitude_series(Planets.SUN, lat, lon, t)
+    moon = get_sidereal_longitude_series(Planets.MOON, lat, lon, t)
+
+    half_thithi = np.floor(((moon - sun) % DEGREE_MAX) / KARANAM_SPAN).astype(np.int64) % HALF_THITHIS
+    natchaththiram = np.floor(moon / NATCHATHTHIRAM_SPAN).astype(np.int64) % 27
+    yogam = np.floor(((sun + moon) % DEGREE_MAX) / NATCHATHTHIRAM_SPAN).astype(np.int64) % 27
+
+    return half_thithi, natchaththiram, yogam
+
+
+def _decode(code: int) -> tuple[Thithis | Natchaththirams | Yogams | Karanams, ...]:
+    """Split a value of `PanchangFunction` back into its limbs, in the field order of `Panchang`."""
+    half_thithi = code % HALF_THITHIS
+    natchaththiram = code // HALF_THITHIS % 27
+    yogam = code // (HALF_THITHIS * 27)
+
+    return _to_limbs(half_thithi, natchaththiram, yogam)
+
+
+def _to_limbs(half_thithi: int, natchaththiram: int, yogam: int) -> tuple[Thithis, Natchaththirams, Yogams, Karanams]:
+    """Convert 0-based indices to the thithi, natchaththiram, yogam and karanam enums."""
+    return (
+        Thithis(half_thithi // 2 + 1),
+        Natchaththirams(natchaththiram + 1),
+        Yogams(yogam + 1),
+        Karanams.from_half_thithi(half_thithi),
+    )
+
+
+def _weekday_lord(time: datetime, lon: float) -> Planets:
+    """Return the lord of the weekday of the local mean date at the given UTC time."""
+    return WEEKDAY_LORDS[(time + timedelta(hours=lon / 15)).weekday()]
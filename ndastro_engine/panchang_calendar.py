@@ -0,0 +1,171 @@
+"""Bulk generation of yearly panchangam calendars.
+
+This module produces one row per city and day with the sunrise, sunset and the panchangam
+limbs in force at sunrise together with their end times:
+- generate_rows, generate_year_rows: the rows of one city for a date range or a year, computed in-process
+- generate_calendar: the rows of many cities and years, sharded by (city, year) across a process pool
+- write_jsonl: incremental writing of a row stream to a JSON Lines file
+
+Shards are submitted through a bounded window so that memory stays flat however many cities
+are generated.
+"""
+
+import json
+import os
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+from skyfield.almanac import find_discrete
+
+from ndastro_engine.core import get_observer, ts
+from ndastro_engine.models import City
+from ndastro_engine.panchang import WEEKDAY_LORDS, find_panchang_events, get_panchang
+
+if TYPE_CHECKING:
+    from skyfield.timelib import Time
+
+# The limbs whose value at sunrise and end time are reported in each row.
+ROW_LIMBS = ("thithi", "natchaththiram", "yogam", "karanam")
+
+
+def generate_year_rows(city: City, year: int) -> Iterator[dict[str, str]]:
+    """Generate the daily panchangam rows of a city for a calendar year.
+
+    Args:
+        city (City): The city to generate the calendar for.
+        year (int): The calendar year.
+
+    Yields:
+        dict[str, str]: One row per day of the year, as produced by `generate_rows`.
+
+    """
+    yield from generate_rows(city, date(year, 1, 1), date(year + 1, 1, 1))
+
+
+def generate_rows(city: City, start: date, end: date) -> Iterator[dict[str, str]]:
+    """Generate the daily panchangam rows of a city for a range of dates.
+
+    The panchangam events of the whole range are searched once; each day then only needs its
+    sunrise and sunset, and the limbs at sunrise are looked up in the event timeline.
+
+    Args:
+        city (City): The city to generate the calendar for.
+        start (date): The first day of the range.
+        end (date): The day after the last day of the range.
+
+    Yields:
+        dict[str, str]: One row per day with the city, date, sunrise, sunset, vaaram, and every
+            limb in `ROW_LIMBS` with its end time, as JSON-ready strings. The sunrise and sunset are
+            those of the local mean date of the city.
+
+    Raises:
+        ValueError: If the sun does not rise or set on a day of the range (polar day or night).
+
+    """
+    search_start = datetime(start.year, start.month, start.day, tzinfo=timezone.utc) - timedelta(days=1)
+    # Limbs in force at the last sunrise of the range can last a day or two beyond it.
+    search_end = datetime(end.year, end.month, end.day, tzinfo=timezone.utc) + timedelta(days=3)
+
+    initial = get_panchang(city.latitude, city.longitude, search_start)
+    timelines: dict[str, tuple[list[datetime], list[object]]] = {limb: ([], [getattr(initial, limb)]) for limb in ROW_LIMBS}
+    for event in find_panchang_events(search_start, search_end, city.latitude, city.longitude):
+        if event.element in timelines:
+            times, values = timelines[event.element]
+            times.append(event.time)
+            values.append(event.started)
+
+    day = start
+    while day < end:
+        sunrise, sunset = _get_local_sunrise_sunset(city, day)
+        row = {
+            "city": city.name,
+            "date": day.isoformat(),
+            "sunrise": sunrise.isoformat(),
+            "sunset": sunset.isoformat(),
+            "vaaram": WEEKDAY_LORDS[day.weekday()].name,
+        }
+        for limb in ROW_LIMBS:
+            times, values = timelines[limb]
+            position = bisect_right(times, sunrise)
+            row[limb] = str(values[position])
+            row[f"{limb}_end"] = times[position].isoformat() if position < len(times) else ""
+
+        yield row
+        day += timedelta(days=1)
+
+
+def generate_calendar(cities: Iterable[City], years: Iterable[int], max_workers: int | None = None) -> Iterator[dict[str, str]]:
+    """Generate the daily panchangam rows of many cities and years in parallel.
+
+    Every (city, year) pair is a shard computed by `generate_year_rows` in a worker process.
+    At most twice as many shards as workers are in flight, and rows are yielded in the order
+    of the shards, so memory stays bounded by the window rather than by the number of cities.
+
+    Args:
+        cities (Iterable[City]): The cities to generate; consumed lazily.
+        years (Iterable[int]): The calendar years to generate for every city.
+        max_workers (int | None, optional): The number of worker processes. Defaults to the number of CPUs.
+
+    Yields:
+        dict[str, str]: The rows of every shard, shard by shard.
+
+    """
+    year_list = list(years)
+    workers = max_workers if max_workers is not None else os.cpu_count() or 1
+    window = 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[list[dict[str, str]]]] = deque()
+        for city in cities:
+            for year in year_list:
+                pending.append(executor.submit(_generate_shard, city, year))
+                if len(pending) >= window:
+                    yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def write_jsonl(rows: Iterable[dict[str, str]], path: str | Path) -> int:
+    """Write rows to a JSON Lines file as they are produced.
+
+    Args:
+        rows (Iterable[dict[str, str]]): The rows to write, typically from `generate_calendar`.
+        path (str | Path): The destination file, overwritten if it exists.
+
+    Returns:
+        int: The number of rows written.
+
+    """
+    count = 0
+    with Path(path).open("w", encoding="utf-8") as file:
+        for row in rows:
+            file.write(json.dumps(row, ensure_ascii=False))
+            file.write("\n")
+            count += 1
+
+    return count
+
+
+def _generate_shard(city: City, year: int) -> list[dict[str, str]]:
+    """Compute the rows of one (city, year) shard in a worker process."""
+    return list(generate_year_rows(city, year))
+
+
+def _get_local_sunrise_sunset(city: City, day: date) -> tuple[datetime, datetime]:
+    """Return the UTC sunrise and sunset of the local mean date of a city, which begins at its local midnight."""
+    midnight = datetime(day.year, day.month, day.day, tzinfo=timezone.utc) - timedelta(hours=city.longitude / 15)
+    function = get_observer(city.latitude, city.longitude).sunrise_function
+    times, is_up = find_discrete(ts.utc(midnight), ts.utc(midnight + timedelta(days=1)), function)
+
+    rises = [t for t, rising in zip(times, is_up, strict=True) if rising]
+    sets = [t for t, rising in zip(times, is_up, strict=True) if not rising]
+    if len(rises) == 0 or len(sets) == 0:
+        msg = f"The sun does not both rise and set in {city.name} on {day.isoformat()}"
+        raise ValueError(msg)
+
+    return cast("datetime", cast("Time", rises[0]).utc_datetime()), cast("datetime", cast("Time", sets[0]).utc_datetime())
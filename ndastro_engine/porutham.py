@@ -0,0 +1,257 @@
+"""Marriage compatibility (porutham) of natal Moons, for whole candidate sets.
+
+This module scores the ten poruthams between brides and grooms from the natchaththiram and
+rasi of their natal Moons:
+- Natchaththiram poruthams: dhinam, ganam, mahendhram, sthree dheergam, yoni, rajju and vedhai
+- Rasi poruthams: rasi, rasi adhipathi and vasiyam
+
+Every porutham depends only on the two natchaththirams or the two rasis, so the results are
+precomputed once as 27 x 27 and 12 x 12 bitmask tables and scoring is a fancy index into them.
+Top-k matching goes further: a person is fully described by one of the 27 x 12 (natchaththiram,
+rasi) keys, so candidates are ranked once per key and never as a full N x M matrix.
+"""
+
+from typing import NamedTuple, cast
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ndastro_engine.enums import Planets, Poruthams, Rasis
+
+# Gana of every natchaththiram: 0 deva, 1 manushya, 2 rakshasa.
+GANAMS = (0, 1, 2, 1, 0, 1, 0, 0, 2, 2, 1, 1, 0, 2, 0, 2, 0, 2, 2, 1, 1, 0, 2, 2, 1, 1, 0)
+
+# Yoni (animal) of every natchaththiram, and the pairs of animals that are enemies.
+YONIS = (
+    "horse", "elephant", "goat", "serpent", "serpent", "dog", "cat", "goat", "cat",
+    "rat", "rat", "cow", "buffalo", "tiger", "buffalo", "tiger", "deer", "deer",
+    "dog", "monkey", "mongoose", "monkey", "lion", "horse", "lion", "cow", "elephant",
+)  # fmt: skip
+ENEMY_YONIS = (
+    ("horse", "buffalo"),
+    ("elephant", "lion"),
+    ("goat", "monkey"),
+    ("serpent", "mongoose"),
+    ("dog", "deer"),
+    ("cat", "rat"),
+    ("cow", "tiger"),
+)
+
+# Rajju of every natchaththiram: 0 paadha, 1 thodai, 2 udhara, 3 kanta, 4 siro.
+RAJJUS = tuple((0, 1, 2, 3, 4, 3, 2, 1, 0)[index % 9] for index in range(27))
+
+# Natchaththirams (by value) that are in vedhai with each other.
+VEDHAI_GROUPS = (
+    (1, 18), (2, 17), (3, 16), (4, 15), (6, 22), (7, 21), (8, 20),
+    (9, 19), (10, 27), (11, 26), (12, 25), (13, 24), (5, 14, 23),
+)  # fmt: skip
+
+# Rasis (by value) that are vasiyam to each rasi.
+VASIYAMS = {
+    Rasis.ARIES: (Rasis.LEO, Rasis.SCORPIO),
+    Rasis.TAURUS: (Rasis.CANCER, Rasis.LIBRA),
+    Rasis.GEMINI: (Rasis.VIRGO,),
+    Rasis.CANCER: (Rasis.SCORPIO, Rasis.SAGITTARIUS),
+    Rasis.LEO: (Rasis.LIBRA,),
+    Rasis.VIRGO: (Rasis.GEMINI, Rasis.PISCES),
+    Rasis.LIBRA: (Rasis.VIRGO, Rasis.CAPRICORN),
+    Rasis.SCORPIO: (Rasis.CANCER,),
+    Rasis.SAGITTARIUS: (Rasis.PISCES,),
+    Rasis.CAPRICORN: (Rasis.ARIES, Rasis.AQUARIUS),
+    Rasis.AQUARIUS: (Rasis.ARIES,),
+    Rasis.PISCES: (Rasis.CAPRICORN,),
+}
+
+# Natural enemies of every rasi lord.
+PLANET_ENEMIES = {
+    Planets.SUN: (Planets.VENUS, Planets.SATURN),
+    Planets.MOON: (),
+    Planets.MARS: (Planets.MERCURY,),
+    Planets.MERCURY: (Planets.MOON,),
+    Planets.JUPITER: (Planets.MERCURY, Planets.VENUS),
+    Planets.VENUS: (Planets.SUN, Planets.MOON),
+    Planets.SATURN: (Planets.SUN, Planets.MOON, Planets.MARS),
+}
+
+# Poruthams that a match must have by default to be ranked at all.
+REQUIRED_PORUTHAMS = (Poruthams.RAJJU, Poruthams.VEDHAI)
+
+# Number of (natchaththiram, rasi) keys; key = natchaththiram * 13 + rasi, with 0 unused in both.
+_KEYS = 28 * 13
+
+
+class PoruthamMatches(NamedTuple):
+    """The best matches of every person, best first.
+
+    Attributes:
+        matches (NDArray[np.int64]): The positions of the matched candidates, of shape (n_people, k), padded with -1.
+        scores (NDArray[np.int8]): The number of poruthams of every match, of the same shape, padded with -1.
+
+    """
+
+    matches: NDArray[np.int64]
+    scores: NDArray[np.int8]
+
+
+def get_poruthams(
+    bride_natchaththirams: ArrayLike,
+    bride_rasis: ArrayLike,
+    groom_natchaththirams: ArrayLike,
+    groom_rasis: ArrayLike,
+) -> NDArray[np.int16]:
+    """Return the poruthams that agree between brides and grooms, as bitmasks.
+
+    The arguments are broadcast together, so one bride can be checked against many grooms or
+    a whole (n, 1) column of brides against a (1, m) row of grooms.
+
+    Args:
+        bride_natchaththirams (ArrayLike): The `Natchaththirams` values of the brides' Moons.
+        bride_rasis (ArrayLike): The `Rasis` values of the brides' Moons.
+        groom_natchaththirams (ArrayLike): The `Natchaththirams` values of the grooms' Moons.
+        groom_rasis (ArrayLike): The `Rasis` values of the grooms' Moons.
+
+    Returns:
+        NDArray[np.int16]: The sum of `Poruthams.bit` over the poruthams that agree.
+
+    """
+    bride_stars, groom_stars = np.asarray(bride_natchaththirams), np.asarray(groom_natchaththirams)
+
+    return cast("NDArray[np.int16]", _STAR_TABLE[bride_stars, groom_stars] | _RASI_TABLE[np.asarray(bride_rasis), np.asarray(groom_rasis)])
+
+
+def get_porutham_scores(
+    bride_natchaththirams: ArrayLike,
+    bride_rasis: ArrayLike,
+    groom_natchaththirams: ArrayLike,
+    groom_rasis: ArrayLike,
+) -> NDArray[np.int8]:
+    """Return the number of poruthams (0 to 10) that agree between brides and grooms.
+
+    Args:
+        bride_natchaththirams (ArrayLike): The `Natchaththirams` values of the brides' Moons.
+        bride_rasis (ArrayLike): The `Rasis` values of the brides' Moons.
+        groom_natchaththirams (ArrayLike): The `Natchaththirams` values of the grooms' Moons.
+        groom_rasis (ArrayLike): The `Rasis` values of the grooms' Moons.
+
+    Returns:
+        NDArray[np.int8]: The porutham counts, broadcast like `get_poruthams`.
+
+    """
+    return cast("NDArray[np.int8]", _POPCOUNT[get_poruthams(bride_natchaththirams, bride_rasis, groom_natchaththirams, groom_rasis)])
+
+
+def get_top_matches(  # noqa: PLR0913
+    bride_natchaththirams: ArrayLike,
+    bride_rasis: ArrayLike,
+    groom_natchaththirams: ArrayLike,
+    groom_rasis: ArrayLike,
+    k: int,
+    *,
+    required: tuple[Poruthams, ...] = REQUIRED_PORUTHAMS,
+    per_groom: bool = False,
+) -> PoruthamMatches:
+    """Return the k best grooms of every bride (or brides of every groom).
+
+    Candidates are ranked by porutham count, then by position. Matches missing a required
+    porutham are never returned.
+
+    Args:
+        bride_natchaththirams (ArrayLike): The `Natchaththirams` values of the brides' Moons.
+        bride_rasis (ArrayLike): The `Rasis` values of the brides' Moons.
+        groom_natchaththirams (ArrayLike): The `Natchaththirams` values of the grooms' Moons.
+        groom_rasis (ArrayLike): The `Rasis` values of the grooms' Moons.
+        k (int): The number of matches per person.
+        required (tuple[Poruthams, ...], optional): The poruthams every match must have. Defaults to REQUIRED_PORUTHAMS.
+        per_groom (bool, optional): Rank brides for every groom instead of grooms for every bride. Defaults to False.
+
+    Returns:
+        PoruthamMatches: The positions and scores of the matches, one row per bride (or groom).
+
+    """
+    bride_keys = _get_keys(bride_natchaththirams, bride_rasis)
+    groom_keys = _get_keys(groom_natchaththirams, groom_rasis)
+    masks = _KEY_TABLE if not per_groom else _KEY_TABLE.T
+    row_keys, column_keys = (bride_keys, groom_keys) if not per_groom else (groom_keys, bride_keys)
+
+    required_bits = sum(porutham.bit for porutham in required)
+    key_scores = np.where((masks & required_bits) == required_bits, _POPCOUNT[masks], -1).astype(np.int8)
+
+    # The candidates grouped by key, each group in ascending position.
+    column_order = np.argsort(column_keys, kind="stable")
+    column_offsets = np.concatenate(([0], np.cumsum(np.bincount(column_keys, minlength=_KEYS))))
+
+    unique_keys, inverse = np.unique(row_keys, return_inverse=True)
+    matches = np.full((len(unique_keys), k), -1, dtype=np.int64)
+    scores = np.full((len(unique_keys), k), -1, dtype=np.int8)
+    for row, key in enumerate(unique_keys.tolist()):
+        candidate_keys = np.flatnonzero((key_scores[key] >= 0) & (column_offsets[1:] > column_offsets[:-1]))
+        if len(candidate_keys) == 0:
+            continue
+        candidate_keys = candidate_keys[np.argsort(-key_scores[key, candidate_keys], kind="stable")]
+        # Only keys scoring at least as well as the key holding the k-th candidate can make the cut.
+        reached = int(np.searchsorted(np.cumsum(np.diff(column_offsets)[candidate_keys]), k))
+        threshold = key_scores[key, candidate_keys[min(reached, len(candidate_keys) - 1)]]
+        candidate_keys = candidate_keys[key_scores[key, candidate_keys] >= threshold]
+
+        sizes = column_offsets[candidate_keys + 1] - column_offsets[candidate_keys]
+        candidates = np.concatenate([column_order[column_offsets[candidate] : column_offsets[candidate + 1]] for candidate in candidate_keys])
+        candidate_scores = np.repeat(key_scores[key, candidate_keys], sizes)
+        best = np.lexsort((candidates, -candidate_scores))[:k]
+        matches[row, : len(best)] = candidates[best]
+        scores[row, : len(best)] = candidate_scores[best]
+
+    return PoruthamMatches(matches[inverse], scores[inverse])
+
+
+def _get_keys(natchaththirams: ArrayLike, rasis: ArrayLike) -> NDArray[np.int64]:
+    """Combine natchaththiram and rasi values into one key per person."""
+    stars = np.atleast_1d(np.asarray(natchaththirams, dtype=np.int64))
+
+    return cast("NDArray[np.int64]", stars * 13 + np.atleast_1d(np.asarray(rasis, dtype=np.int64)))
+
+
+def _build_star_table() -> NDArray[np.int16]:
+    """Return the natchaththiram porutham bitmask of every (bride, groom) pair, indexed by value."""
+    table = np.zeros((28, 28), dtype=np.int16)
+    enemies = {frozenset(pair) for pair in ENEMY_YONIS}
+    vedhai = {frozenset((a, b)) for group in VEDHAI_GROUPS for a in group for b in group if a != b}
+    for bride in range(1, 28):
+        for groom in range(1, 28):
+            # The count from the bride's natchaththiram to the groom's, the bride's being 1.
+            count = (groom - bride) % 27 + 1
+            agreed = {
+                Poruthams.DHINAM: count % 9 in {0, 2, 4, 6, 8},
+                Poruthams.GANAM: GANAMS[bride - 1] == GANAMS[groom - 1] or {GANAMS[bride - 1], GANAMS[groom - 1]} == {0, 1},
+                Poruthams.MAHENDHRAM: count in {4, 7, 10, 13, 16, 19, 22, 25},
+                Poruthams.STHREE_DHEERGAM: count > 13,  # noqa: PLR2004
+                Poruthams.YONI: frozenset((YONIS[bride - 1], YONIS[groom - 1])) not in enemies,
+                Poruthams.RAJJU: RAJJUS[bride - 1] != RAJJUS[groom - 1],
+                Poruthams.VEDHAI: frozenset((bride, groom)) not in vedhai,
+            }
+            table[bride, groom] = sum(porutham.bit for porutham, agrees in agreed.items() if agrees)
+
+    return table
+
+
+def _build_rasi_table() -> NDArray[np.int16]:
+    """Return the rasi porutham bitmask of every (bride, groom) pair, indexed by value."""
+    table = np.zeros((13, 13), dtype=np.int16)
+    for bride in Rasis:
+        for groom in Rasis:
+            # The count from the bride's rasi to the groom's, the bride's being 1.
+            count = (groom - bride) % 12 + 1
+            bride_lord, groom_lord = cast("Planets", bride.owner), cast("Planets", groom.owner)
+            agreed = {
+                Poruthams.RASI: count in {1, 7, 9, 10, 11, 12},
+                Poruthams.RASI_ADHIPATHI: groom_lord not in PLANET_ENEMIES[bride_lord] and bride_lord not in PLANET_ENEMIES[groom_lord],
+                Poruthams.VASIYAM: groom in VASIYAMS[bride] or bride in VASIYAMS[groom],
+            }
+            table[bride, groom] = sum(porutham.bit for porutham, agrees in agreed.items() if agrees)
+
+    return table
+
+
+_STAR_TABLE = _build_star_table()
+_RASI_TABLE = _build_rasi_table()
+_POPCOUNT = np.array([mask.bit_count() for mask in range(1 << len(Poruthams))], dtype=np.int8)
+_KEY_TABLE = (_STAR_TABLE[:, None, :, None] | _RASI_TABLE[None, :, None, :]).reshape(_KEYS, _KEYS)
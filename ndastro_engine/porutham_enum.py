@@ -0,0 +1,50 @@
+"""Module to hold porutham enums."""
+
+from enum import IntEnum
+
+
+class Poruthams(IntEnum):
+    """Enum to hold the ten poruthams (marriage compatibility checks)."""
+
+    DHINAM = 1
+    GANAM = 2
+    MAHENDHRAM = 3
+    STHREE_DHEERGAM = 4
+    YONI = 5
+    RASI = 6
+    RASI_ADHIPATHI = 7
+    VASIYAM = 8
+    RAJJU = 9
+    VEDHAI = 10
+
+    def __str__(self) -> str:
+        """Return name of the porutham.
+
+        Returns:
+            str: name of the porutham
+
+        """
+        return self.name
+
+    @property
+    def bit(self) -> int:
+        """Return the bit of the porutham in a porutham bitmask.
+
+        Returns:
+            int: 2 ** (value - 1)
+
+        """
+        return 1 << (self.value - 1)
+
+    @staticmethod
+    def to_list() -> list[str]:
+        """Convert enum to list of enum item name.
+
+        Returns:
+            list[str]: list of enum item name
+
+        """
+        return [el.name for el in Poruthams]
+
+
+__all__ = ["Poruthams"]
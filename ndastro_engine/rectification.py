@@ -0,0 +1,95 @@
+"""Birth-time rectification sweeps.
+
+Rectification compares the chart of many candidate birth times around a reported one. This
+module evaluates every candidate of a regular time grid at once:
+- get_rectification_sweep: the sidereal ascendant and Moon, the Moon natchaththiram and pada
+  and the lagna in several divisional charts for every candidate
+
+The ascendant and the Moon are computed for the whole grid by one vectorized call each, and
+the divisional lagnas by one table lookup per varga, so thousands of candidates cost about as
+much as a handful of single charts.
+"""
+
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ndastro_engine.ayanamsa import get_sidereal_longitude_series
+from ndastro_engine.core import ts
+from ndastro_engine.enums import Granularity, Planets, Vargas
+from ndastro_engine.utils import to_epoch_seconds
+from ndastro_engine.varga import get_varga_rasis
+
+
+class RectificationSweep(NamedTuple):
+    """A columnar table of candidate birth charts, one element per candidate time.
+
+    Attributes:
+        times (NDArray[np.datetime64]): The UTC candidate times, in chronological order.
+        ascendant (NDArray[np.float64]): The sidereal longitude of the ascendant in degrees.
+        moon (NDArray[np.float64]): The sidereal longitude of the Moon in degrees.
+        natchaththiram (NDArray[np.int8]): The `Natchaththirams` value of the Moon.
+        pada (NDArray[np.int8]): The pada (1 to 4) of the Moon in its natchaththiram.
+        vargas (tuple[Vargas, ...]): The divisional charts of `lagnas`, in row order.
+        lagnas (NDArray[np.int8]): The `Rasis` value of the ascendant in every varga, of shape (len(vargas), len(times)).
+
+    """
+
+    times: NDArray[np.datetime64]
+    ascendant: NDArray[np.float64]
+    moon: NDArray[np.float64]
+    natchaththiram: NDArray[np.int8]
+    pada: NDArray[np.int8]
+    vargas: tuple[Vargas, ...]
+    lagnas: NDArray[np.int8]
+
+
+def get_rectification_sweep(  # noqa: PLR0913
+    central_time: datetime,
+    lat: float,
+    lon: float,
+    window: timedelta,
+    step: timedelta,
+    *,
+    vargas: tuple[Vargas, ...] = (Vargas.RASI, Vargas.NAVAMSA),
+) -> RectificationSweep:
+    """Compute the charts of every candidate birth time around a reported one.
+
+    Args:
+        central_time (datetime): The reported birth time.
+        lat (float): The latitude of the birth place in decimal degrees.
+        lon (float): The longitude of the birth place in decimal degrees.
+        window (timedelta): The largest distance of a candidate from the reported time.
+        step (timedelta): The distance between consecutive candidates.
+        vargas (tuple[Vargas, ...], optional): The divisional charts of the lagna. Defaults to the rasi and navamsa.
+
+    Returns:
+        RectificationSweep: The candidates from `central_time - window` to `central_time + window`, the reported time included.
+
+    Raises:
+        ValueError: If the step is not positive or the window is negative.
+
+    """
+    if step <= timedelta(0) or window < timedelta(0):
+        msg = f"Expected a positive step and a non-negative window, got step {step} and window {window}"
+        raise ValueError(msg)
+
+    count = int(window / step)
+    offsets = np.arange(-count, count + 1, dtype=np.float64) * step.total_seconds()
+    t = ts.tt_jd(ts.utc(central_time).tt + offsets / 86400)
+
+    ascendant = get_sidereal_longitude_series(Planets.ASCENDANT, lat, lon, t)
+    moon = get_sidereal_longitude_series(Planets.MOON, lat, lon, t)
+    padas = np.floor(moon / Granularity.PADA.span).astype(np.int64) % Granularity.PADA.divisions
+
+    return RectificationSweep(
+        np.round((to_epoch_seconds([central_time])[0] + offsets) * 1000).astype(np.int64).astype("datetime64[ms]"),
+        ascendant,
+        moon,
+        (padas // 4 + 1).astype(np.int8),
+        (padas % 4 + 1).astype(np.int8),
+        tuple(vargas),
+        get_varga_rasis(ascendant, vargas),
+    )
@@ -0,0 +1,421 @@
+"""Persistent chart cache shared across processes, backed by SQLite.
+
+An in-process cache is lost on every restart and is not shared between worker processes.
+This module stores computed charts in an SQLite database in WAL mode, so many processes can
+read while one writes:
+- SqliteChartCache: batch get/put of charts keyed by time, location, ayanamsa system and
+  engine version, with TTL and entry count eviction
+- SqliteChartCache.get_charts: the multi-chart lookup, computing and storing the misses
+- SqliteChartCache.warm_up: preloading a date range, computed with one vectorized call per planet
+
+A chart holds the tropical position of every `Planets` member and the ayanamsa value. Times
+and locations are quantised like the in-process cache of `ndastro_engine.cache`, and charts
+are computed at the quantised values.
+
+The warm-up is also available from the command line:
+
+    python -m ndastro_engine.sqlite_cache charts.db --lat 12.97 --lon 77.59 --start 2024-01-01 --end 2024-02-01 --step-minutes 60
+"""
+
+import argparse
+import sqlite3
+import threading
+import time
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from ndastro_engine.ayanamsa import AYANAMSA_FUNCTIONS
+from ndastro_engine.cache import DEFAULT_PRECISION, DEFAULT_TIME_QUANTUM
+from ndastro_engine.core import get_planet_position_series, get_planets_position, ts
+from ndastro_engine.enums import Planets
+from ndastro_engine.models import PlanetPosition
+
+# Planets stored in every chart, in row order of the position blob.
+CHART_PLANETS = tuple(Planets)
+
+# Keys per SELECT; each key binds 5 parameters and older SQLite builds allow 999 per statement.
+_BATCH_SIZE = 190
+
+# Charts an instance writes between two evictions, so that expired charts and the writes of
+# other processes are eventually accounted for even while the local estimate stays in bounds.
+_EVICT_INTERVAL = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS charts (
+    time INTEGER NOT NULL,
+    lat INTEGER NOT NULL,
+    lon INTEGER NOT NULL,
+    ayanamsa_system TEXT NOT NULL,
+    engine_version TEXT NOT NULL,
+    ayanamsa REAL NOT NULL,
+    positions BLOB NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (time, lat, lon, ayanamsa_system, engine_version)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS charts_created ON charts (created);
+"""
+
+
+def get_engine_version() -> str:
+    """Return the installed version of ndastro-engine.
+
+    Returns:
+        str: The package version, or "0+unknown" when running from a source tree that is not installed.
+
+    """
+    try:
+        return version("ndastro-engine")
+    except PackageNotFoundError:
+        return "0+unknown"
+
+
+class ChartKey(NamedTuple):
+    """The key of a stored chart.
+
+    Attributes:
+        time (int): The quantised time, in time quanta since the POSIX epoch.
+        lat (int): The latitude in units of the last kept decimal.
+        lon (int): The longitude in units of the last kept decimal.
+        ayanamsa_system (str): The name of the ayanamsa system, a key of `AYANAMSA_FUNCTIONS`.
+        engine_version (str): The engine version the chart was computed with.
+
+    """
+
+    time: int
+    lat: int
+    lon: int
+    ayanamsa_system: str
+    engine_version: str
+
+
+class CachedChart(NamedTuple):
+    """A stored chart.
+
+    Attributes:
+        ayanamsa (float): The ayanamsa value in degrees.
+        positions (dict[Planets, PlanetPosition]): The tropical position of every planet of `CHART_PLANETS`.
+
+    """
+
+    ayanamsa: float
+    positions: dict[Planets, PlanetPosition]
+
+
+class SqliteChartCache:
+    """A chart cache in an SQLite database shared by every process opening the same file.
+
+    Attributes:
+        path (Path): The database file.
+        ttl (timedelta | None): The age after which a chart is ignored and evicted, or None to keep charts forever.
+        max_entries (int | None): The largest number of charts kept, the oldest being evicted first, or None for no bound.
+        time_quantum (timedelta): The bucket width of the chart times.
+        precision (int): The decimals kept of the latitude and longitude.
+        engine_version (str): The engine version charts are stored and looked up under.
+        hits (int): The number of charts this instance found in the database.
+        misses (int): The number of charts this instance did not find.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: str | Path,
+        *,
+        ttl: timedelta | None = None,
+        max_entries: int | None = None,
+        time_quantum: timedelta = DEFAULT_TIME_QUANTUM,
+        precision: int = DEFAULT_PRECISION,
+        engine_version: str | None = None,
+    ) -> None:
+        """Open the database, creating it and switching it to WAL mode if needed.
+
+        Args:
+            path (str | Path): The database file.
+            ttl (timedelta | None, optional): The largest age of a chart. Defaults to no limit.
+            max_entries (int | None, optional): The largest number of charts. Defaults to no limit.
+            time_quantum (timedelta, optional): The bucket width of the times. Defaults to DEFAULT_TIME_QUANTUM.
+            precision (int, optional): The decimals kept of the location. Defaults to DEFAULT_PRECISION.
+            engine_version (str | None, optional): The version charts are stored under. Defaults to `get_engine_version()`.
+
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.time_quantum = time_quantum
+        self.precision = precision
+        self.engine_version = engine_version if engine_version is not None else get_engine_version()
+        self.hits = 0
+        self.misses = 0
+        self._counters_lock = threading.Lock()
+        self._local = threading.local()
+        # The number of charts counted by the last eviction and written by this instance since.
+        self._entries = 0
+        self._written = 0
+        self._connect().executescript(_SCHEMA)
+        self.evict()
+
+    def key(self, lat: float, lon: float, given_time: datetime, ayanamsa_system: str = "lahiri") -> ChartKey:
+        """Return the key of the chart of a time and location.
+
+        Args:
+            lat (float): The latitude in decimal degrees.
+            lon (float): The longitude in decimal degrees.
+            given_time (datetime): The timezone-aware time.
+            ayanamsa_system (str, optional): The ayanamsa system. Defaults to "lahiri".
+
+        Returns:
+            ChartKey: The key, with the time and location quantised.
+
+        Raises:
+            ValueError: If the time is naive, as it would be read as local time, or the ayanamsa system is unknown.
+
+        """
+        if given_time.tzinfo is None or given_time.utcoffset() is None:
+            msg = f"Expected a timezone-aware time, got {given_time}"
+            raise ValueError(msg)
+        if ayanamsa_system not in AYANAMSA_FUNCTIONS:
+            msg = f"Unknown ayanamsa system {ayanamsa_system}"
+            raise ValueError(msg)
+
+        scale = 10**self.precision
+
+        return ChartKey(
+            round(given_time.timestamp() / self.time_quantum.total_seconds()),
+            round(lat * scale),
+            round(lon * scale),
+            ayanamsa_system,
+            self.engine_version,
+        )
+
+    def get_many(self, keys: Sequence[ChartKey]) -> list[CachedChart | None]:
+        """Look up many charts.
+
+        Args:
+            keys (Sequence[ChartKey]): The keys.
+
+        Returns:
+            list[CachedChart | None]: The chart of every key, or None if it is missing or expired.
+
+        """
+        connection = self._connect()
+        oldest = time.time() - self.ttl.total_seconds() if self.ttl is not None else float("-inf")
+        found: dict[ChartKey, CachedChart] = {}
+        for first in range(0, len(keys), _BATCH_SIZE):
+            batch = keys[first : first + _BATCH_SIZE]
+            # Only placeholders are formatted into the statement; the keys are bound as parameters.
+            placeholders = ", ".join(["(?, ?, ?, ?, ?)"] * len(batch))
+            rows = connection.execute(
+                "SELECT time, lat, lon, ayanamsa_system, engine_version, ayanamsa, positions FROM charts "  # noqa: S608
+                f"WHERE created >= ? AND (time, lat, lon, ayanamsa_system, engine_version) IN (VALUES {placeholders})",
+                [oldest, *(value for key in batch for value in key)],
+            )
+            for *columns, ayanamsa, positions in rows:
+                found[ChartKey(*columns)] = CachedChart(ayanamsa, _decode_positions(positions))
+
+        charts = [found.get(key) for key in keys]
+        hits = sum(chart is not None for chart in charts)
+        with self._counters_lock:
+            self.hits += hits
+            self.misses += len(keys) - hits
+
+        return charts
+
+    def put_many(self, charts: Sequence[tuple[ChartKey, CachedChart]]) -> None:
+        """Store many charts in one transaction, replacing charts with the same key.
+
+        The charts are evicted when the count of the last eviction plus the charts written since may
+        exceed `max_entries`, or every `_EVICT_INTERVAL` written charts, rather than on every write.
+
+        Args:
+            charts (Sequence[tuple[ChartKey, CachedChart]]): The keys and charts.
+
+        """
+        connection = self._connect()
+        created = time.time()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO charts VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(*key, chart.ayanamsa, _encode_positions(chart.positions), created) for key, chart in charts],
+            )
+        with self._counters_lock:
+            self._written += len(charts)
+            due = self._written >= _EVICT_INTERVAL or (self.max_entries is not None and self._entries + self._written > self.max_entries)
+        if due:
+            self.evict()
+
+    def get_charts(self, requests: Sequence[tuple[float, float, datetime]], ayanamsa_system: str = "lahiri") -> list[CachedChart]:
+        """Return the charts of many times and locations, computing and storing the missing ones.
+
+        Args:
+            requests (Sequence[tuple[float, float, datetime]]): The latitude, longitude and time of every chart.
+            ayanamsa_system (str, optional): The ayanamsa system. Defaults to "lahiri".
+
+        Returns:
+            list[CachedChart]: The charts, in request order.
+
+        """
+        keys = [self.key(lat, lon, given_time, ayanamsa_system) for lat, lon, given_time in requests]
+        charts = self.get_many(keys)
+
+        computed: dict[ChartKey, CachedChart] = {}
+        for position, key in enumerate(keys):
+            if charts[position] is None:
+                if key not in computed:
+                    computed[key] = self._compute_chart(key)
+                charts[position] = computed[key]
+        if computed:
+            self.put_many(list(computed.items()))
+
+        return [chart for chart in charts if chart is not None]
+
+    def warm_up(  # noqa: PLR0913
+        self,
+        lat: float,
+        lon: float,
+        start: datetime,
+        end: datetime,
+        step: timedelta,
+        *,
+        ayanamsa_system: str = "lahiri",
+    ) -> int:
+        """Compute and store the charts of a location over a date range.
+
+        Charts already stored are skipped; the others are computed with one vectorized call per planet.
+
+        Args:
+            lat (float): The latitude in decimal degrees.
+            lon (float): The longitude in decimal degrees.
+            start (datetime): The first time.
+            end (datetime): The last time.
+            step (timedelta): The distance between two charts; rounded to a whole number of time quanta.
+            ayanamsa_system (str, optional): The ayanamsa system. Defaults to "lahiri".
+
+        Returns:
+            int: The number of charts computed.
+
+        """
+        first = self.key(lat, lon, start, ayanamsa_system)
+        last = self.key(lat, lon, end, ayanamsa_system)
+        stride = max(1, round(step / self.time_quantum))
+        keys = [first._replace(time=quantum) for quantum in range(first.time, last.time + 1, stride)]
+        missing = [key for key, chart in zip(keys, self.get_many(keys), strict=True) if chart is None]
+        if not missing:
+            return 0
+
+        quantum = self.time_quantum.total_seconds()
+        times = [datetime.fromtimestamp(key.time * quantum, tz=timezone.utc) for key in missing]
+        location = (first.lat / 10**self.precision, first.lon / 10**self.precision)
+        t = ts.utc(times)
+        series = np.stack([get_planet_position_series(planet, *location, t) for planet in CHART_PLANETS], axis=1)
+        ayanamsa = AYANAMSA_FUNCTIONS[ayanamsa_system]
+        self.put_many(
+            [
+                (key, CachedChart(ayanamsa(when), {planet: PlanetPosition(*rows[row].tolist()) for row, planet in enumerate(CHART_PLANETS)}))
+                for key, when, rows in zip(missing, times, series, strict=True)
+            ]
+        )
+
+        return len(missing)
+
+    def evict(self) -> int:
+        """Delete the expired charts and the oldest charts beyond `max_entries`.
+
+        Returns:
+            int: The number of charts deleted.
+
+        """
+        connection = self._connect()
+        deleted = 0
+        count = 0
+        with connection:
+            if self.ttl is not None:
+                deleted += connection.execute("DELETE FROM charts WHERE created < ?", (time.time() - self.ttl.total_seconds(),)).rowcount
+            if self.max_entries is not None:
+                (count,) = connection.execute("SELECT COUNT(*) FROM charts").fetchone()
+                if count > self.max_entries:
+                    deleted += connection.execute(
+                        "DELETE FROM charts WHERE (time, lat, lon, ayanamsa_system, engine_version) IN "
+                        "(SELECT time, lat, lon, ayanamsa_system, engine_version FROM charts ORDER BY created LIMIT ?)",
+                        (count - self.max_entries,),
+                    ).rowcount
+                    count = self.max_entries
+        with self._counters_lock:
+            self._entries = count
+            self._written = 0
+
+        return deleted
+
+    def close(self) -> None:
+        """Close the connection of the calling thread."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the connection of the calling thread, opening it on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+
+        return connection
+
+    def _compute_chart(self, key: ChartKey) -> CachedChart:
+        """Compute the chart of a key at its quantised time and location."""
+        when = datetime.fromtimestamp(key.time * self.time_quantum.total_seconds(), tz=timezone.utc)
+        positions = get_planets_position(list(CHART_PLANETS), key.lat / 10**self.precision, key.lon / 10**self.precision, when)
+
+        return CachedChart(AYANAMSA_FUNCTIONS[key.ayanamsa_system](when), positions)
+
+
+def _encode_positions(positions: dict[Planets, PlanetPosition]) -> bytes:
+    """Pack the positions of `CHART_PLANETS` into a float64 blob."""
+    return np.array([positions[planet] for planet in CHART_PLANETS], dtype="<f8").tobytes()
+
+
+def _decode_positions(blob: bytes) -> dict[Planets, PlanetPosition]:
+    """Unpack a float64 blob into the positions of `CHART_PLANETS`."""
+    rows = np.frombuffer(blob, dtype="<f8").reshape(len(CHART_PLANETS), len(PlanetPosition._fields)).tolist()
+
+    return {planet: PlanetPosition(*rows[row]) for row, planet in enumerate(CHART_PLANETS)}
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Preload the charts of a location and date range into a database.
+
+    Args:
+        argv (Sequence[str] | None, optional): The command line arguments. Defaults to `sys.argv[1:]`.
+
+    """
+    parser = argparse.ArgumentParser(prog="python -m ndastro_engine.sqlite_cache", description=main.__doc__)
+    parser.add_argument("database", type=Path, help="the database file")
+    parser.add_argument("--lat", type=float, required=True, help="latitude in decimal degrees")
+    parser.add_argument("--lon", type=float, required=True, help="longitude in decimal degrees")
+    parser.add_argument("--start", type=datetime.fromisoformat, required=True, help="first UTC date, ISO format")
+    parser.add_argument("--end", type=datetime.fromisoformat, required=True, help="last UTC date, ISO format")
+    parser.add_argument("--step-minutes", type=float, default=60.0, help="minutes between two charts")
+    parser.add_argument("--ayanamsa", default="lahiri", choices=sorted(AYANAMSA_FUNCTIONS), help="ayanamsa system")
+    arguments = parser.parse_args(argv)
+
+    cache = SqliteChartCache(arguments.database)
+    count = cache.warm_up(
+        arguments.lat,
+        arguments.lon,
+        arguments.start.replace(tzinfo=arguments.start.tzinfo or timezone.utc),
+        arguments.end.replace(tzinfo=arguments.end.tzinfo or timezone.utc),
+        timedelta(minutes=arguments.step_minutes),
+        ayanamsa_system=arguments.ayanamsa,
+    )
+    cache.close()
+    print(f"{count} charts computed")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
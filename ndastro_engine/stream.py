@@ -0,0 +1,160 @@
+"""Streaming ephemeris generation with bounded memory.
+
+Exports covering centuries at hourly resolution hold far more charts than fit in memory. This
+module yields the positions of a regular time grid one chunk at a time:
+- stream_ephemeris_chunks: fixed-size columnar chunks, each computed with one vectorized call per planet
+- stream_ephemeris_rows: the same positions as one (time, positions) row per instant
+
+Only the chunk being yielded is held in memory. The grid is anchored at the start of the
+range, so an interrupted export resumes from its last written time (the checkpoint) with
+`resume_after` and produces exactly the rows it would have produced without interruption.
+"""
+
+from collections.abc import Iterator, Sequence
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ndastro_engine.core import get_observer, get_planet_position_series, ts
+from ndastro_engine.enums import Planets
+from ndastro_engine.models import PlanetPosition
+from ndastro_engine.utils import to_epoch_seconds
+
+# Instants per chunk; about 1 MB of positions when every planet is computed.
+DEFAULT_STREAM_CHUNK_SIZE = 2048
+
+
+class EphemerisChunk(NamedTuple):
+    """A columnar block of consecutive instants of an ephemeris stream.
+
+    Attributes:
+        times (NDArray[np.datetime64]): The UTC instants, in chronological order; the last one is the checkpoint of the chunk.
+        planets (tuple[Planets, ...]): The planets of the second axis of `positions`.
+        positions (NDArray[np.float64]): The tropical positions, of shape (len(times), len(planets), 6), whose last
+            axis follows the field order of `PlanetPosition`.
+
+    """
+
+    times: NDArray[np.datetime64]
+    planets: tuple[Planets, ...]
+    positions: NDArray[np.float64]
+
+
+class EphemerisRow(NamedTuple):
+    """The positions of one instant of an ephemeris stream.
+
+    Attributes:
+        time (datetime): The UTC instant.
+        positions (dict[Planets, PlanetPosition]): The tropical position of every planet, as returned by `get_planets_position`.
+
+    """
+
+    time: datetime
+    positions: dict[Planets, PlanetPosition]
+
+
+def stream_ephemeris_chunks(  # noqa: PLR0913
+    start: datetime,
+    end: datetime,
+    step: timedelta,
+    lat: float,
+    lon: float,
+    *,
+    planets: Sequence[Planets] = (),
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    resume_after: datetime | None = None,
+) -> Iterator[EphemerisChunk]:
+    """Yield the positions of the planets from `start` to `end`, every `step`, in columnar chunks.
+
+    Args:
+        start (datetime): The first instant of the grid.
+        end (datetime): The last instant of the range, included when it falls on the grid.
+        step (timedelta): The distance between consecutive instants.
+        lat (float): The latitude of the observer in decimal degrees.
+        lon (float): The longitude of the observer in decimal degrees.
+        planets (Sequence[Planets], optional): The planets to compute. Defaults to every planet.
+        chunk_size (int, optional): The instants per chunk. Defaults to DEFAULT_STREAM_CHUNK_SIZE.
+        resume_after (datetime | None, optional): A checkpoint, the last instant already consumed; the stream starts
+            at the next instant of the grid. Defaults to starting at `start`.
+
+    Yields:
+        EphemerisChunk: The positions of up to `chunk_size` consecutive instants.
+
+    Raises:
+        ValueError: If the step or the chunk size is not positive.
+
+    """
+    if chunk_size <= 0:
+        msg = f"Expected a positive chunk size, got {chunk_size}"
+        raise ValueError(msg)
+
+    index = _get_first_index(start, step, resume_after)
+    selected = tuple(planets) if len(planets) > 0 else tuple(Planets)
+    observer = get_observer(lat, lon)
+
+    count = (end - start) // step + 1
+    while index < count:
+        times = [start + step * offset for offset in range(index, min(index + chunk_size, count))]
+        t = ts.utc(times)
+        positions = np.stack([get_planet_position_series(planet, lat, lon, t, observer) for planet in selected], axis=1)
+
+        yield EphemerisChunk(
+            np.round(to_epoch_seconds(times) * 1000).astype(np.int64).astype("datetime64[ms]"),
+            selected,
+            positions,
+        )
+        index += len(times)
+
+
+def stream_ephemeris_rows(  # noqa: PLR0913
+    start: datetime,
+    end: datetime,
+    step: timedelta,
+    lat: float,
+    lon: float,
+    *,
+    planets: Sequence[Planets] = (),
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    resume_after: datetime | None = None,
+) -> Iterator[EphemerisRow]:
+    """Yield the positions of the planets from `start` to `end`, every `step`, one row per instant.
+
+    The rows are computed a chunk at a time with `stream_ephemeris_chunks`.
+
+    Args:
+        start (datetime): The first instant of the grid.
+        end (datetime): The last instant of the range, included when it falls on the grid.
+        step (timedelta): The distance between consecutive instants.
+        lat (float): The latitude of the observer in decimal degrees.
+        lon (float): The longitude of the observer in decimal degrees.
+        planets (Sequence[Planets], optional): The planets to compute. Defaults to every planet.
+        chunk_size (int, optional): The instants computed at a time. Defaults to DEFAULT_STREAM_CHUNK_SIZE.
+        resume_after (datetime | None, optional): A checkpoint, the time of the last row already consumed; the stream
+            starts at the next instant of the grid. Defaults to starting at `start`.
+
+    Yields:
+        EphemerisRow: The time and positions of every instant, in chronological order.
+
+    Raises:
+        ValueError: If the step or the chunk size is not positive.
+
+    """
+    index = _get_first_index(start, step, resume_after)
+    for chunk in stream_ephemeris_chunks(start, end, step, lat, lon, planets=planets, chunk_size=chunk_size, resume_after=resume_after):
+        for values in chunk.positions:
+            yield EphemerisRow(
+                start + step * index,
+                {planet: PlanetPosition(*map(float, position)) for planet, position in zip(chunk.planets, values, strict=True)},
+            )
+            index += 1
+
+
+def _get_first_index(start: datetime, step: timedelta, resume_after: datetime | None) -> int:
+    """Return the grid index following the checkpoint, or 0 without one."""
+    if step <= timedelta(0):
+        msg = f"Expected a positive step, got {step}"
+        raise ValueError(msg)
+
+    return 0 if resume_after is None else max(0, (resume_after - start) // step + 1)
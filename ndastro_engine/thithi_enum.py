@@ -0,0 +1,70 @@
+"""Module to hold thithi enums."""
+
+from enum import IntEnum
+
+
+class Thithis(IntEnum):
+    """Enum to hold thithis (lunar days), numbered from the new moon."""
+
+    SUKLA_PRATHAMAI = 1
+    SUKLA_DHVITHIYAI = 2
+    SUKLA_THRITHIYAI = 3
+    SUKLA_CHATHURTHI = 4
+    SUKLA_PANCHAMI = 5
+    SUKLA_SHASHTI = 6
+    SUKLA_SAPTHAMI = 7
+    SUKLA_ASHTAMI = 8
+    SUKLA_NAVAMI = 9
+    SUKLA_DHASAMI = 10
+    SUKLA_EKADHASI = 11
+    SUKLA_DHVADHASI = 12
+    SUKLA_THRAYODHASI = 13
+    SUKLA_CHATHURDHASI = 14
+    POURNAMI = 15
+    KRISHNA_PRATHAMAI = 16
+    KRISHNA_DHVITHIYAI = 17
+    KRISHNA_THRITHIYAI = 18
+    KRISHNA_CHATHURTHI = 19
+    KRISHNA_PANCHAMI = 20
+    KRISHNA_SHASHTI = 21
+    KRISHNA_SAPTHAMI = 22
+    KRISHNA_ASHTAMI = 23
+    KRISHNA_NAVAMI = 24
+    KRISHNA_DHASAMI = 25
+    KRISHNA_EKADHASI = 26
+    KRISHNA_DHVADHASI = 27
+    KRISHNA_THRAYODHASI = 28
+    KRISHNA_CHATHURDHASI = 29
+    AMAVASAI = 30
+
+    def __str__(self) -> str:
+        """Return name of the thithi.
+
+        Returns:
+            str: name of the thithi
+
+        """
+        return self.name
+
+    @property
+    def is_sukla_paksham(self) -> bool:
+        """Return whether the thithi belongs to the waxing fortnight.
+
+        Returns:
+            bool: True for thithis 1-15, False for thithis 16-30.
+
+        """
+        return self.value <= Thithis.POURNAMI.value
+
+    @staticmethod
+    def to_list() -> list[str]:
+        """Convert enum to list of enum item name.
+
+        Returns:
+            list[str]: list of enum item name
+
+        """
+        return [el.name for el in Thithis]
+
+
+__all__ = ["Thithis"]
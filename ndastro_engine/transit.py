@@ -0,0 +1,271 @@
+"""Transit (gochara) evaluation of one sky snapshot against many natal charts.
+
+This module checks transit conditions such as "Moon in the 8th from the natal Moon" or
+"Saturn over the natal Moon" for every chart of a columnar natal store at once:
+- NatalStore, build_natal_store: the sidereal longitudes and rasis of the natal planets of every user
+- TransitRule, DEFAULT_TRANSIT_RULES: the conditions to check
+- get_transit_hits: the users matching each rule, as sparse arrays of user IDs
+- get_transit_windows, get_major_transit_windows: the periods a rule holds (Sade Sati, Ashtama
+  Shani, Jupiter) for arrays of natal Moon rasis, from a precomputed ingress timeline
+
+The transiting position is a single rasi per planet, so a rule reduces to the set of natal
+rasis it hits; every rule is then one table lookup over the natal rasi column, and angular
+orbs are only checked for the candidates that pass it. Likewise the windows of a rule only
+depend on the natal rasi, so they are derived from the ingress timeline for the 12 rasis and
+then gathered for every user.
+"""
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import NamedTuple, cast
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ndastro_engine.constants import DEGREE_MAX
+from ndastro_engine.enums import Granularity, Planets
+from ndastro_engine.ingress_index import IngressIndex
+from ndastro_engine.models import PlanetPosition
+
+RASI_SPAN = DEGREE_MAX / 12
+
+
+class NatalStore(NamedTuple):
+    """A columnar store of natal charts, one row per user.
+
+    Attributes:
+        user_ids (NDArray[np.int64]): The ID of the user of every row.
+        planets (tuple[Planets, ...]): The natal planets, in column order.
+        longitudes (NDArray[np.float64]): The sidereal longitudes in degrees, of shape (n_users, len(planets)).
+        rasis (NDArray[np.int8]): The `Rasis` values of the longitudes, of the same shape.
+
+    """
+
+    user_ids: NDArray[np.int64]
+    planets: tuple[Planets, ...]
+    longitudes: NDArray[np.float64]
+    rasis: NDArray[np.int8]
+
+
+class TransitRule(NamedTuple):
+    """A transit condition of a planet relative to a natal planet.
+
+    Attributes:
+        name (str): The name under which hits are reported.
+        transit_planet (Planets): The transiting planet.
+        natal_planet (Planets): The natal planet the houses are counted from.
+        houses (tuple[int, ...]): The houses (1 to 12) from the natal planet the transiting planet must occupy.
+        orb (float | None): If set, the largest angular distance in degrees between the transiting and natal planets.
+
+    """
+
+    name: str
+    transit_planet: Planets
+    natal_planet: Planets
+    houses: tuple[int, ...]
+    orb: float | None = None
+
+
+DEFAULT_TRANSIT_RULES = (
+    TransitRule("chandrashtama", Planets.MOON, Planets.MOON, (8,)),
+    TransitRule("saturn_over_moon", Planets.SATURN, Planets.MOON, (1,)),
+    TransitRule("sade_sati", Planets.SATURN, Planets.MOON, (12, 1, 2)),
+    TransitRule("ashtama_shani", Planets.SATURN, Planets.MOON, (8,)),
+    TransitRule("kantaka_shani", Planets.SATURN, Planets.MOON, (4, 7, 10)),
+    TransitRule("jupiter_favourable", Planets.JUPITER, Planets.MOON, (2, 5, 7, 9, 11)),
+    TransitRule("rahu_over_moon", Planets.RAHU, Planets.MOON, (1,)),
+)
+
+# The names of the default rules reported by get_major_transit_windows.
+MAJOR_TRANSIT_RULES = ("sade_sati", "ashtama_shani", "jupiter_favourable")
+
+
+class TransitWindows(NamedTuple):
+    """A columnar table of the periods during which a transit rule holds, one row per period.
+
+    Attributes:
+        person (NDArray[np.int64]): The position in the natal rasi array of the user the period belongs to.
+        start (NDArray[np.datetime64]): The UTC start of the period.
+        end (NDArray[np.datetime64]): The UTC end of the period.
+
+    """
+
+    person: NDArray[np.int64]
+    start: NDArray[np.datetime64]
+    end: NDArray[np.datetime64]
+
+
+def build_natal_store(user_ids: ArrayLike, planets: Sequence[Planets], longitudes: ArrayLike) -> NatalStore:
+    """Build a natal store from the sidereal longitudes of many charts.
+
+    Args:
+        user_ids (ArrayLike): The ID of every user.
+        planets (Sequence[Planets]): The natal planets, in column order.
+        longitudes (ArrayLike): The sidereal longitudes in degrees, of shape (n_users, len(planets)).
+
+    Returns:
+        NatalStore: The store, with the rasis of every longitude precomputed.
+
+    Raises:
+        ValueError: If the longitudes do not have one row per user and one column per planet.
+
+    """
+    ids = np.asarray(user_ids, dtype=np.int64)
+    positions = np.asarray(longitudes, dtype=np.float64) % DEGREE_MAX
+    if positions.shape != (len(ids), len(planets)):
+        msg = f"Expected longitudes of shape {(len(ids), len(planets))}, got {positions.shape}"
+        raise ValueError(msg)
+
+    rasis = (np.floor(positions / RASI_SPAN).astype(np.int8) % 12) + 1
+
+    return NatalStore(ids, tuple(planets), positions, rasis)
+
+
+def get_transit_hits(
+    snapshot: dict[Planets, PlanetPosition],
+    ayanamsa: float,
+    natal: NatalStore,
+    rules: Sequence[TransitRule] = DEFAULT_TRANSIT_RULES,
+) -> dict[str, NDArray[np.int64]]:
+    """Return the users matching each transit rule.
+
+    Args:
+        snapshot (dict[Planets, PlanetPosition]): The tropical positions of the transiting planets, as returned by
+            `get_planets_position`.
+        ayanamsa (float): The ayanamsa at the time of the snapshot, e.g. from `get_lahiri_ayanamsa`.
+        natal (NatalStore): The natal charts to check.
+        rules (Sequence[TransitRule], optional): The rules to check. Defaults to DEFAULT_TRANSIT_RULES.
+
+    Returns:
+        dict[str, NDArray[np.int64]]: The IDs of the users hit by each rule, keyed by rule name.
+
+    """
+    hits: dict[str, NDArray[np.int64]] = {}
+    for rule in rules:
+        transit_longitude = (snapshot[rule.transit_planet].longitude - ayanamsa) % DEGREE_MAX
+        column = natal.planets.index(rule.natal_planet)
+        rows = np.flatnonzero(_get_natal_rasi_mask(transit_longitude, rule.houses)[natal.rasis[:, column]])
+
+        if rule.orb is not None:
+            separation = np.abs((natal.longitudes[rows, column] - transit_longitude + DEGREE_MAX / 2) % DEGREE_MAX - DEGREE_MAX / 2)
+            rows = rows[separation <= rule.orb]
+
+        hits[rule.name] = cast("NDArray[np.int64]", natal.user_ids[rows])
+
+    return hits
+
+
+def get_transit_windows(
+    index: IngressIndex,
+    rule: TransitRule,
+    natal_rasis: ArrayLike,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> TransitWindows:
+    """Return the periods during which a transit rule holds for arrays of natal rasis.
+
+    The periods are read from the rasi intervals of the transiting planet in the index. They are
+    computed once for each of the 12 natal rasis and gathered for every user, so the cost per
+    user is a copy of its rows. Consecutive houses of the rule form a single period, so a
+    retrograde move between two of its houses does not split it.
+
+    Args:
+        index (IngressIndex): An index holding the rasi ingresses of `rule.transit_planet`.
+        rule (TransitRule): The rule; its houses are counted from the natal rasis and its orb must not be set.
+        natal_rasis (ArrayLike): The `Rasis` value of `rule.natal_planet` of every user.
+        start (datetime | None, optional): The start of the range. Defaults to the start of the index.
+        end (datetime | None, optional): The end of the range. Defaults to the end of the index.
+
+    Returns:
+        TransitWindows: The periods clipped to the range, ordered by user, then start.
+
+    Raises:
+        ValueError: If the rule has an orb or the range is outside the span of the index.
+
+    """
+    if rule.orb is not None:
+        msg = f"Transit windows are computed per rasi and do not support the orb of rule {rule.name}"
+        raise ValueError(msg)
+
+    range_start = start if start is not None else index.start
+    range_end = end if end is not None else index.end
+
+    # The windows of every natal rasi, concatenated in rasi order.
+    starts: list[NDArray[np.int64]] = []
+    ends: list[NDArray[np.int64]] = []
+    for natal_rasi in range(1, 13):
+        occupied = sorted(
+            interval
+            for house in rule.houses
+            for interval in index.intervals(rule.transit_planet, Granularity.RASI, (natal_rasi + house - 2) % 12 + 1, range_start, range_end)
+        )
+        merged: list[tuple[datetime, datetime]] = []
+        for interval_start, interval_end in occupied:
+            if merged and merged[-1][1] == interval_start:
+                merged[-1] = (merged[-1][0], interval_end)
+            else:
+                merged.append((interval_start, interval_end))
+        timestamps = [[window_start.timestamp(), window_end.timestamp()] for window_start, window_end in merged]
+        windows = np.array(timestamps, dtype=np.float64).reshape(-1, 2).astype(np.int64)
+        starts.append(windows[:, 0])
+        ends.append(windows[:, 1])
+    counts = np.array([0] + [len(rasi_starts) for rasi_starts in starts])
+    offsets = np.cumsum(counts) - counts
+
+    rasis = np.atleast_1d(np.asarray(natal_rasis, dtype=np.int64))
+    user_counts = counts[rasis]
+    person = np.repeat(np.arange(len(rasis)), user_counts)
+    rows = np.repeat(offsets[rasis], user_counts) + np.arange(len(person)) - np.repeat(np.cumsum(user_counts) - user_counts, user_counts)
+
+    return TransitWindows(
+        person,
+        np.concatenate(starts)[rows].astype("datetime64[s]"),
+        np.concatenate(ends)[rows].astype("datetime64[s]"),
+    )
+
+
+def get_major_transit_windows(
+    index: IngressIndex,
+    natal_moon_rasis: ArrayLike,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> dict[str, TransitWindows]:
+    """Return the Sade Sati, Ashtama Shani and favourable Jupiter periods for arrays of natal Moon rasis.
+
+    Args:
+        index (IngressIndex): An index holding the rasi ingresses of Saturn and Jupiter.
+        natal_moon_rasis (ArrayLike): The `Rasis` value of the natal Moon of every user.
+        start (datetime | None, optional): The start of the range. Defaults to the start of the index.
+        end (datetime | None, optional): The end of the range. Defaults to the end of the index.
+
+    Returns:
+        dict[str, TransitWindows]: The periods of every rule in `MAJOR_TRANSIT_RULES`, keyed by rule name.
+
+    """
+    rules = {rule.name: rule for rule in DEFAULT_TRANSIT_RULES}
+
+    return {name: get_transit_windows(index, rules[name], natal_moon_rasis, start, end) for name in MAJOR_TRANSIT_RULES}
+
+
+def get_natal_rasis_hit(transit_longitude: float, houses: Sequence[int]) -> list[int]:
+    """Return the natal rasis from which a transiting longitude falls in the given houses.
+
+    Args:
+        transit_longitude (float): The sidereal longitude of the transiting planet in degrees.
+        houses (Sequence[int]): The houses (1 to 12) counted from the natal rasi.
+
+    Returns:
+        list[int]: The `Rasis` values of the natal rasis hit, in ascending order.
+
+    """
+    return [int(rasi) for rasi in np.flatnonzero(_get_natal_rasi_mask(transit_longitude, houses))]
+
+
+def _get_natal_rasi_mask(transit_longitude: float, houses: Sequence[int]) -> NDArray[np.bool_]:
+    """Return a table indexed by `Rasis` value telling whether a natal rasi is hit."""
+    transit_rasi = int(transit_longitude % DEGREE_MAX // RASI_SPAN)
+    mask = np.zeros(13, dtype=np.bool_)
+    for house in houses:
+        mask[(transit_rasi - (house - 1)) % 12 + 1] = True
+
+    return mask
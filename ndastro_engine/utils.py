@@ -2,14 +2,25 @@
 
 This module provides:
 - get_app_data_dir: Get the application data directory for the given app name.
+- normalize_degree, dms2dd, dd2dms, dd2dmsstr: Angle helpers.
+- to_epoch_seconds: Convert datetimes or datetime64 values to POSIX seconds.
 """
 
 import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import numpy as np
 
 from ndastro_engine.constants import DEGREE_MAX, OS_MAC, OS_WIN
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import datetime
+
+    from numpy.typing import NDArray
+
 
 def get_app_data_dir(appname: str) -> Path:
     """Get the application data directory for the given app name.
@@ -99,3 +110,19 @@ def dd2dmsstr(decimal_degrees: float) -> str:
     degrees, minutes, seconds, sign = dd2dms(decimal_degrees)
     sign_str = "" if sign >= 0 else "-"
     return f"{sign_str}{degrees}° {minutes}' {seconds:.2f}\""
+
+
+def to_epoch_seconds(times: "Sequence[datetime] | NDArray[np.datetime64]") -> "NDArray[np.float64]":
+    """Convert timezone-aware datetimes or UTC datetime64 values to POSIX seconds.
+
+    Args:
+        times (Sequence[datetime] | NDArray[np.datetime64]): The instants to convert.
+
+    Returns:
+        NDArray[np.float64]: The seconds since 1970-01-01T00:00:00 UTC of every instant.
+
+    """
+    if isinstance(times, np.ndarray) and np.issubdtype(times.dtype, np.datetime64):
+        return cast("NDArray[np.float64]", times.astype("datetime64[us]").astype(np.int64) / 1e6)
+
+    return np.array([time.timestamp() for time in cast("Sequence[datetime]", times)], dtype=np.float64)
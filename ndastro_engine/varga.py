@@ -0,0 +1,110 @@
+"""Divisional chart (varga) calculations over arrays of sidereal longitudes.
+
+This module maps sidereal longitudes to the rasi they occupy in the Parashari divisional
+charts (D1 to D60). Every varga divides each rasi into equal parts, so the rasi of a
+longitude is a lookup in a precomputed table indexed by the part of the zodiac it falls in:
+- get_varga_rasis: the rasis of a whole array of longitudes for several vargas in one call
+- get_varga_rasi: the rasi of a single longitude in one varga
+"""
+
+from collections.abc import Sequence
+from typing import cast
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ndastro_engine.constants import DEGREE_MAX
+from ndastro_engine.enums import Rasis, Vargas
+
+# 0-based rasis of the first part of each rasi, for vargas counted from a fixed rasi that
+# depends on whether the rasi is odd or even (indexed by rasi % 2) or movable, fixed or dual
+# (indexed by rasi % 3).
+_ODD_EVEN_STARTS = {
+    Vargas.CHATURVIMSAMSA: (4, 3),
+    Vargas.KHAVEDAMSA: (0, 6),
+}
+_MODALITY_STARTS = {
+    Vargas.SHODASAMSA: (0, 4, 8),
+    Vargas.VIMSAMSA: (0, 8, 4),
+    Vargas.AKSHAVEDAMSA: (0, 4, 8),
+}
+# Vargas counted from the rasi itself in odd rasis and from the given house of it in even ones.
+_ODD_EVEN_OFFSETS = {
+    Vargas.SAPTAMSA: (0, 6),
+    Vargas.DASAMSA: (0, 8),
+}
+# Vargas counted from the rasi itself, with the step between the rasis of consecutive parts.
+_SELF_STEPS = {
+    Vargas.RASI: 1,
+    Vargas.DREKKANA: 4,
+    Vargas.CHATURTHAMSA: 3,
+    Vargas.DWADASAMSA: 1,
+    Vargas.SHASHTIAMSA: 1,
+}
+# Trimsamsa rasis of each degree of odd and even rasis: Mars, Saturn, Jupiter, Mercury and
+# Venus rule 5°, 5°, 8°, 7° and 5° of odd rasis, in the reverse order in even rasis.
+_TRIMSAMSA_ODD = (0,) * 5 + (10,) * 5 + (8,) * 8 + (2,) * 7 + (6,) * 5
+_TRIMSAMSA_EVEN = (1,) * 5 + (5,) * 7 + (11,) * 8 + (9,) * 5 + (7,) * 5
+
+
+def get_varga_rasis(longitudes: ArrayLike, vargas: Sequence[Vargas]) -> NDArray[np.int8]:
+    """Return the rasis occupied by sidereal longitudes in several divisional charts.
+
+    Args:
+        longitudes (ArrayLike): The sidereal longitudes in degrees, of any shape, e.g. (n_charts, n_planets).
+        vargas (Sequence[Vargas]): The divisional charts to compute.
+
+    Returns:
+        NDArray[np.int8]: The `Rasis` values, of shape (len(vargas), *longitudes.shape).
+
+    """
+    positions = np.asarray(longitudes, dtype=np.float64) % DEGREE_MAX
+    rasis = np.empty((len(vargas), *positions.shape), dtype=np.int8)
+    for row, varga in enumerate(vargas):
+        table = _VARGA_TABLES[varga]
+        parts = np.floor(positions / varga.span).astype(np.int64) % len(table)
+        rasis[row] = table[parts]
+
+    return rasis
+
+
+def get_varga_rasi(longitude: float, varga: Vargas) -> Rasis:
+    """Return the rasi occupied by a sidereal longitude in a divisional chart.
+
+    Args:
+        longitude (float): The sidereal longitude in degrees.
+        varga (Vargas): The divisional chart.
+
+    Returns:
+        Rasis: The rasi in the divisional chart.
+
+    """
+    return Rasis(int(get_varga_rasis([longitude], [varga])[0, 0]))
+
+
+def _build_varga_table(varga: Vargas) -> NDArray[np.int8]:
+    """Return the `Rasis` value of every part of the zodiac in a varga, 12 * D-number parts in all."""
+    parts = varga.value
+    rasi, part = np.divmod(np.arange(12 * parts), parts)
+
+    if varga == Vargas.HORA:
+        # Odd rasis give Leo then Cancer, even rasis Cancer then Leo.
+        signs = np.where(rasi % 2 == part, 4, 3)
+    elif varga == Vargas.TRIMSAMSA:
+        signs = np.where(rasi % 2 == 0, np.array(_TRIMSAMSA_ODD)[part], np.array(_TRIMSAMSA_EVEN)[part])
+    elif varga in _ODD_EVEN_STARTS:
+        signs = np.array(_ODD_EVEN_STARTS[varga])[rasi % 2] + part
+    elif varga in _MODALITY_STARTS:
+        signs = np.array(_MODALITY_STARTS[varga])[rasi % 3] + part
+    elif varga in _ODD_EVEN_OFFSETS:
+        signs = rasi + np.array(_ODD_EVEN_OFFSETS[varga])[rasi % 2] + part
+    elif varga in _SELF_STEPS:
+        signs = rasi + _SELF_STEPS[varga] * part
+    else:
+        # Navamsa and saptavimsamsa run through the zodiac without restarting at each rasi.
+        signs = rasi * parts + part
+
+    return cast("NDArray[np.int8]", (signs % 12 + 1).astype(np.int8))
+
+
+_VARGA_TABLES = {varga: _build_varga_table(varga) for varga in Vargas}
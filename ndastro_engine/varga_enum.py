@@ -0,0 +1,56 @@
+"""Module to hold divisional chart (varga) enums."""
+
+from enum import IntEnum
+
+
+class Vargas(IntEnum):
+    """Enum to hold the sixteen Parashari divisional charts, valued by their D-number."""
+
+    RASI = 1
+    HORA = 2
+    DREKKANA = 3
+    CHATURTHAMSA = 4
+    SAPTAMSA = 7
+    NAVAMSA = 9
+    DASAMSA = 10
+    DWADASAMSA = 12
+    SHODASAMSA = 16
+    VIMSAMSA = 20
+    CHATURVIMSAMSA = 24
+    SAPTAVIMSAMSA = 27
+    TRIMSAMSA = 30
+    KHAVEDAMSA = 40
+    AKSHAVEDAMSA = 45
+    SHASHTIAMSA = 60
+
+    def __str__(self) -> str:
+        """Return the D-number of the varga.
+
+        Returns:
+            str: the D-number of the varga, e.g. D9
+
+        """
+        return f"D{self.value}"
+
+    @property
+    def span(self) -> float:
+        """Return the width in degrees of one part of a rasi in this varga.
+
+        Returns:
+            float: 30° divided by the D-number.
+
+        """
+        return 30 / self.value
+
+    @staticmethod
+    def to_list() -> list[str]:
+        """Convert enum to list of enum item name.
+
+        Returns:
+            list[str]: list of enum item name
+
+        """
+        return [el.name for el in Vargas]
+
+
+__all__ = ["Vargas"]
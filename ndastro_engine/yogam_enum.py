@@ -0,0 +1,57 @@
+"""Module to hold yogam enums."""
+
+from enum import IntEnum
+
+
+class Yogams(IntEnum):
+    """Enum to hold the 27 nithya yogams."""
+
+    VISHKAMBAM = 1
+    PREETHI = 2
+    AAYUSHMAN = 3
+    SOWBHAAGYAM = 4
+    SOBHANAM = 5
+    ATHIGANDAM = 6
+    SUKARMAM = 7
+    DHRUTHI = 8
+    SOOLAM = 9
+    GANDAM = 10
+    VRUDHDHI = 11
+    DHRUVAM = 12
+    VYAAGHAATHAM = 13
+    HARSHANAM = 14
+    VAJRAM = 15
+    SIDHDHI = 16
+    VYATHEEPAATHAM = 17
+    VARIYAAN = 18
+    PARIGHAM = 19
+    SIVAM = 20
+    SIDHDHAM = 21
+    SAADHYAM = 22
+    SUBHAM = 23
+    SUBHRAM = 24
+    BRAHMAM = 25
+    INDHIRAM = 26
+    VAIDHRUTHI = 27
+
+    def __str__(self) -> str:
+        """Return name of the yogam.
+
+        Returns:
+            str: name of the yogam
+
+        """
+        return self.name
+
+    @staticmethod
+    def to_list() -> list[str]:
+        """Convert enum to list of enum item name.
+
+        Returns:
+            list[str]: list of enum item name
+
+        """
+        return [el.name for el in Yogams]
+
+
+__all__ = ["Yogams"]
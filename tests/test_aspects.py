@@ -0,0 +1,87 @@
+"""Tests for aspect and conjunction searches in ndastro engine."""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+from ndastro_engine.aspects import find_aspects, get_pair_aspects
+from ndastro_engine.core import get_planet_position
+from ndastro_engine.enums import Aspects, Planets
+from ndastro_engine.models import AspectEvent
+
+
+class TestGetPairAspects:
+    """Test cases for get_pair_aspects function."""
+
+    @pytest.mark.unit
+    def test_special_drishti_in_both_directions(self) -> None:
+        """Test that the special aspects of both planets are searched."""
+        aspects = get_pair_aspects(Planets.MARS, Planets.SATURN)
+
+        assert (Planets.MARS, Planets.SATURN, Aspects.CONJUNCTION) in aspects
+        assert (Planets.MARS, Planets.SATURN, Aspects.EIGHTH_HOUSE) in aspects
+        assert (Planets.SATURN, Planets.MARS, Aspects.TENTH_HOUSE) in aspects
+        assert (Planets.SATURN, Planets.MARS, Aspects.OPPOSITION) not in aspects
+
+    @pytest.mark.unit
+    def test_nodes_have_no_aspects(self) -> None:
+        """Test that Rahu and Kethu, always opposite, are not searched against each other."""
+        assert get_pair_aspects(Planets.RAHU, Planets.KETHU) == []
+
+
+class TestFindAspects:
+    """Test cases for find_aspects function."""
+
+    @pytest.mark.unit
+    def test_great_conjunction_of_2020(self) -> None:
+        """Test that the Jupiter-Saturn conjunction of December 2020 is found."""
+        events = find_aspects(
+            datetime(2020, 12, 1, tzinfo=pytz.UTC),
+            datetime(2021, 1, 1, tzinfo=pytz.UTC),
+            12.97,
+            77.59,
+            [Planets.JUPITER, Planets.SATURN],
+            aspects=[Aspects.CONJUNCTION],
+        )
+
+        assert len(events) == 1
+        assert isinstance(events[0], AspectEvent)
+        assert events[0].planet_a == Planets.JUPITER
+        assert events[0].planet_b == Planets.SATURN
+        assert abs(events[0].time - datetime(2020, 12, 21, 18, tzinfo=pytz.UTC)) < timedelta(hours=12)
+
+    @pytest.mark.unit
+    def test_retrograde_triple_conjunction(self) -> None:
+        """Test that the three passes of the 1980-81 Jupiter-Saturn conjunction are all found."""
+        events = find_aspects(
+            datetime(1980, 11, 1, tzinfo=pytz.UTC),
+            datetime(1981, 9, 1, tzinfo=pytz.UTC),
+            12.97,
+            77.59,
+            [Planets.JUPITER, Planets.SATURN],
+            aspects=[Aspects.CONJUNCTION],
+        )
+
+        expected = [datetime(1980, 12, 31, tzinfo=pytz.UTC), datetime(1981, 3, 4, tzinfo=pytz.UTC), datetime(1981, 7, 24, tzinfo=pytz.UTC)]
+        assert len(events) == len(expected)
+        for event, when in zip(events, expected, strict=True):
+            assert abs(event.time - when) < timedelta(days=2)
+
+    @pytest.mark.unit
+    def test_events_are_exact_and_sorted(self) -> None:
+        """Test that every event is exact to a fraction of an arcsecond and events are chronological."""
+        events = find_aspects(datetime(2024, 1, 1, tzinfo=pytz.UTC), datetime(2024, 1, 15, tzinfo=pytz.UTC), 12.97, 77.59)
+
+        assert events
+        assert [event.time for event in events] == sorted(event.time for event in events)
+        for event in events:
+            position_a = get_planet_position(event.planet_a, 12.97, 77.59, event.time).longitude
+            position_b = get_planet_position(event.planet_b, 12.97, 77.59, event.time).longitude
+            assert abs((position_b - position_a - event.aspect.angle + 180) % 360 - 180) < 1 / 3600
+
+    @pytest.mark.unit
+    def test_ascendant_is_rejected(self) -> None:
+        """Test that the ascendant cannot be searched on the shared grid."""
+        with pytest.raises(ValueError, match="not the ascendant"):
+            find_aspects(datetime(2024, 1, 1, tzinfo=pytz.UTC), datetime(2024, 1, 2, tzinfo=pytz.UTC), 12.97, 77.59, [Planets.ASCENDANT, Planets.SUN])
@@ -0,0 +1,134 @@
+"""Tests for the asyncio front end in ndastro engine."""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+from ndastro_engine.async_api import AsyncChartService, AsyncChartStats
+from ndastro_engine.core import find_retrograde_periods, get_planets_position
+from ndastro_engine.enums import Planets
+
+START = datetime(2024, 3, 1, tzinfo=pytz.UTC)
+
+_calls: list[int] = []
+_release = threading.Event()
+
+
+def _gated_square(value: int) -> int:
+    """Record the call and return the square once the gate is opened."""
+    _calls.append(value)
+    _release.wait(5)
+    return value * value
+
+
+@pytest.fixture(autouse=True)
+def gate() -> None:
+    """Reset the recorded calls and close the gate before every test."""
+    _calls.clear()
+    _release.clear()
+
+
+class TestAsyncChartService:
+    """Test cases for AsyncChartService class."""
+
+    @pytest.mark.unit
+    def test_identical_requests_are_coalesced(self) -> None:
+        """Test that identical requests in flight share one computation."""
+
+        async def scenario() -> tuple[list[int], AsyncChartStats]:
+            async with AsyncChartService() as service:
+                tasks = [asyncio.ensure_future(service.run(_gated_square, 3)) for _ in range(3)]
+                await asyncio.sleep(0.05)
+                stats = service.stats
+                _release.set()
+                return list(await asyncio.gather(*tasks)), stats
+
+        results, stats = asyncio.run(scenario())
+
+        assert results == [9, 9, 9]
+        assert _calls == [3]
+        assert stats == AsyncChartStats(pending=1, in_flight=1, coalesced=2)
+
+    @pytest.mark.unit
+    def test_requests_wait_for_a_slot(self) -> None:
+        """Test that no more than max_pending computations are submitted at a time."""
+
+        async def scenario() -> tuple[list[int], AsyncChartStats]:
+            async with AsyncChartService(max_pending=1) as service:
+                tasks = [asyncio.ensure_future(service.run(_gated_square, value)) for value in range(3)]
+                await asyncio.sleep(0.05)
+                stats = service.stats
+                _release.set()
+                return list(await asyncio.gather(*tasks)), stats
+
+        results, stats = asyncio.run(scenario())
+
+        assert results == [0, 1, 4]
+        assert stats == AsyncChartStats(pending=1, in_flight=3, coalesced=0)
+
+    @pytest.mark.unit
+    def test_cancellation_spares_shared_computations(self) -> None:
+        """Test that a computation keeps running for its other waiters and is cancelled with the last one."""
+
+        async def scenario() -> tuple[int, AsyncChartStats]:
+            async with AsyncChartService(max_pending=1) as service:
+                first = asyncio.ensure_future(service.run(_gated_square, 3))
+                second = asyncio.ensure_future(service.run(_gated_square, 3))
+                queued = asyncio.ensure_future(service.run(_gated_square, 4))
+                await asyncio.sleep(0.05)
+                first.cancel()
+                queued.cancel()
+                await asyncio.sleep(0.05)
+                stats = service.stats
+                _release.set()
+                return await second, stats
+
+        result, stats = asyncio.run(scenario())
+
+        assert result == 9
+        assert _calls == [3]
+        assert stats.in_flight == 1
+
+    @pytest.mark.unit
+    def test_request_after_last_cancellation_computes_afresh(self) -> None:
+        """Test that a request arriving right after the last waiter cancelled does not join the cancelled computation."""
+
+        async def scenario() -> int:
+            async with AsyncChartService() as service:
+                first = asyncio.ensure_future(service.run(_gated_square, 5))
+                await asyncio.sleep(0.05)
+                first.cancel()
+                # One loop iteration: the waiter cancels the computation, whose task has not finished yet.
+                await asyncio.sleep(0)
+                second = asyncio.ensure_future(service.run(_gated_square, 5))
+                _release.set()
+                return await second
+
+        assert asyncio.run(scenario()) == 25
+        assert _calls == [5, 5]
+
+    @pytest.mark.unit
+    def test_chart_requests_match_direct_computation(self) -> None:
+        """Test that chart requests and chunked retrograde scans give the results of the core functions."""
+        end = START + timedelta(days=120)
+
+        async def scenario() -> tuple[dict[Planets, object], list[tuple[datetime, datetime]]]:
+            async with AsyncChartService(search_chunk=timedelta(days=500)) as service:
+                return await asyncio.gather(
+                    service.get_planets_position([], 12.97, 77.59, START),
+                    service.find_retrograde_periods(START, end, "mercury", 12.97, 77.59),
+                )
+
+        positions, periods = asyncio.run(scenario())
+
+        assert positions == get_planets_position([], 12.97, 77.59, START)
+        assert periods == find_retrograde_periods(START, end, "mercury", 12.97, 77.59)
+
+    @pytest.mark.unit
+    def test_invalid_settings_are_rejected(self) -> None:
+        """Test that a max_pending of zero raises ValueError."""
+        with pytest.raises(ValueError, match="positive max_pending"):
+            AsyncChartService(max_pending=0)
@@ -0,0 +1,101 @@
+"""Tests for the process-pool batch executor in ndastro engine."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+import pytz
+from skyfield.almanac import find_discrete, sunrise_sunset
+from skyfield.toposlib import wgs84
+
+from ndastro_engine.batch import BatchExecutor, find_discrete_parallel, find_retrograde_periods_parallel, get_planets_positions_batch
+from ndastro_engine.config import eph, ts
+from ndastro_engine.core import find_retrograde_periods, get_planets_position
+from ndastro_engine.enums import Planets
+
+START = datetime(2024, 3, 1, tzinfo=pytz.UTC)
+
+# The precision to which find_discrete refines a change, in days.
+PRECISION_DAYS = 0.001 / 86400
+
+
+class TestBatchExecutor:
+    """Test cases for BatchExecutor class."""
+
+    @pytest.mark.unit
+    def test_results_stream_in_input_order(self) -> None:
+        """Test that results of a lazily read input come back in input order across chunks."""
+        with BatchExecutor(abs, processes=2, chunk_size=3) as executor:
+            results = list(executor.map(value - 50 for value in range(100)))
+
+        assert results == [abs(value - 50) for value in range(100)]
+
+    @pytest.mark.unit
+    def test_start_method_can_be_chosen(self) -> None:
+        """Test that workers started without fork run a picklable function."""
+        with BatchExecutor(abs, processes=1, start_method="spawn") as executor:
+            assert list(executor.map([-1, 2, -3])) == [1, 2, 3]
+
+    @pytest.mark.unit
+    def test_map_outside_context_is_rejected(self) -> None:
+        """Test that mapping before the workers are started raises RuntimeError."""
+        with pytest.raises(RuntimeError, match="inside a"):
+            list(BatchExecutor(abs, processes=1).map([1]))
+
+    @pytest.mark.unit
+    def test_invalid_chunk_size_is_rejected(self) -> None:
+        """Test that a chunk size of zero raises ValueError."""
+        with pytest.raises(ValueError, match="positive number of processes and chunk size"):
+            BatchExecutor(abs, processes=1, chunk_size=0)
+
+
+class TestGetPlanetsPositionsBatch:
+    """Test cases for get_planets_positions_batch function."""
+
+    @pytest.mark.unit
+    def test_matches_serial_computation(self) -> None:
+        """Test that the worker results equal get_planets_position row by row."""
+        rows = [(12.97 + index / 10, 77.59, START + timedelta(hours=index)) for index in range(10)]
+        planets = [Planets.SUN, Planets.MOON, Planets.ASCENDANT]
+
+        results = list(get_planets_positions_batch(rows, planets, processes=2, chunk_size=4))
+
+        assert results == [get_planets_position(planets, lat, lon, given_time) for lat, lon, given_time in rows]
+
+
+class TestFindDiscreteParallel:
+    """Test cases for find_discrete_parallel function."""
+
+    @pytest.mark.unit
+    def test_matches_serial_search(self) -> None:
+        """Test that the chunked search finds the changes of find_discrete to within its millisecond precision."""
+        function = sunrise_sunset(eph, wgs84.latlon(12.97, 77.59))
+        start, end = ts.utc(START), ts.utc(START + timedelta(days=3))
+
+        times, values = find_discrete_parallel(start, end, function, processes=2, chunk_samples=5)
+        expected_times, expected_values = find_discrete(start, end, function)
+
+        assert np.allclose(times.tt, expected_times.tt, rtol=0, atol=PRECISION_DAYS)
+        assert values.tolist() == expected_values.tolist()
+
+    @pytest.mark.unit
+    def test_reversed_range_is_rejected(self) -> None:
+        """Test that a start after the end raises ValueError."""
+        with pytest.raises(ValueError, match="start before the end"):
+            find_discrete_parallel(ts.utc(START), ts.utc(START - timedelta(days=1)), abs, processes=1)
+
+
+class TestFindRetrogradePeriodsParallel:
+    """Test cases for find_retrograde_periods_parallel function."""
+
+    @pytest.mark.unit
+    def test_matches_serial_search(self) -> None:
+        """Test that periods straddling chunk boundaries are joined into the periods of the serial search."""
+        end = START + timedelta(days=730)
+
+        periods = find_retrograde_periods_parallel(START, end, "mercury", 12.97, 77.59, processes=2, chunk_samples=3)
+        expected = find_retrograde_periods(START, end, "mercury", 12.97, 77.59)
+
+        assert len(periods) == len(expected) > 0
+        for period, expected_period in zip(periods, expected, strict=True):
+            assert all(abs(time - expected_time) < timedelta(milliseconds=1) for time, expected_time in zip(period, expected_period, strict=True))
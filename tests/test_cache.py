@@ -0,0 +1,119 @@
+"""Tests for the chart cache in ndastro engine."""
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+import pytz
+
+from ndastro_engine.cache import ChartCache, ChartCacheStats, chart_cached, disable_chart_cache, enable_chart_cache, get_chart_cache_stats
+from ndastro_engine.core import get_planet_position, get_planets_position
+from ndastro_engine.enums import Planets
+
+GIVEN_TIME = datetime(2024, 3, 1, 6, tzinfo=pytz.UTC)
+
+
+@pytest.fixture
+def cache() -> Iterator[ChartCache]:
+    """Enable a chart cache for the duration of a test."""
+    yield enable_chart_cache(max_entries=100)
+    disable_chart_cache()
+
+
+@chart_cached
+def _echo(lat: float, lon: float, given_time: datetime) -> tuple[float, float, datetime]:
+    """Return the arguments the function is evaluated with."""
+    return lat, lon, given_time
+
+
+class TestChartCache:
+    """Test cases for ChartCache class."""
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used_entries(self) -> None:
+        """Test that the entry bound drops the least recently used entry."""
+        chart_cache = ChartCache(max_entries=2)
+        chart_cache.put("a", 1)
+        chart_cache.put("b", 2)
+        chart_cache.get_or_compute("a", lambda: 0)
+        chart_cache.put("c", 3)
+
+        assert chart_cache.get_or_compute("a", lambda: 0) == 1
+        assert chart_cache.get_or_compute("b", lambda: 0) == 0
+        assert chart_cache.stats.evictions == 2
+
+    @pytest.mark.unit
+    def test_byte_bound_limits_the_size(self) -> None:
+        """Test that the size bound keeps the estimated size of the entries below it."""
+        chart_cache = ChartCache(max_entries=None, max_bytes=2000)
+        for key in range(100):
+            chart_cache.put(key, (1.0, 2.0, 3.0))
+
+        assert 0 < chart_cache.stats.size_bytes <= 2000
+        assert chart_cache.stats.entries < 100
+
+    @pytest.mark.unit
+    def test_hit_rate(self) -> None:
+        """Test that the hit rate is the share of calls answered from the cache."""
+        chart_cache = ChartCache()
+        for _ in range(4):
+            chart_cache.get_or_compute("key", lambda: 1)
+
+        assert chart_cache.stats == ChartCacheStats(hits=3, misses=1, evictions=0, entries=1, size_bytes=chart_cache.stats.size_bytes)
+        assert chart_cache.stats.hit_rate == 0.75
+
+    @pytest.mark.unit
+    def test_invalid_bounds_are_rejected(self) -> None:
+        """Test that a cache without bounds raises ValueError."""
+        with pytest.raises(ValueError, match="max_entries, max_bytes or both"):
+            ChartCache(max_entries=None)
+
+
+class TestChartCached:
+    """Test cases for chart_cached decorator."""
+
+    @pytest.mark.unit
+    def test_disabled_by_default(self) -> None:
+        """Test that calls go straight to the function while no cache is enabled."""
+        assert get_chart_cache_stats() is None
+        assert _echo(12.971234, 77.59, GIVEN_TIME + timedelta(milliseconds=300)) == (12.971234, 77.59, GIVEN_TIME + timedelta(milliseconds=300))
+
+    @pytest.mark.unit
+    @pytest.mark.usefixtures("cache")
+    def test_calls_are_quantised(self) -> None:
+        """Test that calls in the same bucket are computed once, at the rounded time and location."""
+        first = _echo(12.97001, 77.59, GIVEN_TIME + timedelta(milliseconds=300))
+        second = _echo(12.96999, 77.59, GIVEN_TIME - timedelta(milliseconds=300))
+
+        assert first == second == (12.97, 77.59, GIVEN_TIME)
+        assert get_chart_cache_stats() == ChartCacheStats(hits=1, misses=1, evictions=0, entries=1, size_bytes=get_chart_cache_stats().size_bytes)
+
+    @pytest.mark.unit
+    @pytest.mark.usefixtures("cache")
+    def test_core_functions_are_memoised(self) -> None:
+        """Test that repeated core calls are answered from the cache with the uncached values."""
+        disable_chart_cache()
+        expected = get_planets_position([Planets.SUN, Planets.MOON], 12.97, 77.59, GIVEN_TIME)
+        chart_cache = enable_chart_cache(max_entries=100)
+
+        assert get_planets_position([Planets.SUN, Planets.MOON], 12.97, 77.59, GIVEN_TIME) == expected
+        assert get_planets_position([Planets.SUN, Planets.MOON], 12.97, 77.59, GIVEN_TIME) == expected
+        assert get_planet_position(Planets.MOON, 12.97, 77.59, GIVEN_TIME) == expected[Planets.MOON]
+        assert (chart_cache.stats.hits, chart_cache.stats.entries) == (3, 2)
+
+    @pytest.mark.unit
+    @pytest.mark.usefixtures("cache")
+    def test_array_times_bypass_the_cache(self) -> None:
+        """Test that calls with an array of times are computed directly and not stored."""
+        times = np.array([GIVEN_TIME, GIVEN_TIME + timedelta(hours=1)])
+
+        assert _echo(12.97001, 77.59, times)[2] is times
+        assert get_chart_cache_stats().entries == 0
+
+    @pytest.mark.unit
+    @pytest.mark.usefixtures("cache")
+    def test_naive_times_are_rejected(self) -> None:
+        """Test that a naive time raises ValueError instead of being read as local time."""
+        with pytest.raises(ValueError, match="timezone-aware"):
+            _echo(12.97, 77.59, GIVEN_TIME.replace(tzinfo=None))
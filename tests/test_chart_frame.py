@@ -0,0 +1,73 @@
+"""Tests for the columnar chart container in ndastro engine."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+import pytz
+
+from ndastro_engine.chart_frame import ChartFrame
+from ndastro_engine.enums import Planets
+from ndastro_engine.models import PlanetPosition
+
+START = datetime(2024, 3, 1, tzinfo=pytz.UTC)
+TIMES = [START + timedelta(hours=hour) for hour in range(5)]
+PLANETS = (Planets.SUN, Planets.MOON, Planets.ASCENDANT)
+
+
+@pytest.fixture
+def frame() -> ChartFrame:
+    """Return a frame of five instants and three planets with distinct values."""
+    positions = np.arange(len(TIMES) * len(PLANETS) * 6, dtype=np.float64).reshape(len(TIMES), len(PLANETS), 6)
+    return ChartFrame.from_positions(
+        TIMES, [{planet: PlanetPosition(*positions[row, column]) for column, planet in enumerate(PLANETS)} for row in range(len(TIMES))]
+    )
+
+
+class TestChartFrame:
+    """Test cases for ChartFrame class."""
+
+    @pytest.mark.unit
+    def test_round_trip_through_dicts(self, frame: ChartFrame) -> None:
+        """Test that a frame built from charts converts back to the same charts and times."""
+        assert frame.shape == (5, 3, 6)
+        assert frame.to_datetimes() == TIMES
+        assert ChartFrame.from_positions(TIMES, frame.to_dicts()).to_dicts() == frame.to_dicts()
+        assert frame.to_dicts()[1][Planets.MOON] == PlanetPosition(24.0, 25.0, 26.0, 27.0, 28.0, 29.0)
+
+    @pytest.mark.unit
+    def test_slices_are_views(self, frame: ChartFrame) -> None:
+        """Test that time slices, planets and fields share the array of the frame."""
+        assert np.shares_memory(frame[1:3].positions, frame.positions)
+        assert np.shares_memory(frame.planet(Planets.MOON), frame.positions)
+        assert np.shares_memory(frame.field("longitude"), frame.positions)
+        assert frame.between(TIMES[1], TIMES[3]).to_datetimes() == TIMES[1:3]
+        assert frame[-1].to_datetimes() == TIMES[-1:]
+        assert frame.field("longitude")[2].tolist() == [37.0, 43.0, 49.0]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("suffix", [".npz", ".npy"])
+    def test_save_and_load(self, frame: ChartFrame, tmp_path: Path, suffix: str) -> None:
+        """Test that a saved frame loads with the same times, planets and positions."""
+        frame.save(tmp_path / f"charts{suffix}")
+        loaded = ChartFrame.load(tmp_path / f"charts{suffix}")
+
+        assert loaded.planets == PLANETS
+        assert np.array_equal(loaded.times, frame.times)
+        assert np.array_equal(loaded.positions, frame.positions)
+
+    @pytest.mark.unit
+    def test_npy_can_be_memory_mapped(self, frame: ChartFrame, tmp_path: Path) -> None:
+        """Test that a memory-mapped `.npy` frame views the file."""
+        frame.save(tmp_path / "charts.npy")
+        loaded = ChartFrame.load(tmp_path / "charts.npy", mmap_mode="r")
+
+        assert not loaded.positions.flags.owndata
+        assert loaded.to_dicts() == frame.to_dicts()
+
+    @pytest.mark.unit
+    def test_mismatched_shape_is_rejected(self) -> None:
+        """Test that positions not matching the times and planets raise ValueError."""
+        with pytest.raises(ValueError, match="Expected positions of shape"):
+            ChartFrame(np.array(["2024-03-01"], dtype="datetime64[ms]"), PLANETS, np.zeros((1, 2, 6)))
@@ -0,0 +1,69 @@
+"""Tests for combustion interval searches in ndastro engine."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+import pytz
+
+from ndastro_engine.combustion import find_combustion_intervals, is_combust
+from ndastro_engine.core import get_planet_position
+from ndastro_engine.enums import Planets
+
+START = datetime(2024, 4, 1, tzinfo=pytz.UTC)
+END = datetime(2024, 7, 1, tzinfo=pytz.UTC)
+
+
+class TestFindCombustionIntervals:
+    """Test cases for find_combustion_intervals function."""
+
+    @pytest.mark.unit
+    def test_jupiter_combust_around_conjunction(self) -> None:
+        """Test that Jupiter is combust for about a month around its conjunction of 18 May 2024."""
+        intervals = find_combustion_intervals(START, END, 12.97, 77.59, [Planets.JUPITER])[Planets.JUPITER]
+
+        assert len(intervals.start) == 1
+        assert intervals.start[0] < np.datetime64("2024-05-18") < intervals.end[0]
+        assert np.timedelta64(25, "D") < intervals.end[0] - intervals.start[0] < np.timedelta64(35, "D")
+
+    @pytest.mark.unit
+    def test_moon_combust_at_every_new_moon(self) -> None:
+        """Test that the Moon is combust for about two days around each new moon."""
+        intervals = find_combustion_intervals(START, END, 12.97, 77.59, [Planets.MOON])[Planets.MOON]
+
+        assert len(intervals.start) == 3
+        assert ((intervals.end - intervals.start) < np.timedelta64(3, "D")).all()
+
+    @pytest.mark.unit
+    def test_boundaries_match_the_orb(self) -> None:
+        """Test that the distance from the Sun crosses the orb at the interval boundaries."""
+        start = find_combustion_intervals(START, END, 12.97, 77.59, [Planets.JUPITER])[Planets.JUPITER].start[0]
+        when = datetime.fromtimestamp(start.astype("datetime64[ms]").astype(np.int64) / 1000, tz=pytz.UTC)
+
+        def distance(time: datetime) -> float:
+            sun = get_planet_position(Planets.SUN, 12.97, 77.59, time).longitude
+            jupiter = get_planet_position(Planets.JUPITER, 12.97, 77.59, time).longitude
+            return abs((jupiter - sun + 180) % 360 - 180)
+
+        assert distance(when - timedelta(minutes=10)) > 11.0 > distance(when + timedelta(minutes=10))
+
+    @pytest.mark.unit
+    def test_planet_without_orb_is_rejected(self) -> None:
+        """Test that planets without a combustion orb raise ValueError."""
+        with pytest.raises(ValueError, match="No combustion orb for RAHU"):
+            find_combustion_intervals(START, END, 12.97, 77.59, [Planets.RAHU])
+
+
+class TestIsCombust:
+    """Test cases for is_combust function."""
+
+    @pytest.mark.unit
+    def test_lookup_matches_intervals(self) -> None:
+        """Test that instants inside and outside the precomputed intervals are classified."""
+        intervals = find_combustion_intervals(START, END, 12.97, 77.59, [Planets.JUPITER])[Planets.JUPITER]
+
+        times = [datetime(2024, 4, 10, tzinfo=pytz.UTC), datetime(2024, 5, 18, tzinfo=pytz.UTC), datetime(2024, 6, 25, tzinfo=pytz.UTC)]
+
+        result = is_combust(intervals, times)
+
+        assert result.tolist() == [False, True, False]
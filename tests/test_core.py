@@ -6,11 +6,15 @@ import pytest
 import pytz
 
 from ndastro_engine.core import (
+    clear_observer_cache,
     get_ascendent_position,
+    get_observer,
     get_planet_position,
+    get_planet_position_series,
     get_planets_position,
     get_sunrise_sunset,
     is_planet_in_retrograde,
+    ts,
 )
 from ndastro_engine.enums import Planets
 from ndastro_engine.models import PlanetPosition
@@ -653,3 +657,26 @@ class TestGetSunriseSunsetElevation:
             assert isinstance(sunrise, datetime)
             assert isinstance(sunset, datetime)
             assert sunrise < sunset
+
+
+class TestGetObserver:
+    """Test suite for get_observer function."""
+
+    @pytest.mark.unit
+    def test_same_location_shares_the_observer(self) -> None:
+        """Test that calls with the same location return the same cached observer."""
+        clear_observer_cache()
+
+        assert get_observer(12.97, 77.59) is get_observer(12.97, 77.59, 914)
+        assert get_observer(12.97, 77.59) is not get_observer(12.97, 77.59, 0)
+
+    @pytest.mark.unit
+    def test_explicit_observer_gives_the_same_results(self) -> None:
+        """Test that passing an observer gives the same positions and sunrise as looking it up."""
+        test_date = datetime(2024, 3, 1, 6, 0, 0, tzinfo=pytz.UTC)
+        observer = get_observer(12.97, 77.59)
+
+        series = get_planet_position_series(Planets.MARS, 12.97, 77.59, ts.utc(test_date), observer=observer)
+
+        assert tuple(series[0]) == pytest.approx(tuple(get_planet_position(Planets.MARS, 12.97, 77.59, test_date)))
+        assert get_sunrise_sunset(12.97, 77.59, test_date, observer=observer) == get_sunrise_sunset(12.97, 77.59, test_date)
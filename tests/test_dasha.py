@@ -0,0 +1,137 @@
+"""Unit tests for ndastro_engine.dasha module."""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+import pytz
+
+from ndastro_engine.dasha import DASHA_CYCLE_YEARS, DASHA_LORDS, get_current_dasha, get_dasha_balance, get_dasha_table
+from ndastro_engine.enums import Planets
+
+BIRTHS = [datetime(1990, 5, 17, 4, 30, tzinfo=pytz.UTC), datetime(2000, 1, 1, tzinfo=pytz.UTC)]
+MOON_LONGITUDES = [100.0, 5.0]
+
+
+class TestDashaConstants:
+    """Test cases for the dasha sequence."""
+
+    @pytest.mark.unit
+    def test_dasha_lords_follow_natchaththiram_owners(self) -> None:
+        """Test the Vimshottari order of lords and the 120 year cycle."""
+        assert DASHA_LORDS == (
+            Planets.KETHU,
+            Planets.VENUS,
+            Planets.SUN,
+            Planets.MOON,
+            Planets.MARS,
+            Planets.RAHU,
+            Planets.JUPITER,
+            Planets.SATURN,
+            Planets.MERCURY,
+        )
+        assert DASHA_CYCLE_YEARS == 120
+
+
+class TestGetDashaBalance:
+    """Test cases for get_dasha_balance function."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("longitude", "lord", "balance"),
+        [
+            (0.0, Planets.KETHU, 7.0),
+            (20.0 / 3, Planets.KETHU, 3.5),
+            (40.0 / 3, Planets.VENUS, 20.0),
+            (100.0, Planets.SATURN, 9.5),
+            (359.999999, Planets.MERCURY, 0.0),
+        ],
+    )
+    def test_balance_at_birth(self, longitude: float, lord: Planets, balance: float) -> None:
+        """Test the first lord and the remaining years for Moon longitudes."""
+        lords, balances = get_dasha_balance([longitude])
+
+        assert lords[0] == lord
+        assert balances[0] == pytest.approx(balance, abs=1e-4)
+
+
+class TestGetDashaTable:
+    """Test cases for get_dasha_table function."""
+
+    @pytest.mark.unit
+    def test_mahadashas_are_contiguous_from_birth(self) -> None:
+        """Test that the nine mahadashas start at birth and follow each other."""
+        table = get_dasha_table(MOON_LONGITUDES, BIRTHS, levels=1)
+
+        for person, birth in enumerate(BIRTHS):
+            rows = table.person == person
+            assert rows.sum() == 9
+            assert table.start[rows][0] == np.datetime64(birth.replace(tzinfo=None), "s")
+            assert (table.start[rows][1:] == table.end[rows][:-1]).all()
+        assert table.mahadasha[table.person == 0].tolist()[:2] == [Planets.SATURN, Planets.MERCURY]
+
+    @pytest.mark.unit
+    def test_sub_periods_fill_their_parent(self) -> None:
+        """Test that antardashas of a full mahadasha start with its lord and span it exactly."""
+        table = get_dasha_table(MOON_LONGITUDES, BIRTHS, levels=2)
+        mahadasha = (table.person == 0) & (table.level == 1)
+        second_start, second_end, second_lord = table.start[mahadasha][1], table.end[mahadasha][1], table.mahadasha[mahadasha][1]
+
+        antardashas = (table.person == 0) & (table.level == 2) & (table.mahadasha == second_lord) & (table.start >= second_start)
+
+        assert antardashas.sum() == 9
+        assert table.antardasha[antardashas][0] == second_lord
+        assert table.start[antardashas][0] == second_start
+        assert abs(int((table.end[antardashas][-1] - second_end).astype(int))) <= 1
+
+    @pytest.mark.unit
+    def test_table_row_counts(self) -> None:
+        """Test that every level is present and lords are padded below their level."""
+        table = get_dasha_table([0.0], [BIRTHS[0]])
+
+        assert np.bincount(table.level).tolist() == [0, 9, 81, 729]
+        assert (table.antardasha[table.level == 1] == Planets.EMPTY).all()
+        assert (table.pratyantardasha[table.level == 3] != Planets.EMPTY).all()
+
+    @pytest.mark.unit
+    def test_invalid_levels_raise(self) -> None:
+        """Test that levels outside 1-3 are rejected."""
+        with pytest.raises(ValueError, match="levels must be between 1 and 3"):
+            get_dasha_table(MOON_LONGITUDES, BIRTHS, levels=4)
+
+
+class TestGetCurrentDasha:
+    """Test cases for get_current_dasha function."""
+
+    @pytest.mark.unit
+    def test_current_dasha_matches_table(self) -> None:
+        """Test that the running periods agree with the period table."""
+        at = datetime(2026, 10, 19, tzinfo=pytz.UTC)
+        moment = np.datetime64("2026-10-19T00:00:00", "s")
+        table = get_dasha_table(MOON_LONGITUDES, BIRTHS)
+
+        current = get_current_dasha(MOON_LONGITUDES, BIRTHS, at)
+
+        for person in range(len(BIRTHS)):
+            running = (table.person == person) & (table.start <= moment) & (table.end > moment)
+            levels = table.level[running]
+            assert table.mahadasha[running][levels == 1][0] == current.mahadasha[person]
+            assert table.antardasha[running][levels == 2][0] == current.antardasha[person]
+            assert table.pratyantardasha[running][levels == 3][0] == current.pratyantardasha[person]
+            assert abs(int((table.end[running][levels == 3][0] - current.pratyantardasha_end[person]).astype(int))) <= 1
+
+    @pytest.mark.unit
+    def test_current_dasha_accepts_datetime64_births(self) -> None:
+        """Test that datetime64 birth arrays give the same result as datetimes."""
+        at = datetime(2030, 1, 1, tzinfo=pytz.UTC)
+        births = np.array([birth.replace(tzinfo=None) for birth in BIRTHS], dtype="datetime64[s]")
+
+        assert get_current_dasha(MOON_LONGITUDES, births, at).mahadasha.tolist() == get_current_dasha(MOON_LONGITUDES, BIRTHS, at).mahadasha.tolist()
+
+    @pytest.mark.unit
+    def test_current_dasha_wraps_after_a_cycle(self) -> None:
+        """Test that the sequence repeats after 120 years."""
+        first = get_current_dasha([0.0], [BIRTHS[1]], datetime(2000, 6, 1, tzinfo=pytz.UTC))
+        wrapped = get_current_dasha([0.0], [BIRTHS[1]], datetime(2120, 6, 1, tzinfo=pytz.UTC))
+
+        assert first.mahadasha[0] == wrapped.mahadasha[0] == Planets.KETHU
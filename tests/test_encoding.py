@@ -0,0 +1,92 @@
+"""Tests for the chart frame encodings in ndastro engine."""
+
+import json
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+import pytz
+
+from ndastro_engine.chart_frame import ChartFrame
+from ndastro_engine.encoding import (
+    ChartFrameJSONEncoder,
+    decode_chart_frame,
+    decode_chart_frame_json,
+    encode_chart_frame,
+    encode_chart_frame_json,
+    encode_charts,
+)
+from ndastro_engine.enums import Planets
+from ndastro_engine.models import PlanetPosition
+
+START = datetime(2024, 3, 1, tzinfo=pytz.UTC)
+TIMES = [START + timedelta(minutes=minute) for minute in range(4)]
+PLANETS = (Planets.EMPTY, Planets.SUN, Planets.MOON)
+
+
+@pytest.fixture
+def frame() -> ChartFrame:
+    """Return a frame of four instants and three planets with distinct values."""
+    rng = np.random.default_rng(7)
+    times = np.datetime64("2024-03-01T00:00", "ms") + np.arange(len(TIMES)) * np.timedelta64(1, "m")
+    return ChartFrame(times, PLANETS, rng.uniform(-360, 360, (len(TIMES), len(PLANETS), 6)))
+
+
+class TestBinaryEncoding:
+    """Test cases for encode_chart_frame and decode_chart_frame functions."""
+
+    @pytest.mark.unit
+    def test_round_trip(self, frame: ChartFrame) -> None:
+        """Test that a decoded frame holds exactly the encoded times, planets and positions."""
+        data = encode_chart_frame(frame)
+        decoded = decode_chart_frame(data)
+
+        assert data[:4] == b"NDCF"
+        assert len(data) == 16 + 8 + 8 * 4 + 8 * 4 * 3 * 6
+        assert decoded.planets == PLANETS
+        assert np.array_equal(decoded.times, frame.times)
+        assert np.array_equal(decoded.positions, frame.positions)
+
+    @pytest.mark.unit
+    def test_charts_encode_like_their_frame(self, frame: ChartFrame) -> None:
+        """Test that charts in dict form encode to the bytes of the equivalent frame."""
+        charts = frame.to_dicts()
+
+        assert encode_charts(TIMES, charts) == encode_chart_frame(frame)
+        assert decode_chart_frame(encode_charts(TIMES, charts)).to_dicts() == charts
+
+    @pytest.mark.unit
+    def test_invalid_data_is_rejected(self, frame: ChartFrame) -> None:
+        """Test that foreign, truncated and future-version data raise ValueError."""
+        data = encode_chart_frame(frame)
+
+        with pytest.raises(ValueError, match="Not an encoded chart frame"):
+            decode_chart_frame(b"JUNK" + data[4:])
+        with pytest.raises(ValueError, match="bytes for 4 times and 3 planets"):
+            decode_chart_frame(data[:-8])
+        with pytest.raises(ValueError, match="Unsupported chart frame version 2"):
+            decode_chart_frame(data[:4] + b"\x02\x00" + data[6:])
+
+
+class TestJSONEncoding:
+    """Test cases for the JSON encoding of chart frames."""
+
+    @pytest.mark.unit
+    def test_round_trip(self, frame: ChartFrame) -> None:
+        """Test that a decoded JSON frame holds exactly the encoded values."""
+        decoded = decode_chart_frame_json(encode_chart_frame_json(frame))
+
+        assert decoded.planets == PLANETS
+        assert decoded.to_datetimes() == TIMES
+        assert np.array_equal(decoded.positions, frame.positions)
+
+    @pytest.mark.unit
+    def test_document_layout(self, frame: ChartFrame) -> None:
+        """Test that frames embedded in payloads become columnar documents with rounded values on request."""
+        document = json.loads(json.dumps({"chart": frame[:1]}, cls=ChartFrameJSONEncoder))["chart"]
+        rounded = json.loads(encode_chart_frame_json(frame, decimals=2))
+
+        assert document["planets"] == ["EMPTY", "SUN", "MOON"]
+        assert document["fields"] == list(PlanetPosition._fields)
+        assert document["times"] == [int(START.timestamp() * 1000)]
+        assert rounded["positions"][0][1][1] == round(float(frame.positions[0, 1, 1]), 2)
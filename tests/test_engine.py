@@ -0,0 +1,83 @@
+"""Tests for the calculation engine in ndastro engine."""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+from ndastro_engine.cache import ChartCache
+from ndastro_engine.config import eph, ts
+from ndastro_engine.core import get_ascendent_position, get_planets_position, get_sunrise_sunset
+from ndastro_engine.engine import Engine, get_default_engine
+from ndastro_engine.enums import Planets
+
+GIVEN_TIME = datetime(2024, 3, 1, 6, 0, 0, tzinfo=pytz.UTC)
+
+
+class TestEngine:
+    """Test cases for Engine class."""
+
+    @pytest.mark.unit
+    def test_methods_match_core_functions(self) -> None:
+        """Test that an engine on the configured kernel gives the same results as the core functions."""
+        engine = Engine()
+
+        assert engine.get_planets_position([], 12.97, 77.59, GIVEN_TIME) == get_planets_position([], 12.97, 77.59, GIVEN_TIME)
+        assert engine.get_ascendent_position(12.97, 77.59, GIVEN_TIME) == get_ascendent_position(12.97, 77.59, GIVEN_TIME)
+        assert engine.get_sunrise_sunset(12.97, 77.59, GIVEN_TIME) == get_sunrise_sunset(12.97, 77.59, GIVEN_TIME)
+
+    @pytest.mark.unit
+    def test_observer_caches_are_separate(self) -> None:
+        """Test that engines keep observers of their own, at their own elevation."""
+        engine = Engine(elevation=0)
+
+        assert engine.get_observer(12.97, 77.59) is engine.get_observer(12.97, 77.59, 0)
+        assert engine.get_observer(12.97, 77.59) is not get_default_engine().get_observer(12.97, 77.59, 0)
+
+    @pytest.mark.unit
+    def test_observer_cache_is_bounded(self) -> None:
+        """Test that the least recently used observer is dropped beyond the cache size."""
+        engine = Engine(observer_cache_size=2)
+        first = engine.get_observer(12.97, 77.59)
+        engine.get_observer(13.08, 80.27)
+        engine.get_observer(28.61, 77.21)
+
+        assert engine.get_observer(12.97, 77.59) is not first
+
+    @pytest.mark.unit
+    def test_chart_cache_is_per_engine(self) -> None:
+        """Test that an engine with a chart cache memoises quantised calls without touching other engines."""
+        chart_cache = ChartCache(max_entries=100)
+        engine = Engine(ts, eph, chart_cache=chart_cache)
+
+        first = engine.get_planet_position(Planets.MOON, 12.97001, 77.59, GIVEN_TIME + timedelta(milliseconds=300))
+        second = engine.get_planet_position(Planets.MOON, 12.96999, 77.59, GIVEN_TIME)
+
+        assert first == second == Engine().get_planet_position(Planets.MOON, 12.97, 77.59, GIVEN_TIME)
+        assert (chart_cache.stats.hits, chart_cache.stats.misses) == (1, 1)
+
+    @pytest.mark.unit
+    def test_threads_get_the_same_results(self) -> None:
+        """Test that threads sharing an engine get the results of a serial run."""
+        engine = Engine()
+        times = [GIVEN_TIME + timedelta(hours=hour) for hour in range(8)]
+        expected = [engine.get_planets_position([], 12.97, 77.59, given_time) for given_time in times]
+        results: list[object] = [None] * len(times)
+
+        def compute(index: int) -> None:
+            results[index] = engine.get_planets_position([], 12.97, 77.59, times[index])
+
+        threads = [threading.Thread(target=compute, args=(index,)) for index in range(len(times))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == expected
+
+    @pytest.mark.unit
+    def test_kernel_and_ephemeris_file_are_exclusive(self) -> None:
+        """Test that passing both a kernel and a file to load raises ValueError."""
+        with pytest.raises(ValueError, match="not both"):
+            Engine(kernel=eph, ephemeris_file="de421.bsp")
@@ -2,7 +2,7 @@
 
 import pytest
 
-from ndastro_engine.enums import Planets
+from ndastro_engine.enums import Aspects, Granularity, Karanams, Planets, Poruthams, Thithis, Vargas, Yogams
 
 
 class TestPlanetsEnum:
@@ -195,3 +195,106 @@ class TestPlanetsEnum:
         assert Planets.MOON in Planets
         assert 1 in Planets._value2member_map_
         assert 99 not in Planets._value2member_map_
+
+
+class TestGranularityEnum:
+    """Test cases for Granularity enum."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("granularity", "divisions"),
+        [
+            (Granularity.RASI, 12),
+            (Granularity.NAKSHATRA, 27),
+            (Granularity.PADA, 108),
+            (Granularity.NAVAMSA, 108),
+        ],
+    )
+    def test_granularity_divisions_cover_zodiac(self, granularity: Granularity, divisions: int) -> None:
+        """Test that the divisions of every granularity cover the whole zodiac."""
+        assert granularity.divisions == divisions
+        assert granularity.span * granularity.divisions == pytest.approx(360.0)
+
+    @pytest.mark.unit
+    def test_granularity_number(self) -> None:
+        """Test that segments map to 1-based numbers, navamsa wrapping every 12 segments."""
+        assert Granularity.RASI.number(0) == 1
+        assert Granularity.NAKSHATRA.number(26) == 27
+        assert Granularity.PADA.number(107) == 108
+        assert Granularity.NAVAMSA.number(12) == 1
+        assert Granularity.NAVAMSA.number(107) == 12
+
+
+class TestPanchangEnums:
+    """Test cases for Thithis, Yogams and Karanams enums."""
+
+    @pytest.mark.unit
+    def test_panchang_enum_sizes(self) -> None:
+        """Test the number of members of each panchang enum."""
+        assert len(Thithis) == 30
+        assert len(Yogams) == 27
+        assert len(Karanams) == 11
+
+    @pytest.mark.unit
+    def test_thithi_paksham(self) -> None:
+        """Test that thithis up to Pournami are in the waxing fortnight."""
+        assert Thithis.SUKLA_PRATHAMAI.is_sukla_paksham
+        assert Thithis.POURNAMI.is_sukla_paksham
+        assert not Thithis.KRISHNA_PRATHAMAI.is_sukla_paksham
+        assert not Thithis.AMAVASAI.is_sukla_paksham
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("index", "expected"),
+        [
+            (0, Karanams.KIMSTHUGNAM),
+            (1, Karanams.BAVAM),
+            (7, Karanams.BHADHRAI),
+            (8, Karanams.BAVAM),
+            (56, Karanams.BHADHRAI),
+            (57, Karanams.SAKUNI),
+            (58, Karanams.CHATHUSHPAADHAM),
+            (59, Karanams.NAAGAVAM),
+        ],
+    )
+    def test_karanam_from_half_thithi(self, index: int, expected: Karanams) -> None:
+        """Test the fixed and movable karanams of the lunar month."""
+        assert Karanams.from_half_thithi(index) == expected
+
+
+class TestVargasEnum:
+    """Test cases for the Vargas enum."""
+
+    @pytest.mark.unit
+    def test_vargas_are_valued_by_d_number(self) -> None:
+        """Test the D-numbers, names and part widths of the vargas."""
+        assert len(Vargas) == 16
+        assert str(Vargas.NAVAMSA) == "D9"
+        assert Vargas(60) == Vargas.SHASHTIAMSA
+        assert Vargas.DASAMSA.span == pytest.approx(3.0)
+        assert Vargas.to_list()[0] == "RASI"
+
+
+class TestAspectsEnum:
+    """Test cases for the Aspects enum."""
+
+    @pytest.mark.unit
+    def test_aspect_angles(self) -> None:
+        """Test that aspects are valued by house and give their exact angle."""
+        assert Aspects.CONJUNCTION.angle == 0.0
+        assert Aspects.OPPOSITION.angle == 180.0
+        assert Aspects.FOURTH_HOUSE.angle == 90.0
+        assert Aspects.TENTH_HOUSE.angle == 270.0
+        assert str(Aspects.NINTH_HOUSE) == "NINTH_HOUSE"
+
+
+class TestPoruthamsEnum:
+    """Test cases for the Poruthams enum."""
+
+    @pytest.mark.unit
+    def test_porutham_bits(self) -> None:
+        """Test that the ten poruthams have distinct bits."""
+        assert len(Poruthams) == 10
+        assert Poruthams.DHINAM.bit == 1
+        assert Poruthams.VEDHAI.bit == 512
+        assert sum(porutham.bit for porutham in Poruthams) == 1023
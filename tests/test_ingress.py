@@ -0,0 +1,162 @@
+"""Tests for sidereal ingress searches in ndastro engine."""
+
+from datetime import datetime, timedelta
+from itertools import pairwise
+
+import pytest
+import pytz
+
+from ndastro_engine.ayanamsa import get_lahiri_ayanamsa
+from ndastro_engine.core import get_planet_position
+from ndastro_engine.enums import Granularity, Planets, Rasis
+from ndastro_engine.ingress import build_ingress_index, find_ingresses, find_planets_ingresses, get_ingress_step_days
+from ndastro_engine.models import Ingress
+
+
+def _sidereal_longitude(planet: Planets, time: datetime) -> float:
+    return (get_planet_position(planet, 12.97, 77.59, time).longitude - get_lahiri_ayanamsa(time)) % 360
+
+
+class TestFindIngresses:
+    """Test cases for find_ingresses function."""
+
+    @pytest.mark.unit
+    def test_sun_enters_mesha_in_april(self) -> None:
+        """Test that the Sun enters sidereal Aries (Mesha Sankranti) in mid April."""
+        ingresses = find_ingresses(
+            datetime(2024, 4, 1, tzinfo=pytz.UTC),
+            datetime(2024, 4, 30, tzinfo=pytz.UTC),
+            Planets.SUN,
+            12.97,
+            77.59,
+        )
+
+        assert len(ingresses) == 1
+        assert isinstance(ingresses[0], Ingress)
+        assert ingresses[0].from_division == Rasis.PISCES
+        assert ingresses[0].to_division == Rasis.ARIES
+        assert not ingresses[0].retrograde
+        assert datetime(2024, 4, 13, tzinfo=pytz.UTC) <= ingresses[0].time <= datetime(2024, 4, 14, tzinfo=pytz.UTC)
+
+    @pytest.mark.unit
+    def test_ingress_time_is_on_boundary(self) -> None:
+        """Test that the refined crossing lies on the nakshatra boundary."""
+        ingress = find_ingresses(
+            datetime(2024, 1, 1, tzinfo=pytz.UTC),
+            datetime(2024, 1, 3, tzinfo=pytz.UTC),
+            Planets.MOON,
+            12.97,
+            77.59,
+            granularity=Granularity.NAKSHATRA,
+        )[0]
+
+        before = _sidereal_longitude(Planets.MOON, ingress.time - timedelta(seconds=5))
+        after = _sidereal_longitude(Planets.MOON, ingress.time + timedelta(seconds=5))
+
+        assert int(before // Granularity.NAKSHATRA.span) + 1 == ingress.from_division
+        assert int(after // Granularity.NAKSHATRA.span) + 1 == ingress.to_division
+
+    @pytest.mark.unit
+    def test_moon_nakshatra_ingresses_chain(self) -> None:
+        """Test that the Moon passes through every nakshatra in a sidereal month."""
+        ingresses = find_ingresses(
+            datetime(2024, 1, 1, tzinfo=pytz.UTC),
+            datetime(2024, 1, 29, tzinfo=pytz.UTC),
+            Planets.MOON,
+            12.97,
+            77.59,
+            granularity=Granularity.NAKSHATRA,
+        )
+
+        assert len(ingresses) >= 27
+        assert {ingress.to_division for ingress in ingresses} == set(range(1, 28))
+        for previous, current in pairwise(ingresses):
+            assert previous.to_division == current.from_division
+            assert previous.time < current.time
+
+    @pytest.mark.unit
+    def test_mercury_retrograde_re_entry(self) -> None:
+        """Test that a retrograde re-entry into the previous rasi is reported."""
+        ingresses = find_ingresses(
+            datetime(2024, 3, 15, tzinfo=pytz.UTC),
+            datetime(2024, 5, 31, tzinfo=pytz.UTC),
+            Planets.MERCURY,
+            12.97,
+            77.59,
+        )
+
+        retrograde = [ingress for ingress in ingresses if ingress.retrograde]
+
+        assert len(retrograde) >= 1
+        for ingress in retrograde:
+            assert (ingress.from_division - ingress.to_division) % 12 == 1
+
+    @pytest.mark.unit
+    def test_navamsa_divisions_are_rasis(self) -> None:
+        """Test that navamsa ingresses report navamsa signs between 1 and 12."""
+        ingresses = find_ingresses(
+            datetime(2024, 1, 1, tzinfo=pytz.UTC),
+            datetime(2024, 1, 3, tzinfo=pytz.UTC),
+            Planets.MOON,
+            12.97,
+            77.59,
+            granularity=Granularity.NAVAMSA,
+        )
+
+        assert len(ingresses) > 0
+        assert all(1 <= ingress.to_division <= 12 for ingress in ingresses)
+
+    @pytest.mark.unit
+    def test_empty_planet_has_no_ingresses(self) -> None:
+        """Test that the empty planet never crosses a boundary."""
+        assert find_ingresses(datetime(2024, 1, 1, tzinfo=pytz.UTC), datetime(2024, 2, 1, tzinfo=pytz.UTC), Planets.EMPTY, 0.0, 0.0) == []
+
+
+class TestFindPlanetsIngresses:
+    """Test cases for find_planets_ingresses function."""
+
+    @pytest.mark.unit
+    def test_find_planets_ingresses_selected_planets(self) -> None:
+        """Test that only the requested planets are searched."""
+        result = find_planets_ingresses(
+            datetime(2024, 1, 1, tzinfo=pytz.UTC),
+            datetime(2024, 1, 10, tzinfo=pytz.UTC),
+            [Planets.SUN, Planets.MOON],
+            12.97,
+            77.59,
+        )
+
+        assert set(result) == {Planets.SUN, Planets.MOON}
+        assert all(ingress.planet == Planets.MOON for ingress in result[Planets.MOON])
+
+
+class TestGetIngressStepDays:
+    """Test cases for get_ingress_step_days function."""
+
+    @pytest.mark.unit
+    def test_step_is_capped_for_slow_planets(self) -> None:
+        """Test that slow planets are sampled at least once a day."""
+        assert get_ingress_step_days(Planets.SATURN, Granularity.RASI) == 1.0
+
+    @pytest.mark.unit
+    def test_step_is_shorter_than_fastest_crossing(self) -> None:
+        """Test that the Moon is sampled more than once per pada."""
+        assert get_ingress_step_days(Planets.MOON, Granularity.PADA) < Granularity.PADA.span / 15.4
+
+
+class TestBuildIngressIndex:
+    """Test cases for build_ingress_index function."""
+
+    @pytest.mark.unit
+    def test_index_matches_ephemeris(self) -> None:
+        """Test that index lookups agree with the ephemeris."""
+        start = datetime(2024, 1, 1, tzinfo=pytz.UTC)
+        end = datetime(2024, 3, 1, tzinfo=pytz.UTC)
+
+        index = build_ingress_index([Planets.MOON], [Granularity.RASI, Granularity.NAKSHATRA], 12.97, 77.59, start_date=start, end_date=end)
+
+        for day in range(0, 60, 7):
+            when = start + timedelta(days=day, hours=5)
+            longitude = _sidereal_longitude(Planets.MOON, when)
+            assert index.division_at(Planets.MOON, Granularity.RASI, when) == int(longitude // 30) + 1
+            assert index.division_at(Planets.MOON, Granularity.NAKSHATRA, when) == int(longitude // Granularity.NAKSHATRA.span) + 1
@@ -0,0 +1,135 @@
+"""Unit tests for ndastro_engine.ingress_index module."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+import pytz
+
+from ndastro_engine.enums import Granularity, Planets, Rasis
+from ndastro_engine.ingress_index import IngressIndex
+from ndastro_engine.models import Ingress
+
+START = datetime(2025, 1, 1, tzinfo=pytz.UTC)
+END = datetime(2026, 1, 1, tzinfo=pytz.UTC)
+PISCES_INGRESS = datetime(2025, 3, 29, tzinfo=pytz.UTC)
+AQUARIUS_REENTRY = datetime(2025, 7, 1, tzinfo=pytz.UTC)
+PISCES_REENTRY = datetime(2025, 10, 1, tzinfo=pytz.UTC)
+
+
+@pytest.fixture
+def saturn_index() -> IngressIndex:
+    """Provide an index of made-up Saturn rasi ingresses with a retrograde re-entry.
+
+    Returns
+    -------
+        IngressIndex: Index covering 2025 with three Saturn crossings.
+
+    """
+    ingresses = [
+        Ingress(PISCES_INGRESS, Planets.SATURN, Granularity.RASI, Rasis.AQUARIUS, Rasis.PISCES, retrograde=False),
+        Ingress(AQUARIUS_REENTRY, Planets.SATURN, Granularity.RASI, Rasis.PISCES, Rasis.AQUARIUS, retrograde=True),
+        Ingress(PISCES_REENTRY, Planets.SATURN, Granularity.RASI, Rasis.AQUARIUS, Rasis.PISCES, retrograde=False),
+    ]
+    index = IngressIndex(START, END)
+    index.add(Planets.SATURN, Granularity.RASI, Rasis.AQUARIUS, ingresses)
+    return index
+
+
+class TestIngressIndexPointQueries:
+    """Test cases for IngressIndex point queries."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("when", "expected"),
+        [
+            (START, Rasis.AQUARIUS),
+            (PISCES_INGRESS - timedelta(seconds=1), Rasis.AQUARIUS),
+            (PISCES_INGRESS, Rasis.PISCES),
+            (datetime(2025, 8, 15, tzinfo=pytz.UTC), Rasis.AQUARIUS),
+            (END, Rasis.PISCES),
+        ],
+    )
+    def test_division_at(self, saturn_index: IngressIndex, when: datetime, expected: Rasis) -> None:
+        """Test that the division in force at an instant is returned."""
+        assert saturn_index.division_at(Planets.SATURN, Granularity.RASI, when) == expected
+
+    @pytest.mark.unit
+    def test_divisions_at_vectorized(self, saturn_index: IngressIndex) -> None:
+        """Test that many instants are looked up in one call."""
+        timestamps = np.array([START.timestamp(), datetime(2025, 5, 1, tzinfo=pytz.UTC).timestamp(), END.timestamp()])
+
+        result = saturn_index.divisions_at(Planets.SATURN, Granularity.RASI, timestamps)
+
+        assert result.tolist() == [Rasis.AQUARIUS, Rasis.PISCES, Rasis.PISCES]
+
+    @pytest.mark.unit
+    def test_query_outside_span_raises(self, saturn_index: IngressIndex) -> None:
+        """Test that instants outside the indexed span are rejected."""
+        with pytest.raises(ValueError, match="outside the span"):
+            saturn_index.division_at(Planets.SATURN, Granularity.RASI, END + timedelta(days=1))
+
+    @pytest.mark.unit
+    def test_missing_pair_raises(self, saturn_index: IngressIndex) -> None:
+        """Test that pairs that were never indexed raise KeyError."""
+        assert (Planets.JUPITER, Granularity.RASI) not in saturn_index
+        with pytest.raises(KeyError):
+            saturn_index.division_at(Planets.JUPITER, Granularity.RASI, START)
+
+
+class TestIngressIndexRangeQueries:
+    """Test cases for IngressIndex range-overlap queries."""
+
+    @pytest.mark.unit
+    def test_intervals_include_retrograde_gap(self, saturn_index: IngressIndex) -> None:
+        """Test that a retrograde re-entry splits the stay in a rasi."""
+        result = saturn_index.intervals(Planets.SATURN, Granularity.RASI, Rasis.PISCES, START, END)
+
+        assert result == [(PISCES_INGRESS, AQUARIUS_REENTRY), (PISCES_REENTRY, END)]
+
+    @pytest.mark.unit
+    def test_intervals_are_clipped_to_range(self, saturn_index: IngressIndex) -> None:
+        """Test that intervals are clipped to the queried range."""
+        range_start = datetime(2025, 6, 1, tzinfo=pytz.UTC)
+        range_end = datetime(2025, 11, 1, tzinfo=pytz.UTC)
+
+        result = saturn_index.intervals(Planets.SATURN, Granularity.RASI, Rasis.PISCES, range_start, range_end)
+
+        assert result == [(range_start, AQUARIUS_REENTRY), (PISCES_REENTRY, range_end)]
+
+    @pytest.mark.unit
+    def test_intervals_inside_single_stay(self, saturn_index: IngressIndex) -> None:
+        """Test a range falling entirely inside one stay."""
+        range_start = datetime(2025, 4, 1, tzinfo=pytz.UTC)
+        range_end = datetime(2025, 5, 1, tzinfo=pytz.UTC)
+
+        assert saturn_index.intervals(Planets.SATURN, Granularity.RASI, Rasis.PISCES, range_start, range_end) == [(range_start, range_end)]
+        assert saturn_index.intervals(Planets.SATURN, Granularity.RASI, Rasis.ARIES, range_start, range_end) == []
+
+
+class TestIngressIndexPersistence:
+    """Test cases for IngressIndex save and load."""
+
+    @pytest.mark.unit
+    def test_save_load_roundtrip(self, saturn_index: IngressIndex, tmp_path: Path) -> None:
+        """Test that a saved index answers the same queries once loaded."""
+        path = tmp_path / "ingresses.npz"
+        saturn_index.save(path)
+
+        loaded = IngressIndex.load(path)
+
+        assert loaded.start == START
+        assert loaded.end == END
+        assert loaded.keys == [(Planets.SATURN, Granularity.RASI)]
+        for when in (START, PISCES_INGRESS, datetime(2025, 8, 15, tzinfo=pytz.UTC), END):
+            assert loaded.division_at(Planets.SATURN, Granularity.RASI, when) == saturn_index.division_at(Planets.SATURN, Granularity.RASI, when)
+
+    @pytest.mark.unit
+    def test_load_rejects_unknown_version(self, tmp_path: Path) -> None:
+        """Test that files written with another layout version are rejected."""
+        path = tmp_path / "ingresses.npz"
+        np.savez_compressed(path, header=np.array([99]), span=np.array([0.0, 1.0]))
+
+        with pytest.raises(ValueError, match="Unsupported ingress index version"):
+            IngressIndex.load(path)
@@ -0,0 +1,73 @@
+"""Tests for the live chart provider in ndastro engine."""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+from ndastro_engine.core import get_planets_position
+from ndastro_engine.enums import Planets
+from ndastro_engine.live import LiveChartProvider, LiveChartStats
+
+NOW = datetime(2024, 3, 1, 6, tzinfo=pytz.UTC)
+
+
+class FakeClock:
+    """A settable clock for the provider."""
+
+    def __init__(self, now: datetime) -> None:
+        """Start the clock at the given instant."""
+        self.now = now
+
+    def __call__(self) -> datetime:
+        """Return the current instant."""
+        return self.now
+
+
+class TestLiveChartProvider:
+    """Test cases for LiveChartProvider class."""
+
+    @pytest.mark.unit
+    def test_interpolated_positions_match_direct_positions(self) -> None:
+        """Test that instants inside the window match get_planets_position to a fraction of an arcsecond."""
+        provider = LiveChartProvider([], 12.97, 77.59, clock=FakeClock(NOW))
+
+        for seconds in (0, 95, 1234, 3599):
+            when = NOW + timedelta(seconds=seconds)
+            served = provider.get_positions(when)
+            direct = get_planets_position([], 12.97, 77.59, when)
+            for planet, position in direct.items():
+                assert abs((served[planet].longitude - position.longitude + 180) % 360 - 180) < 1 / 3600
+                assert served[planet].speed_longitude == pytest.approx(position.speed_longitude, abs=1e-2)
+
+    @pytest.mark.unit
+    def test_counts_hits_and_misses(self) -> None:
+        """Test that instants outside the window are computed directly and counted as misses."""
+        provider = LiveChartProvider([Planets.MOON, Planets.ASCENDANT], 12.97, 77.59, clock=FakeClock(NOW))
+
+        provider.get_positions()
+        provider.get_positions(NOW + timedelta(minutes=30))
+        served = provider.get_positions(NOW + timedelta(days=2))
+
+        assert provider.stats == LiveChartStats(hits=2, misses=1, refreshes=1)
+        assert served == get_planets_position([Planets.MOON, Planets.ASCENDANT], 12.97, 77.59, NOW + timedelta(days=2))
+
+    @pytest.mark.unit
+    def test_refreshes_before_the_window_runs_out(self) -> None:
+        """Test that a background refresh moves the window once less than the margin is left."""
+        clock = FakeClock(NOW)
+        provider = LiveChartProvider([Planets.SUN], 12.97, 77.59, clock=clock)
+        provider.get_positions()
+
+        clock.now = NOW + timedelta(minutes=50)
+        provider.get_positions()
+        provider.wait()
+        provider.get_positions(NOW + timedelta(minutes=100))
+
+        assert provider.stats == LiveChartStats(hits=3, misses=0, refreshes=2)
+
+    @pytest.mark.unit
+    def test_invalid_margin_is_rejected(self) -> None:
+        """Test that a refresh margin not shorter than the horizon raises ValueError."""
+        with pytest.raises(ValueError, match="refresh margin"):
+            LiveChartProvider([Planets.SUN], 12.97, 77.59, horizon=timedelta(minutes=10), refresh_margin=timedelta(minutes=10))
@@ -0,0 +1,72 @@
+"""Tests for muhurta searches in ndastro engine."""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+from ndastro_engine.core import ts
+from ndastro_engine.enums import Granularity, Planets, Rasis
+from ndastro_engine.ingress import IngressFunction
+from ndastro_engine.models import MuhurtaCriteria
+from ndastro_engine.muhurta import find_muhurtas
+from ndastro_engine.panchang import find_panchang_events, get_panchang
+
+START = datetime(2024, 5, 1, tzinfo=pytz.UTC)
+END = datetime(2024, 5, 8, tzinfo=pytz.UTC)
+
+
+class TestFindMuhurtas:
+    """Test cases for find_muhurtas function."""
+
+    @pytest.mark.unit
+    def test_windows_meet_the_panchang_criteria(self) -> None:
+        """Test that every window has an allowed weekday and the labels in force at its start."""
+        criteria = MuhurtaCriteria(vaarams=(Planets.MOON, Planets.JUPITER), avoid_retrograde=())
+        windows = find_muhurtas(START, END, 12.97, 77.59, criteria)
+
+        assert len(windows) == 2
+        for window in windows:
+            panchang = get_panchang(12.97, 77.59, window.start + timedelta(minutes=1))
+            assert (panchang.thithi, panchang.natchaththiram, panchang.vaaram) == (window.thithi, window.natchaththiram, window.vaaram)
+            assert window.vaaram in criteria.vaarams
+            assert timedelta(hours=23) < window.end - window.start < timedelta(hours=25)
+
+    @pytest.mark.unit
+    def test_windows_meet_the_lagna_criteria(self) -> None:
+        """Test that the ascendant stays in an allowed rasi throughout every window."""
+        criteria = MuhurtaCriteria(lagnas=(Rasis.LEO,), min_duration=timedelta(minutes=30))
+        windows = find_muhurtas(START, END, 12.97, 77.59, criteria)
+        lagna = IngressFunction(Planets.ASCENDANT, 12.97, 77.59, Granularity.RASI)
+
+        assert len(windows) == 7
+        for window in windows:
+            assert window.lagna == Rasis.LEO
+            for time in (window.start + timedelta(minutes=1), window.end - timedelta(minutes=1)):
+                assert Granularity.RASI.number(int(lagna(ts.utc(time))[0])) == Rasis.LEO
+
+    @pytest.mark.unit
+    def test_windows_are_ranked_longest_first(self) -> None:
+        """Test that windows are ordered by decreasing duration and respect the minimum duration."""
+        criteria = MuhurtaCriteria(lagnas=(Rasis.ARIES, Rasis.LEO, Rasis.SAGITTARIUS), min_duration=timedelta(hours=1))
+        durations = [window.end - window.start for window in find_muhurtas(START, END, 12.97, 77.59, criteria)]
+
+        assert durations == sorted(durations, reverse=True)
+        assert min(durations) >= timedelta(hours=1)
+
+    @pytest.mark.unit
+    def test_retrograde_planet_removes_windows(self) -> None:
+        """Test that no window is found while a planet to avoid is retrograde (Mercury, 1 to 25 April 2024)."""
+        start = datetime(2024, 4, 10, tzinfo=pytz.UTC)
+        end = datetime(2024, 4, 20, tzinfo=pytz.UTC)
+
+        assert find_muhurtas(start, end, 12.97, 77.59, MuhurtaCriteria(avoid_retrograde=(Planets.MERCURY,))) == []
+        assert len(find_muhurtas(start, end, 12.97, 77.59, MuhurtaCriteria(avoid_retrograde=(Planets.JUPITER,)))) == 1
+
+    @pytest.mark.unit
+    def test_precomputed_events_give_the_same_windows(self) -> None:
+        """Test that passing a precomputed panchangam timeline gives the same windows."""
+        criteria = MuhurtaCriteria(vaarams=(Planets.VENUS,), lagnas=(Rasis.TAURUS,))
+        events = find_panchang_events(START, END, 12.97, 77.59)
+
+        assert find_muhurtas(START, END, 12.97, 77.59, criteria, events=events) == find_muhurtas(START, END, 12.97, 77.59, criteria)
@@ -0,0 +1,115 @@
+"""Unit tests for ndastro_engine.natal_index module."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ndastro_engine.enums import Natchaththirams, Rasis
+from ndastro_engine.natal_index import NatalMoonIndex
+
+USER_IDS = [7, 3, 11, 5]
+MOON_LONGITUDES = [10.0, 95.0, 12.0, 359.0]
+
+
+class TestNatalMoonIndex:
+    """Test cases for the NatalMoonIndex class."""
+
+    @pytest.mark.unit
+    def test_build_groups_users_by_bucket(self) -> None:
+        """Test that users are grouped by the rasi and natchaththiram of their natal Moon."""
+        index = NatalMoonIndex.build(USER_IDS, MOON_LONGITUDES)
+
+        assert len(index) == 4
+        assert index.users_in_rasis([Rasis.ARIES]).tolist() == [7, 11]
+        assert index.users_in_rasis([Rasis.CANCER, Rasis.PISCES]).tolist() == [3, 5]
+        assert index.users_in_natchaththirams([Natchaththirams.ASWINNI.value]).tolist() == [7, 11]
+        assert index.users_in_rasis([Rasis.LEO]).tolist() == []
+
+    @pytest.mark.unit
+    def test_insert_and_delete_before_and_after_compact(self) -> None:
+        """Test that pending changes are visible immediately and survive compaction."""
+        index = NatalMoonIndex.build(USER_IDS, MOON_LONGITUDES)
+
+        index.insert([20, 7], [40.0, 100.0])
+        index.delete([11, 99])
+
+        for _ in range(2):
+            assert len(index) == 4
+            assert 11 not in index
+            assert 20 in index
+            assert sorted(index.users_in_rasis([Rasis.ARIES]).tolist()) == []
+            assert sorted(index.users_in_rasis([Rasis.CANCER]).tolist()) == [3, 7]
+            assert index.users_in_rasis([Rasis.TAURUS]).tolist() == [20]
+            index.compact()
+
+    @pytest.mark.unit
+    def test_pending_users_move_between_buckets(self) -> None:
+        """Test that a pending user inserted again or deleted leaves its previous buckets."""
+        index = NatalMoonIndex()
+
+        index.insert([1, 2], [40.0, 45.0])
+        index.insert([1], [100.0])
+
+        assert index.users_in_rasis([Rasis.TAURUS]).tolist() == [2]
+        assert index.users_in_rasis([Rasis.CANCER]).tolist() == [1]
+
+        index.delete([2])
+
+        assert index.users_in_rasis([Rasis.TAURUS]).tolist() == []
+        assert index.users_in_natchaththirams([Natchaththirams.ROGHINI.value]).tolist() == []
+        assert len(index) == 1
+
+    @pytest.mark.unit
+    def test_users_hit_touches_affected_buckets(self) -> None:
+        """Test that a transit query returns the users whose natal Moon rasi is hit."""
+        rng = np.random.default_rng(1)
+        moons = rng.uniform(0, 360, 2000)
+        index = NatalMoonIndex.build(np.arange(2000), moons)
+
+        hits = index.users_hit(335.0, [12, 1, 2])
+
+        expected = np.flatnonzero(np.isin(np.floor(moons / 30) + 1, [Rasis.AQUARIUS, Rasis.PISCES, Rasis.ARIES]))
+        assert sorted(hits.tolist()) == expected.tolist()
+
+    @pytest.mark.unit
+    def test_save_and_load_memory_mapped(self, tmp_path: Path) -> None:
+        """Test that a saved index loads memory mapped and accepts further changes."""
+        index = NatalMoonIndex.build(USER_IDS, MOON_LONGITUDES)
+        index.insert([20], [40.0])
+        index.save(tmp_path / "natal")
+
+        loaded = NatalMoonIndex.load(tmp_path / "natal")
+        loaded.delete([3])
+
+        assert isinstance(loaded._user_ids, np.memmap)  # noqa: SLF001
+        assert len(loaded) == 4
+        assert loaded.users_in_rasis([Rasis.TAURUS]).tolist() == [20]
+        assert loaded.users_in_rasis([Rasis.CANCER]).tolist() == []
+
+    @pytest.mark.unit
+    def test_save_to_the_loaded_directory(self, tmp_path: Path) -> None:
+        """Test that a memory-mapped index can be saved back to the directory it was loaded from."""
+        rng = np.random.default_rng(2)
+        moons = rng.uniform(0, 360, 1000)
+        NatalMoonIndex.build(np.arange(1000), moons).save(tmp_path)
+
+        NatalMoonIndex.load(tmp_path).save(tmp_path)
+        loaded = NatalMoonIndex.load(tmp_path)
+        loaded.insert([1000], [40.0])
+        loaded.save(tmp_path)
+        reloaded = NatalMoonIndex.load(tmp_path)
+
+        assert len(reloaded) == 1001
+        expected = np.flatnonzero(np.floor(moons / 30) + 1 == Rasis.TAURUS).tolist()
+        assert sorted(reloaded.users_in_rasis([Rasis.TAURUS]).tolist()) == [*expected, 1000]
+        assert list(tmp_path.glob("*.tmp.npy")) == []
+
+    @pytest.mark.unit
+    def test_load_rejects_unknown_version(self, tmp_path: Path) -> None:
+        """Test that an unsupported layout version raises ValueError."""
+        NatalMoonIndex.build(USER_IDS, MOON_LONGITUDES).save(tmp_path)
+        np.save(tmp_path / "header.npy", np.array([99], dtype=np.int64))
+
+        with pytest.raises(ValueError, match="Unsupported natal index version"):
+            NatalMoonIndex.load(tmp_path)
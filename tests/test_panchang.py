@@ -0,0 +1,95 @@
+"""Tests for panchangam calculations in ndastro engine."""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+from ndastro_engine.enums import Karanams, Natchaththirams, Planets, Thithis, Yogams
+from ndastro_engine.models import Panchang
+from ndastro_engine.panchang import find_panchang_events, get_panchang, get_vaaram
+
+BANGALORE = (12.97, 77.59)
+
+
+class TestGetPanchang:
+    """Test cases for get_panchang function."""
+
+    @pytest.mark.unit
+    def test_get_panchang_returns_enums(self) -> None:
+        """Test that every limb is returned as its enum."""
+        result = get_panchang(*BANGALORE, datetime(2024, 1, 1, 6, 0, 0, tzinfo=pytz.UTC))
+
+        assert isinstance(result, Panchang)
+        assert isinstance(result.thithi, Thithis)
+        assert isinstance(result.natchaththiram, Natchaththirams)
+        assert isinstance(result.yogam, Yogams)
+        assert isinstance(result.karanam, Karanams)
+        assert isinstance(result.vaaram, Planets)
+
+    @pytest.mark.unit
+    def test_amavasai_before_new_moon(self) -> None:
+        """Test that the thithi before the new moon of 2024-01-11 11:57 UTC is Amavasai."""
+        result = get_panchang(*BANGALORE, datetime(2024, 1, 11, 9, 0, 0, tzinfo=pytz.UTC))
+
+        assert result.thithi == Thithis.AMAVASAI
+        assert result.karanam in (Karanams.CHATHUSHPAADHAM, Karanams.NAAGAVAM)
+
+    @pytest.mark.unit
+    def test_pournami_before_full_moon(self) -> None:
+        """Test that the thithi before the full moon of 2024-01-25 17:54 UTC is Pournami."""
+        result = get_panchang(*BANGALORE, datetime(2024, 1, 25, 14, 0, 0, tzinfo=pytz.UTC))
+
+        assert result.thithi == Thithis.POURNAMI
+        assert result.thithi.is_sukla_paksham
+
+
+class TestGetVaaram:
+    """Test cases for get_vaaram function."""
+
+    @pytest.mark.unit
+    def test_vaaram_after_sunrise(self) -> None:
+        """Test that 2024-01-11 afternoon in Bangalore is a Thursday."""
+        assert get_vaaram(*BANGALORE, datetime(2024, 1, 11, 9, 0, 0, tzinfo=pytz.UTC)) == Planets.JUPITER
+
+    @pytest.mark.unit
+    def test_vaaram_before_sunrise_is_previous_day(self) -> None:
+        """Test that the weekday only changes at sunrise, not at midnight."""
+        assert get_vaaram(*BANGALORE, datetime(2024, 1, 11, 0, 30, 0, tzinfo=pytz.UTC)) == Planets.MERCURY
+
+
+class TestFindPanchangEvents:
+    """Test cases for find_panchang_events function."""
+
+    @pytest.mark.unit
+    def test_events_are_chronological_and_chained(self) -> None:
+        """Test that each limb ends with the value the previous event started."""
+        events = find_panchang_events(datetime(2024, 1, 1, tzinfo=pytz.UTC), datetime(2024, 1, 8, tzinfo=pytz.UTC), *BANGALORE)
+
+        assert events == sorted(events, key=lambda event: event.time)
+        last_started: dict[str, object] = {}
+        for event in events:
+            if event.element in last_started:
+                assert last_started[event.element] == event.ended
+            last_started[event.element] = event.started
+
+    @pytest.mark.unit
+    def test_every_limb_changes_in_a_week(self) -> None:
+        """Test that all five limbs change at least once in a week."""
+        events = find_panchang_events(datetime(2024, 1, 1, tzinfo=pytz.UTC), datetime(2024, 1, 8, tzinfo=pytz.UTC), *BANGALORE)
+
+        elements = {event.element for event in events}
+
+        assert elements == set(Panchang._fields)
+        assert len([event for event in events if event.element == "vaaram"]) == 7
+
+    @pytest.mark.unit
+    def test_event_times_match_get_panchang(self) -> None:
+        """Test that get_panchang reports the ended value before and the started value after each event."""
+        events = find_panchang_events(datetime(2024, 1, 1, tzinfo=pytz.UTC), datetime(2024, 1, 3, tzinfo=pytz.UTC), *BANGALORE)
+
+        for event in events:
+            before = get_panchang(*BANGALORE, event.time - timedelta(seconds=5))
+            after = get_panchang(*BANGALORE, event.time + timedelta(seconds=5))
+            assert getattr(before, event.element) == event.ended
+            assert getattr(after, event.element) == event.started
@@ -0,0 +1,90 @@
+"""Tests for yearly panchangam calendar generation in ndastro engine."""
+
+import json
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from ndastro_engine.models import City
+from ndastro_engine.panchang_calendar import ROW_LIMBS, generate_calendar, generate_rows, generate_year_rows, write_jsonl
+
+CHENNAI = City("Chennai", 13.08, 80.27)
+MUMBAI = City("Mumbai", 19.076, 72.8777)
+TOKYO = City("Tokyo", 35.68, 139.69)
+LOS_ANGELES = City("Los Angeles", 34.05, -118.24)
+
+
+class TestGenerateRows:
+    """Test cases for generate_rows and generate_year_rows functions."""
+
+    @pytest.mark.unit
+    def test_rows_have_every_column(self) -> None:
+        """Test that every row carries the sunrise values and end times of each limb."""
+        rows = list(generate_rows(CHENNAI, date(2024, 1, 1), date(2024, 1, 8)))
+
+        assert [row["date"] for row in rows] == [f"2024-01-0{day}" for day in range(1, 8)]
+        for row in rows:
+            assert row["city"] == "Chennai"
+            assert row["sunrise"] < row["sunset"]
+            for limb in ROW_LIMBS:
+                assert row[limb]
+                assert row[f"{limb}_end"] > row["sunrise"]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("city", [TOKYO, LOS_ANGELES])
+    def test_sun_times_fall_on_the_local_date(self, city: City) -> None:
+        """Test that cities far from UTC get the sunrise and sunset of their own local date."""
+        offset = timedelta(hours=city.longitude / 15)
+
+        for row in generate_rows(city, date(2024, 6, 1), date(2024, 6, 3)):
+            sunrise = datetime.fromisoformat(row["sunrise"])
+            sunset = datetime.fromisoformat(row["sunset"])
+
+            assert sunrise < sunset
+            assert (sunrise + offset).date().isoformat() == (sunset + offset).date().isoformat() == row["date"]
+
+    @pytest.mark.unit
+    def test_vaaram_follows_weekdays(self) -> None:
+        """Test that 2024-01-01 is a Monday, ruled by the Moon."""
+        rows = list(generate_rows(CHENNAI, date(2024, 1, 1), date(2024, 1, 3)))
+
+        assert rows[0]["vaaram"] == "MOON"
+        assert rows[1]["vaaram"] == "MARS"
+
+    @pytest.mark.slow
+    def test_year_has_every_day(self) -> None:
+        """Test that a leap year produces 366 rows."""
+        rows = list(generate_year_rows(CHENNAI, 2024))
+
+        assert len(rows) == 366
+        assert rows[-1]["date"] == "2024-12-31"
+
+
+class TestGenerateCalendar:
+    """Test cases for generate_calendar and write_jsonl functions."""
+
+    @pytest.mark.slow
+    def test_calendar_streams_shards_in_order(self, tmp_path: Path) -> None:
+        """Test that shards are streamed city by city and written as JSON Lines."""
+        path = tmp_path / "calendar.jsonl"
+
+        count = write_jsonl(generate_calendar([CHENNAI, MUMBAI], [2024], max_workers=2), path)
+
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert count == len(lines) == 2 * 366
+        assert [line["city"] for line in lines[::366]] == ["Chennai", "Mumbai"]
+
+
+class TestWriteJsonl:
+    """Test cases for write_jsonl function."""
+
+    @pytest.mark.unit
+    def test_write_jsonl_consumes_generator(self, tmp_path: Path) -> None:
+        """Test that rows are written one per line from a lazy iterable."""
+        path = tmp_path / "rows.jsonl"
+
+        count = write_jsonl(({"index": str(i)} for i in range(3)), path)
+
+        assert count == 3
+        assert path.read_text(encoding="utf-8").splitlines() == ['{"index": "0"}', '{"index": "1"}', '{"index": "2"}']
@@ -0,0 +1,90 @@
+"""Unit tests for ndastro_engine.porutham module."""
+
+import numpy as np
+import pytest
+
+from ndastro_engine.enums import Natchaththirams, Poruthams, Rasis
+from ndastro_engine.porutham import REQUIRED_PORUTHAMS, get_porutham_scores, get_poruthams, get_top_matches
+
+
+def _people(count: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the natchaththiram and rasi values of random Moons."""
+    longitudes = np.random.default_rng(seed).uniform(0, 360, count)
+    return (np.floor(longitudes / (360 / 27)) + 1).astype(int), (np.floor(longitudes / 30) + 1).astype(int)
+
+
+class TestGetPoruthams:
+    """Test cases for get_poruthams and get_porutham_scores functions."""
+
+    @pytest.mark.unit
+    def test_known_pair(self) -> None:
+        """Test the poruthams of an Aswini (Aries) bride with a Rohini (Taurus) groom."""
+        mask = int(get_poruthams(Natchaththirams.ASWINNI.value, Rasis.ARIES, Natchaththirams.ROGHINI.value, Rasis.TAURUS))
+
+        agreed = {porutham for porutham in Poruthams if mask & porutham.bit}
+        expected = {Poruthams.DHINAM, Poruthams.GANAM, Poruthams.MAHENDHRAM, Poruthams.YONI}
+        expected |= {Poruthams.RASI_ADHIPATHI, Poruthams.RAJJU, Poruthams.VEDHAI}
+        assert agreed == expected
+
+    @pytest.mark.unit
+    def test_rajju_and_vedhai_fail(self) -> None:
+        """Test that the same rajju and a vedhai pair are detected."""
+        same_rajju = int(get_poruthams(Natchaththirams.ASWINNI.value, Rasis.ARIES, Natchaththirams.MAGAM.value, Rasis.LEO))
+        vedhai = int(get_poruthams(Natchaththirams.ASWINNI.value, Rasis.ARIES, Natchaththirams.KETTAI.value, Rasis.SCORPIO))
+
+        assert not same_rajju & Poruthams.RAJJU.bit
+        assert not vedhai & Poruthams.VEDHAI.bit
+
+    @pytest.mark.unit
+    def test_scores_broadcast(self) -> None:
+        """Test that a column of brides against a row of grooms gives the full score matrix."""
+        bride_stars, bride_rasis = _people(4, 1)
+        groom_stars, groom_rasis = _people(6, 2)
+
+        scores = get_porutham_scores(bride_stars[:, None], bride_rasis[:, None], groom_stars, groom_rasis)
+
+        assert scores.shape == (4, 6)
+        assert scores[2, 3] == int(get_poruthams(bride_stars[2], bride_rasis[2], groom_stars[3], groom_rasis[3])).bit_count()
+        assert ((scores >= 0) & (scores <= 10)).all()
+
+
+class TestGetTopMatches:
+    """Test cases for get_top_matches function."""
+
+    @staticmethod
+    def _full_ranking(bride_people: tuple[np.ndarray, np.ndarray], groom_people: tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        """Return the score matrix with matches missing a required porutham set to -1."""
+        masks = get_poruthams(bride_people[0][:, None], bride_people[1][:, None], groom_people[0], groom_people[1])
+        required = sum(porutham.bit for porutham in REQUIRED_PORUTHAMS)
+        scores = get_porutham_scores(bride_people[0][:, None], bride_people[1][:, None], groom_people[0], groom_people[1]).astype(int)
+        scores[(masks & required) != required] = -1
+        return scores
+
+    @pytest.mark.unit
+    def test_matches_full_matrix_ranking(self) -> None:
+        """Test that the top-k per bride equals ranking the full matrix by score, then position."""
+        brides, grooms = _people(200, 3), _people(300, 4)
+        full = self._full_ranking(brides, grooms)
+
+        result = get_top_matches(*brides, *grooms, 8)
+
+        for bride in range(200):
+            expected = np.lexsort((np.arange(300), -full[bride]))[:8]
+            expected = expected[full[bride, expected] >= 0]
+            assert result.matches[bride, : len(expected)].tolist() == expected.tolist()
+            assert result.scores[bride, : len(expected)].tolist() == full[bride, expected].tolist()
+
+    @pytest.mark.unit
+    def test_per_groom_and_padding(self) -> None:
+        """Test ranking brides for every groom and padding when fewer matches exist than k."""
+        brides, grooms = _people(5, 5), _people(40, 6)
+        full = self._full_ranking(brides, grooms)
+
+        result = get_top_matches(*brides, *grooms, 10, per_groom=True)
+
+        assert result.matches.shape == (40, 10)
+        for groom in range(40):
+            expected = np.lexsort((np.arange(5), -full[:, groom]))
+            expected = expected[full[expected, groom] >= 0]
+            assert result.matches[groom, : len(expected)].tolist() == expected.tolist()
+            assert (result.matches[groom, len(expected) :] == -1).all()
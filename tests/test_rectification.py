@@ -0,0 +1,60 @@
+"""Tests for birth-time rectification sweeps in ndastro engine."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+import pytz
+
+from ndastro_engine.ayanamsa import get_lahiri_ayanamsa
+from ndastro_engine.core import get_ascendent_position, get_planet_position
+from ndastro_engine.enums import Planets, Vargas
+from ndastro_engine.rectification import get_rectification_sweep
+from ndastro_engine.varga import get_varga_rasi
+
+BIRTH = datetime(1990, 6, 15, 5, 30, tzinfo=pytz.UTC)
+
+
+class TestGetRectificationSweep:
+    """Test cases for get_rectification_sweep function."""
+
+    @pytest.mark.unit
+    def test_grid_is_centred_on_the_reported_time(self) -> None:
+        """Test that the candidates span the window on both sides of the reported time."""
+        sweep = get_rectification_sweep(BIRTH, 12.97, 77.59, timedelta(minutes=30), timedelta(minutes=1))
+
+        assert len(sweep.times) == 61
+        assert sweep.times[30] == np.datetime64("1990-06-15T05:30:00")
+        assert sweep.times[0] == np.datetime64("1990-06-15T05:00:00")
+        assert sweep.times[-1] == np.datetime64("1990-06-15T06:00:00")
+        assert sweep.lagnas.shape == (2, 61)
+
+    @pytest.mark.unit
+    def test_candidates_match_single_charts(self) -> None:
+        """Test that every candidate matches the scalar ascendant, Moon and varga functions."""
+        sweep = get_rectification_sweep(BIRTH, 12.97, 77.59, timedelta(hours=1), timedelta(minutes=20), vargas=(Vargas.NAVAMSA, Vargas.DASAMSA))
+
+        for index, offset in enumerate(range(-60, 61, 20)):
+            when = BIRTH + timedelta(minutes=offset)
+            ayanamsa = get_lahiri_ayanamsa(when)
+            ascendant = (get_ascendent_position(12.97, 77.59, when) - ayanamsa) % 360
+            moon = (get_planet_position(Planets.MOON, 12.97, 77.59, when).longitude - ayanamsa) % 360
+
+            assert sweep.ascendant[index] == pytest.approx(ascendant, abs=1e-3)
+            assert sweep.moon[index] == pytest.approx(moon, abs=1e-3)
+            assert sweep.natchaththiram[index] == int(moon // (360 / 27)) + 1
+            assert sweep.pada[index] == int(moon % (360 / 27) // (360 / 108)) + 1
+            assert sweep.lagnas[1, index] == get_varga_rasi(ascendant, Vargas.DASAMSA)
+
+    @pytest.mark.unit
+    def test_zero_window_gives_the_reported_time(self) -> None:
+        """Test that an empty window gives the reported time only."""
+        sweep = get_rectification_sweep(BIRTH, 12.97, 77.59, timedelta(0), timedelta(minutes=1))
+
+        assert len(sweep.times) == 1
+
+    @pytest.mark.unit
+    def test_invalid_step_is_rejected(self) -> None:
+        """Test that a non-positive step raises ValueError."""
+        with pytest.raises(ValueError, match="positive step"):
+            get_rectification_sweep(BIRTH, 12.97, 77.59, timedelta(minutes=30), timedelta(0))
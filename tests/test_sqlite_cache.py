@@ -0,0 +1,103 @@
+"""Tests for the SQLite chart cache in ndastro engine."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+import pytz
+
+from ndastro_engine.ayanamsa import get_lahiri_ayanamsa
+from ndastro_engine.core import get_planets_position
+from ndastro_engine.models import PlanetPosition
+from ndastro_engine.sqlite_cache import CHART_PLANETS, CachedChart, SqliteChartCache, main
+
+START = datetime(2024, 3, 1, tzinfo=pytz.UTC)
+
+
+class TestSqliteChartCache:
+    """Test cases for SqliteChartCache class."""
+
+    @pytest.mark.unit
+    def test_charts_match_direct_computation(self, tmp_path: Path) -> None:
+        """Test that stored charts hold the positions and ayanamsa of the quantised time."""
+        cache = SqliteChartCache(tmp_path / "charts.db")
+        (chart,) = cache.get_charts([(12.97, 77.59, START + timedelta(milliseconds=200))])
+
+        assert chart.positions == get_planets_position(list(CHART_PLANETS), 12.97, 77.59, START)
+        assert chart.ayanamsa == get_lahiri_ayanamsa(START)
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    @pytest.mark.unit
+    def test_charts_are_shared_between_instances(self, tmp_path: Path) -> None:
+        """Test that a second instance on the same file finds the charts stored by the first."""
+        requests = [(12.97, 77.59, START + timedelta(hours=hour)) for hour in range(5)]
+        stored = SqliteChartCache(tmp_path / "charts.db").get_charts(requests)
+        other = SqliteChartCache(tmp_path / "charts.db")
+
+        assert other.get_charts(requests) == stored
+        assert (other.hits, other.misses) == (5, 0)
+
+    @pytest.mark.unit
+    def test_engine_version_and_ayanamsa_are_part_of_the_key(self, tmp_path: Path) -> None:
+        """Test that charts of another engine version or ayanamsa system are not returned."""
+        cache = SqliteChartCache(tmp_path / "charts.db", engine_version="1.0.0")
+        cache.get_charts([(12.97, 77.59, START)])
+        upgraded = SqliteChartCache(tmp_path / "charts.db", engine_version="1.1.0")
+
+        assert upgraded.get_many([upgraded.key(12.97, 77.59, START)]) == [None]
+        assert cache.get_many([cache.key(12.97, 77.59, START, "raman")]) == [None]
+
+    @pytest.mark.unit
+    def test_eviction_by_size_and_ttl(self, tmp_path: Path) -> None:
+        """Test that the oldest charts beyond max_entries are evicted and expired charts are ignored."""
+        cache = SqliteChartCache(tmp_path / "charts.db", max_entries=10)
+        cache.warm_up(12.97, 77.59, START, START + timedelta(hours=23), timedelta(hours=1))
+
+        assert cache.get_many([cache.key(12.97, 77.59, START + timedelta(hours=hour)) for hour in range(24)]).count(None) == 14
+        assert SqliteChartCache(tmp_path / "charts.db", ttl=timedelta(0)).get_many([cache.key(12.97, 77.59, START + timedelta(hours=23))]) == [None]
+
+    @pytest.mark.unit
+    def test_naive_time_is_rejected(self, tmp_path: Path) -> None:
+        """Test that a naive time raises ValueError instead of being read as local time."""
+        cache = SqliteChartCache(tmp_path / "charts.db")
+
+        with pytest.raises(ValueError, match="timezone-aware"):
+            cache.key(12.97, 77.59, START.replace(tzinfo=None))
+
+    @pytest.mark.unit
+    def test_rows_are_counted_only_when_the_bound_may_be_exceeded(self, tmp_path: Path) -> None:
+        """Test that writes within max_entries do not count the stored charts."""
+        cache = SqliteChartCache(tmp_path / "charts.db", max_entries=3)
+        chart = CachedChart(0.0, {planet: PlanetPosition(*[0.0] * len(PlanetPosition._fields)) for planet in CHART_PLANETS})
+        keys = [cache.key(12.97, 77.59, START + timedelta(hours=hour)) for hour in range(4)]
+        statements: list[str] = []
+        cache._connect().set_trace_callback(statements.append)  # noqa: SLF001
+
+        for key in keys[:3]:
+            cache.put_many([(key, chart)])
+        assert not any("COUNT" in statement for statement in statements)
+
+        cache.put_many([(keys[3], chart)])
+        assert any("COUNT" in statement for statement in statements)
+        assert cache.get_many(keys).count(None) == 1
+
+    @pytest.mark.unit
+    def test_warm_up_command(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that the command line warm-up stores the charts of the date range once."""
+        arguments = [
+            str(tmp_path / "charts.db"),
+            "--lat",
+            "12.97",
+            "--lon",
+            "77.59",
+            "--start",
+            "2024-03-01",
+            "--end",
+            "2024-03-02",
+            "--step-minutes",
+            "120",
+        ]
+        main(arguments)
+        main(arguments)
+
+        assert capsys.readouterr().out.splitlines() == ["13 charts computed", "0 charts computed"]
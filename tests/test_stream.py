@@ -0,0 +1,62 @@
+"""Tests for the streaming ephemeris generator in ndastro engine."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+import pytz
+
+from ndastro_engine.core import get_planets_position
+from ndastro_engine.enums import Planets
+from ndastro_engine.stream import stream_ephemeris_chunks, stream_ephemeris_rows
+
+START = datetime(2024, 3, 1, tzinfo=pytz.UTC)
+END = START + timedelta(hours=10)
+
+
+class TestStreamEphemerisChunks:
+    """Test cases for stream_ephemeris_chunks function."""
+
+    @pytest.mark.unit
+    def test_chunks_cover_the_grid(self) -> None:
+        """Test that the chunks hold every instant of the grid once, at most chunk_size at a time."""
+        chunks = list(stream_ephemeris_chunks(START, END, timedelta(hours=1), 12.97, 77.59, planets=[Planets.SUN, Planets.MOON], chunk_size=4))
+
+        assert [len(chunk.times) for chunk in chunks] == [4, 4, 3]
+        assert [chunk.positions.shape for chunk in chunks] == [(4, 2, 6), (4, 2, 6), (3, 2, 6)]
+        assert chunks[-1].times[-1] == np.datetime64("2024-03-01T10:00:00.000")
+
+    @pytest.mark.unit
+    def test_resume_continues_after_the_checkpoint(self) -> None:
+        """Test that resuming from the last time of a chunk yields the remaining chunks unchanged."""
+        chunks = list(stream_ephemeris_chunks(START, END, timedelta(hours=1), 12.97, 77.59, planets=[Planets.MARS], chunk_size=4))
+        checkpoint = START + timedelta(hours=3, minutes=30)
+
+        resumed = list(
+            stream_ephemeris_chunks(START, END, timedelta(hours=1), 12.97, 77.59, planets=[Planets.MARS], chunk_size=4, resume_after=checkpoint)
+        )
+
+        assert resumed[0].times[0] == chunks[1].times[0]
+        assert np.array_equal(np.concatenate([chunk.positions for chunk in resumed]), np.concatenate([chunk.positions for chunk in chunks])[4:])
+
+    @pytest.mark.unit
+    def test_invalid_step_is_rejected(self) -> None:
+        """Test that a step of zero raises ValueError."""
+        with pytest.raises(ValueError, match="positive step"):
+            next(stream_ephemeris_chunks(START, END, timedelta(0), 12.97, 77.59))
+
+
+class TestStreamEphemerisRows:
+    """Test cases for stream_ephemeris_rows function."""
+
+    @pytest.mark.unit
+    def test_rows_match_direct_computation(self) -> None:
+        """Test that every row holds the positions of get_planets_position at its time."""
+        rows = list(stream_ephemeris_rows(START, END, timedelta(hours=2), 12.97, 77.59, chunk_size=2))
+
+        assert [row.time for row in rows] == [START + timedelta(hours=hour) for hour in range(0, 11, 2)]
+        for row in rows:
+            expected = get_planets_position([], 12.97, 77.59, row.time)
+            assert list(row.positions) == list(expected)
+            for planet, position in row.positions.items():
+                assert tuple(position) == pytest.approx(tuple(expected[planet]))
@@ -0,0 +1,135 @@
+"""Unit tests for ndastro_engine.transit module."""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+import pytz
+
+from ndastro_engine.enums import Granularity, Planets, Rasis
+from ndastro_engine.ingress_index import IngressIndex
+from ndastro_engine.models import Ingress, PlanetPosition
+from ndastro_engine.transit import (
+    DEFAULT_TRANSIT_RULES,
+    TransitRule,
+    build_natal_store,
+    get_major_transit_windows,
+    get_natal_rasis_hit,
+    get_transit_hits,
+    get_transit_windows,
+)
+
+AYANAMSA = 24.0
+
+
+def _position(sidereal_longitude: float) -> PlanetPosition:
+    """Return a tropical position for the given sidereal longitude."""
+    return PlanetPosition(0.0, sidereal_longitude + AYANAMSA, 1.0, 0.0, 0.0, 0.0)
+
+
+class TestBuildNatalStore:
+    """Test cases for build_natal_store function."""
+
+    @pytest.mark.unit
+    def test_rasis_are_precomputed(self) -> None:
+        """Test that natal rasis use the Rasis numbering."""
+        store = build_natal_store([10, 11], [Planets.MOON, Planets.SUN], [[0.0, 359.5], [95.0, -10.0]])
+
+        assert store.rasis.tolist() == [[Rasis.ARIES, Rasis.PISCES], [Rasis.CANCER, Rasis.PISCES]]
+        assert store.longitudes[1, 1] == pytest.approx(350.0)
+
+    @pytest.mark.unit
+    def test_shape_mismatch_raises(self) -> None:
+        """Test that longitudes must have one row per user and one column per planet."""
+        with pytest.raises(ValueError, match="Expected longitudes of shape"):
+            build_natal_store([1, 2, 3], [Planets.MOON], [[0.0], [1.0]])
+
+
+class TestGetTransitHits:
+    """Test cases for get_transit_hits function."""
+
+    @pytest.mark.unit
+    def test_default_rules_match_a_scan(self) -> None:
+        """Test that the sparse hits equal a per-user scan of the houses."""
+        rng = np.random.default_rng(3)
+        moons = rng.uniform(0, 360, 5000)
+        store = build_natal_store(np.arange(5000) + 100, [Planets.MOON], moons[:, None])
+        snapshot = {Planets.MOON: _position(200.0), Planets.SATURN: _position(335.0), Planets.JUPITER: _position(70.0), Planets.RAHU: _position(1.0)}
+
+        hits = get_transit_hits(snapshot, AYANAMSA, store)
+
+        natal_rasis = np.floor(moons / 30).astype(int)
+        saturn_houses = (11 - natal_rasis) % 12 + 1
+        assert hits["chandrashtama"].tolist() == (np.flatnonzero((6 - natal_rasis) % 12 + 1 == 8) + 100).tolist()
+        assert hits["sade_sati"].tolist() == (np.flatnonzero(np.isin(saturn_houses, [12, 1, 2])) + 100).tolist()
+        assert hits["ashtama_shani"].tolist() == (np.flatnonzero(saturn_houses == 8) + 100).tolist()
+
+    @pytest.mark.unit
+    def test_orb_limits_hits(self) -> None:
+        """Test that an orb keeps only the natal planets close to the transiting one."""
+        store = build_natal_store([1, 2, 3], [Planets.MOON, Planets.SUN], [[0.0, 3.0], [0.0, 29.0], [0.0, 359.0]])
+        rule = TransitRule("saturn_conjunct_sun", Planets.SATURN, Planets.SUN, (1, 2), orb=5.0)
+
+        hits = get_transit_hits({Planets.SATURN: _position(1.0)}, AYANAMSA, store, [rule])
+
+        assert hits["saturn_conjunct_sun"].tolist() == [1, 3]
+
+
+class TestGetNatalRasisHit:
+    """Test cases for get_natal_rasis_hit function."""
+
+    @pytest.mark.unit
+    def test_houses_counted_from_natal_rasi(self) -> None:
+        """Test that Saturn in Pisces gives Sade Sati to Aquarius, Pisces and Aries Moons."""
+        assert get_natal_rasis_hit(335.0, [12, 1, 2]) == [Rasis.ARIES, Rasis.AQUARIUS, Rasis.PISCES]
+        assert get_natal_rasis_hit(335.0, [8]) == [Rasis.LEO]
+
+
+class TestGetTransitWindows:
+    """Test cases for get_transit_windows and get_major_transit_windows functions."""
+
+    @staticmethod
+    def _index() -> IngressIndex:
+        """Return an index with Saturn moving from Aquarius to Taurus with one retrogression, and Jupiter in Pisces."""
+        index = IngressIndex(datetime(2020, 1, 1, tzinfo=pytz.UTC), datetime(2030, 1, 1, tzinfo=pytz.UTC))
+        moves = [(2023, 11, 11, 12), (2024, 6, 12, 11), (2024, 9, 11, 12), (2026, 6, 12, 1), (2028, 6, 1, 2)]
+        ingresses = [
+            Ingress(datetime(year, month, 1, tzinfo=pytz.UTC), Planets.SATURN, Granularity.RASI, old, new, (new - old) % 12 != 1)
+            for year, month, old, new in moves
+        ]
+        index.add(Planets.SATURN, Granularity.RASI, 11, ingresses)
+        index.add(Planets.JUPITER, Granularity.RASI, 12, [])
+
+        return index
+
+    @pytest.mark.unit
+    def test_sade_sati_merges_consecutive_houses(self) -> None:
+        """Test that Saturn through the 12th, 1st and 2nd from Pisces is one window despite retrogression."""
+        rule = next(rule for rule in DEFAULT_TRANSIT_RULES if rule.name == "sade_sati")
+
+        windows = get_transit_windows(self._index(), rule, [Rasis.PISCES, Rasis.LEO, Rasis.ARIES])
+
+        assert windows.person.tolist() == [0, 2, 2]
+        assert windows.start.astype(str).tolist() == ["2020-01-01T00:00:00", "2023-11-01T00:00:00", "2024-09-01T00:00:00"]
+        assert windows.end.astype(str).tolist() == ["2028-06-01T00:00:00", "2024-06-01T00:00:00", "2030-01-01T00:00:00"]
+
+    @pytest.mark.unit
+    def test_major_windows_are_clipped_to_range(self) -> None:
+        """Test that the windows of every major rule are clipped to the requested range."""
+        windows = get_major_transit_windows(
+            self._index(), [Rasis.VIRGO], datetime(2025, 1, 1, tzinfo=pytz.UTC), datetime(2027, 1, 1, tzinfo=pytz.UTC)
+        )
+
+        assert windows["ashtama_shani"].start.astype(str).tolist() == ["2026-06-01T00:00:00"]
+        assert windows["ashtama_shani"].end.astype(str).tolist() == ["2027-01-01T00:00:00"]
+        assert windows["sade_sati"].person.tolist() == []
+        assert windows["jupiter_favourable"].person.tolist() == [0]
+
+    @pytest.mark.unit
+    def test_invalid_requests_raise(self) -> None:
+        """Test that rules with an orb and ranges outside the index are rejected."""
+        rule = TransitRule("saturn_conjunct_moon", Planets.SATURN, Planets.MOON, (1,), orb=3.0)
+        with pytest.raises(ValueError, match="do not support the orb"):
+            get_transit_windows(self._index(), rule, [Rasis.ARIES])
+        with pytest.raises(ValueError, match="outside the span"):
+            get_major_transit_windows(self._index(), [Rasis.ARIES], datetime(2019, 1, 1, tzinfo=pytz.UTC))
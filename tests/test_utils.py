@@ -1,13 +1,16 @@
 """Unit tests for ndastro_engine.utils module."""
 
 import sys
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pytest
+import pytz
 
 from ndastro_engine.constants import OS_LINUX, OS_MAC, OS_WIN
-from ndastro_engine.utils import get_app_data_dir, normalize_degree
+from ndastro_engine.utils import get_app_data_dir, normalize_degree, to_epoch_seconds
 
 
 class TestGetAppDataDir:
@@ -197,3 +200,16 @@ class TestNormalizeDegree:
             first = normalize_degree(value)
             second = normalize_degree(first)
             assert first == second
+
+
+class TestToEpochSeconds:
+    """Test cases for to_epoch_seconds function."""
+
+    @pytest.mark.unit
+    def test_datetimes_and_datetime64_agree(self) -> None:
+        """Test that aware datetimes and UTC datetime64 values give the same seconds."""
+        times = [datetime(1970, 1, 1, tzinfo=pytz.UTC), datetime(2000, 1, 1, 12, 0, 0, 500000, tzinfo=pytz.UTC)]
+        stamps = np.array(["1970-01-01T00:00:00", "2000-01-01T12:00:00.5"], dtype="datetime64[ms]")
+
+        assert to_epoch_seconds(times).tolist() == [0.0, 946728000.5]
+        assert to_epoch_seconds(stamps).tolist() == [0.0, 946728000.5]
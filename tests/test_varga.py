@@ -0,0 +1,71 @@
+"""Unit tests for ndastro_engine.varga module."""
+
+import numpy as np
+import pytest
+
+from ndastro_engine.enums import Granularity, Rasis, Vargas
+from ndastro_engine.varga import get_varga_rasi, get_varga_rasis
+
+
+class TestGetVargaRasi:
+    """Test cases for get_varga_rasi function."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("longitude", "varga", "expected"),
+        [
+            (0.0, Vargas.HORA, Rasis.LEO),
+            (20.0, Vargas.HORA, Rasis.CANCER),
+            (37.0, Vargas.HORA, Rasis.CANCER),
+            (45.0, Vargas.DREKKANA, Rasis.VIRGO),
+            (100.0, Vargas.NAVAMSA, Rasis.LIBRA),
+            (31.0, Vargas.SAPTAMSA, Rasis.SCORPIO),
+            (30.0, Vargas.DASAMSA, Rasis.CAPRICORN),
+            (59.0, Vargas.DWADASAMSA, Rasis.ARIES),
+            (30.0, Vargas.SHODASAMSA, Rasis.LEO),
+            (30.0, Vargas.VIMSAMSA, Rasis.SAGITTARIUS),
+            (30.0, Vargas.CHATURVIMSAMSA, Rasis.CANCER),
+            (30.0, Vargas.SAPTAVIMSAMSA, Rasis.CANCER),
+            (12.0, Vargas.TRIMSAMSA, Rasis.SAGITTARIUS),
+            (37.0, Vargas.TRIMSAMSA, Rasis.VIRGO),
+            (30.0, Vargas.KHAVEDAMSA, Rasis.LIBRA),
+            (60.0, Vargas.AKSHAVEDAMSA, Rasis.SAGITTARIUS),
+            (29.75, Vargas.SHASHTIAMSA, Rasis.PISCES),
+        ],
+    )
+    def test_known_varga_rasis(self, longitude: float, varga: Vargas, expected: Rasis) -> None:
+        """Test the rasi of a longitude in each kind of varga."""
+        assert get_varga_rasi(longitude, varga) == expected
+
+    @pytest.mark.unit
+    def test_longitude_is_normalized(self) -> None:
+        """Test that longitudes outside 0-360 wrap around."""
+        assert get_varga_rasi(-0.5, Vargas.RASI) == Rasis.PISCES
+        assert get_varga_rasi(400.0, Vargas.NAVAMSA) == get_varga_rasi(40.0, Vargas.NAVAMSA)
+
+
+class TestGetVargaRasis:
+    """Test cases for get_varga_rasis function."""
+
+    @pytest.mark.unit
+    def test_shape_and_scalar_agreement(self) -> None:
+        """Test that the array result has one leading axis per varga and matches the scalar form."""
+        longitudes = np.random.default_rng(7).uniform(0, 360, size=(5, 9))
+        vargas = list(Vargas)
+
+        rasis = get_varga_rasis(longitudes, vargas)
+
+        assert rasis.shape == (len(vargas), 5, 9)
+        for row, varga in enumerate(vargas):
+            assert rasis[row, 2, 4] == get_varga_rasi(float(longitudes[2, 4]), varga)
+
+    @pytest.mark.unit
+    def test_rasi_and_navamsa_match_granularity(self) -> None:
+        """Test that D1 and D9 agree with the rasi and navamsa granularities."""
+        longitudes = np.linspace(0, 359.99, 1000)
+
+        rasis = get_varga_rasis(longitudes, [Vargas.RASI, Vargas.NAVAMSA])
+
+        for granularity, row in ((Granularity.RASI, rasis[0]), (Granularity.NAVAMSA, rasis[1])):
+            segments = np.floor(longitudes / granularity.span).astype(int)
+            assert row.tolist() == [granularity.number(segment) for segment in segments]